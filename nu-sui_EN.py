@@ -1,11 +1,19 @@
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from types import MappingProxyType
+import functools
+import itertools
+import queue
+import threading
+import traceback
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import numpy as np
-import matplotlib
 
 # Application Constants
 APP_TITLE = "Ñu-sui: learn how to use your bike gears"
@@ -25,9 +33,13 @@ MAX_TEETH = 53
 PADDING = 10
 LARGE_PADDING = 20
 CHART_SIZE = (10, 6)
+CHART_DPI = 72
+DRAW_POLL_INTERVAL_MS = 33
+CADENCE_DEBOUNCE_MS = 50
+CHAINRING_COLORS = ("red", "blue", "green")  # From the largest chainring to the third, the rest in gray
 
 # General configuration for charts
-matplotlib.rcParams.update({'font.size': DEFAULT_FONT_SIZE})
+matplotlib.rcParams.update({'font.size': DEFAULT_FONT_SIZE, 'figure.dpi': CHART_DPI})
 
 # Dictionary to store wheel sizes and their corresponding circumference in meters
 wheel_sizes = {
@@ -109,8 +121,223 @@ wheel_sizes = {
     "29x2.3": 2.326
 }
 
+# Wheel names and circumferences as parallel read-only sequences for vectorized lookups
+_WHEEL_KEYS = tuple(wheel_sizes.keys())
+_WHEEL_CIRC = np.fromiter(wheel_sizes.values(), dtype=np.float64, count=len(wheel_sizes))
+_WHEEL_IDX = {name: i for i, name in enumerate(_WHEEL_KEYS)}
+wheel_sizes = MappingProxyType(wheel_sizes)
+
+# Default wheel size and combobox values for each bike type
+_WHEEL_OPTIONS = {
+    "mtb": ("26x2.1", ("26x2.1", "26x2.35", "27.5x2.10", "27.5x2.25", "29x2.1", "29x2.25", "29x2.3")),
+    "road": ("700x25C", ("700x23C", "700x25C", "700x28C", "700C")),
+    "urban": ("700x35C", ("700x35C", "700x38C", "700x40C", "26x1.75")),
+    "custom": ("700C", _WHEEL_KEYS)
+}
+
+@functools.lru_cache(maxsize=256)
+def _cached_grid(chain_key: bytes, spr_key: bytes, wheel_idx: int, cadence: int) -> np.ndarray:
+    """
+    Speeds in km/h for every chainring/sprocket combination (rows = chainrings)
+    
+    The teeth arrive as the bytes of np.int32 arrays so the arguments can be hashed.
+    The result is shared between calls and therefore read-only.
+    """
+    chainrings = np.frombuffer(chain_key, dtype=np.int32).astype(np.float64)
+    sprockets = np.frombuffer(spr_key, dtype=np.int32).astype(np.float64)
+    grid = chainrings[:, None] / sprockets[None, :] * (_WHEEL_CIRC[wheel_idx] * cadence * 60 / 1000)
+    grid.flags.writeable = False
+    return grid
+
+# Legend entries that do not depend on the configuration
+_OPTIMAL_RANGE_HANDLE = Line2D([0], [0], color='gray', linestyle='--', label='Optimal range (2.5-5.0)')
+_CROSSING_HANDLES = (
+    Line2D([0], [0], marker='o', color='gray', linestyle='None', label='Safe combination'),
+    Line2D([0], [0], marker='x', color='gray', linestyle='None', label='Chain crossing')
+)
+
+# Static explanations of the technical tabs, inserted as they are in their text boxes
+_RATIO_EXPLANATION = """
+        The gear ratio is the number of teeth on the chainring divided by the number of teeth on the sprocket. 
+        A higher value indicates a "harder" gear (for speed), while a lower value indicates a "lighter" gear (for climbing).
+        
+        In general:
+        • Values > 5.0: Very hard gears for descents or speed
+        • Values 2.5-5.0: Optimal range for normal use
+        • Values < 2.5: Light gears for climbing
+        
+        The total range of ratios on your bicycle directly affects its versatility.
+        """
+
+_POWER_EXPLANATION = """
+        This chart shows the relationship between cadence, speed, and estimated power for a specific chainring/sprocket combination.
+        
+        The power is an estimate based on a simplified model, considering the aerodynamic resistance that increases exponentially with speed.
+        
+        Key observations:
+        • For the same gear, increasing cadence linearly increases speed
+        • Power required increases exponentially with speed
+        • The optimal cadence is usually between 80-90 RPM for most cyclists
+        • At very low cadences (<60 RPM) you strain your joints more, while very high cadences (>100 RPM) are less energy efficient
+        """
+
+# Texts of the concepts and help windows
+_CONCEPTS_TEXT = """
+        TRANSMISSION AND GEARS
+        
+        Chainrings (or crowns): These are the toothed discs attached to the pedals. They determine how much force is transmitted to the chain.
+        - Large chainrings (more teeth): Higher speed, require more force
+        - Small chainrings (fewer teeth): Lower speed, easier pedaling
+        
+        Sprockets (or cassette): Set of toothed discs on the rear wheel.
+        - Small sprockets (fewer teeth): Higher speed, require more force
+        - Large sprockets (more teeth): Lower speed, easier pedaling
+        
+        Gear ratio: Number of teeth on the chainring divided by the number of teeth on the sprocket. Indicates how many turns the wheel makes for each complete revolution of the pedals.
+        
+        Development: Distance traveled for each complete pedal stroke. It is calculated by multiplying the gear ratio by the wheel circumference.
+        
+        PEDALING CONCEPTS
+        
+        Cadence: The speed at which you pedal, measured in revolutions per minute (RPM).
+        - Low cadence (<70 RPM): Greater effort on each pedal stroke, more tension on joints
+        - Medium cadence (70-90 RPM): Optimal balance for most cyclists
+        - High cadence (>90 RPM): Less effort per pedal stroke, higher heart rate
+        
+        CHAIN CROSSING
+        
+        Chain crossing occurs when using extreme combinations:
+        - Large chainring (front) with large sprocket (rear)
+        - Small chainring (front) with small sprocket (rear)
+        
+        These combinations cause the chain to work at a pronounced diagonal angle, causing:
+        - Increased wear on the chain, chainrings, sprockets, and derailleur
+        - Loss of efficiency (you waste energy when pedaling)
+        - More noise during pedaling
+        - Risk of the chain coming off or getting damaged
+        
+        That's why, in this application, these combinations are marked or filtered.
+        The golden rule is: use combinations where the chain works as straight as possible.
+        
+        PROPER USE OF GEARS
+        
+        Basic principles:
+        1. Maintain a constant and comfortable cadence by adjusting gears
+        2. Anticipate terrain changes and shift before you need to
+        3. Avoid extreme combinations (chain crossing)
+        4. Shift sequentially, don't skip many gears at once
+        
+        Specific situations:
+        - Climbs: Use small chainrings and large sprockets to pedal with less effort
+        - Descents: Use large chainrings and small sprockets or stop pedaling if speed is high
+        - Flat terrain: Find a combination that allows you to maintain your ideal cadence
+        """
+
+_HELP_TEXT = """
+        QUICK USAGE GUIDE
+        
+        1. CONFIGURING YOUR BICYCLE (Tab "My Bicycle")
+           - Select the bicycle type most similar to yours
+           - Adjust the wheel size accordingly
+           - Set your usual cadence (if you're not sure, leave the default value)
+           - If you know exactly the configuration of your bicycle, use "Configure manually"
+           - Press "Visualize my bicycle" to continue
+        
+        2. VISUALIZATION (Tab "Visualization")
+           - Explore the "Gear table" to see what speed you'll reach with each combination
+           - Review the "Speed chart" to understand how each sprocket affects your speed
+           - Observe the "Development" to understand the distance traveled per pedal stroke
+        
+        3. RECOMMENDATIONS (Tab "Which Gear to Use?")
+           - Set your desired speed and the slope of the terrain
+           - Get a personalized recommendation of which gear to use
+           - Read the specific tips for your situation
+        
+        4. TECHNICAL ANALYSIS (Only in technical mode)
+           - Explore advanced analyses such as gear ratio, power, and overlap
+           - Useful for experienced cyclists who want to optimize their technique
+        
+        MODE CHANGE
+        
+        - Beginner Mode: Simplified interface with basic concepts
+        - Technical/Sport Mode: Access to advanced analyses and technical terms
+        
+        GENERAL TIPS
+        
+        - Experiment with different configurations to better understand how gears work
+        - Use the recommendations tab before going for a ride to plan which gears to use
+        - Consult the help or basic concepts if any term is unfamiliar to you
+        """
+
+def _no_debug(*args, **kwargs) -> None:
+    """Debug output sink used while the debug mode is off"""
+
+def _crossing_table(num_chainrings: int, num_sprockets: int,
+                    dbg: Callable[..., None] = _no_debug) -> np.ndarray:
+    """
+    Chain crossing rules for a drivetrain with the given number of chainrings and sprockets
+    
+    Returns the mask (True where the chainring/sprocket combination crosses the chain). It
+    only depends on the sizes, not on the teeth, so it can be evaluated for any hypothetical
+    configuration.
+    """
+    mask = np.zeros((num_chainrings, num_sprockets), dtype=bool)
+    
+    # If there is only one chainring, no crossing is possible
+    if num_chainrings <= 1:
+        return mask
+        
+    # Adjust chain crossing logic according to the number of chainrings and sprockets
+    if num_chainrings == 2:  # Double chainring
+        # For double chainring, consider 35% of sprockets as extremes
+        extreme_count = max(2, round(num_sprockets * 0.35))
+        
+        # Debug info
+        dbg(f"Double chainring: extreme_count={extreme_count}")
+        
+        # Large chainring with large sprockets, small chainring with small sprockets
+        mask[0, max(0, num_sprockets - extreme_count):] = True
+        mask[-1, :extreme_count] = True
+            
+    elif num_chainrings == 3:  # Triple chainring
+        # More restrictive with triples: 40% of sprockets are extremes
+        extreme_count_large = max(2, round(num_sprockets * 0.4))
+        extreme_count_small = max(2, round(num_sprockets * 0.4))
+        
+        medium_extreme_large = max(1, round(num_sprockets * 0.15))
+        medium_extreme_small = max(1, round(num_sprockets * 0.15))
+        
+        # Debug info
+        dbg(f"Triple chainring: extreme_count_large={extreme_count_large}, "
+            f"extreme_count_small={extreme_count_small}, "
+            f"medium_extreme_large={medium_extreme_large}, "
+            f"medium_extreme_small={medium_extreme_small}")
+        
+        # Large chainring with large sprockets, small chainring with small sprockets
+        mask[0, max(0, num_sprockets - extreme_count_large):] = True
+        mask[-1, :extreme_count_small] = True
+        
+        # For the middle chainring, there are also restrictions but less severe
+        mask[1, max(0, num_sprockets - medium_extreme_large):] = True
+        mask[1, :medium_extreme_small] = True
+    
+    # For other cases (unusual number of chainrings), use a general rule
+    else:
+        # General rule: 30% of sprockets at each end
+        extreme_count = max(1, round(num_sprockets * 0.3))
+        
+        mask[0, max(0, num_sprockets - extreme_count):] = True
+        mask[-1, :extreme_count] = True
+        
+        # Only the extremes for intermediate chainrings
+        mask[1:-1, 0] = True
+        mask[1:-1, num_sprockets - 1:] = True
+    
+    return mask
+
 def handle_errors(func):
     """Decorator for handling errors in GUI methods"""
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
@@ -122,13 +349,73 @@ def handle_errors(func):
             return None
     return wrapper
 
-@dataclass
+def holding_draw_lock(func):
+    """Decorator for methods that change chart figures the drawing thread may be rendering"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self._draw_lock:
+            return func(self, *args, **kwargs)
+    return wrapper
+
+def _chainring_color(index: int) -> str:
+    """Chart color of the chainring at position index (0 = the largest)"""
+    return CHAINRING_COLORS[index] if index < len(CHAINRING_COLORS) else "gray"
+
+def _teeth(*teeth: int) -> np.ndarray:
+    """Read-only int32 array with the given teeth, sorted from smallest to largest"""
+    array = np.sort(np.array(teeth, dtype=np.int32))
+    array.flags.writeable = False
+    return array
+
+def _parse_teeth(text: str) -> np.ndarray:
+    """Parse comma-separated teeth into an int32 array sorted from smallest to largest"""
+    teeth = [int(field) for field in text.split(',') if field.strip()]
+    # Check the range before narrowing to int32, larger values would wrap around
+    out_of_range = [value for value in teeth if not MIN_TEETH <= value <= MAX_TEETH]
+    if out_of_range:
+        raise ValueError(f"Teeth value out of range: {', '.join(map(str, out_of_range))}")
+    return np.sort(np.array(teeth, dtype=np.int32))
+
+@dataclass(frozen=True, slots=True, eq=False)  # eq=False keeps the identity hash, arrays are not hashable
 class BikeType:
-    """Data class for bike type configuration"""
+    """Data class for bike type configuration (teeth sorted from smallest to largest)"""
     name: str
     value: str
-    chainrings: List[int]
-    sprockets: List[int]
+    chainrings: np.ndarray
+    sprockets: np.ndarray
+
+# Predefined bicycle types
+BIKE_TYPES = (
+    BikeType("MTB (Mountain)", "mtb", _teeth(24, 34, 42), _teeth(14, 16, 18, 20, 22, 24, 34)),
+    BikeType("Road", "road", _teeth(34, 50), _teeth(14, 16, 18, 20, 22, 24, 28)),
+    BikeType("Urban/Commuter", "urban", _teeth(24, 34, 42), _teeth(14, 16, 18, 20, 22, 24, 28)),
+    BikeType("Custom", "custom", _teeth(), _teeth())
+)
+
+class BackgroundFigureCanvas(FigureCanvasTkAgg):
+    """Tk canvas whose Agg rendering is delegated to the drawing thread of the application"""
+    def __init__(self, figure, master, request_draw: Callable[["BackgroundFigureCanvas"], None],
+                 draw_lock: threading.RLock) -> None:
+        self._request_draw = request_draw
+        self._draw_lock = draw_lock
+        # The charts have no images, so skip the compositing pass of matplotlib
+        if not any(ax.images for ax in figure.axes):
+            figure.suppressComposite = True
+        super().__init__(figure, master)
+
+    def draw(self) -> None:
+        # Queue the rendering; the result is blitted to the Tk canvas when it is ready
+        self._request_draw(self)
+
+    def resize(self, event) -> None:
+        # The drawing thread may be rendering the figure whose size changes here
+        with self._draw_lock:
+            super().resize(event)
+
+    def _update_device_pixel_ratio(self, event=None) -> None:
+        # Bound to <Map>, a new pixel ratio changes the figure DPI while it may be rendering
+        with self._draw_lock:
+            super()._update_device_pixel_ratio(event)
 
 class NuSui:
     def __init__(self, root: tk.Tk) -> None:
@@ -142,17 +429,91 @@ class NuSui:
         """Configure the main window"""
         self.root.title(APP_TITLE)
         self.root.geometry(DEFAULT_WINDOW_SIZE)
-        # Configure matplotlib
-        matplotlib.rcParams.update({'font.size': DEFAULT_FONT_SIZE})
         
     def initialize_variables(self) -> None:
         """Initialize class variables"""
-        self.crankset_teeth: List[int] = []
-        self.cassette_teeth: List[int] = []
-        self.wheel_sizes: Dict[str, float] = wheel_sizes
+        self.crankset_teeth: np.ndarray = _teeth()
+        self.cassette_teeth: np.ndarray = _teeth()
+        self._ratio: np.ndarray = np.empty((0, 0))
+        self._crossing_mask: np.ndarray = np.zeros((0, 0), dtype=bool)
+        self._combo_labels: List[str] = []
+        self._combo_colors: List[str] = []
+        self._wheel_idx = _WHEEL_IDX["26x2.1"]
+        self._wheel_circ = float(_WHEEL_CIRC[self._wheel_idx])
         self.technical_mode = tk.BooleanVar(value=False)
         self.debug_var = tk.BooleanVar(value=False)
-        
+        self._dbg = _no_debug
+        self.debug_var.trace_add("write", self._on_debug_toggled)
+        self._figures: Dict[str, tuple] = {}
+        self._chart_canvases: Dict[str, BackgroundFigureCanvas] = {}
+        self._info_windows: Dict[str, tk.Toplevel] = {}
+        self._wheel_canvas: Optional[tk.Canvas] = None
+        self._legend_handles: Dict[int, List[Line2D]] = {}
+        self._visual_tabs: Optional[tuple] = None
+        self._tech_tabs: Optional[tuple] = None
+        self._visual_notebook = None
+        self._tech_notebook = None
+        self._charts_built: Dict[str, bool] = {}
+        self._tech_tabs_built: List[bool] = []
+        self._speed_canvas = None
+        self._speed_background = None
+        self._power_canvas = None
+        self._power_axes: tuple = ()
+        self._power_lines: tuple = ()
+        self._speed_artists: List[tuple] = []
+        self._speed_animated: list = []
+        self._speed_sweep: np.ndarray = np.empty((0, 0, 0))
+        self._speed_draw_cid: Optional[int] = None
+        self._cadence_after: Optional[str] = None
+        self._cadence = DEFAULT_CADENCE
+        self._visual_key: Optional[tuple] = None
+        self._speed_chart_key: Optional[tuple] = None
+        self._tech_key: Optional[tuple] = None
+        
+        # Drawing thread: renders the charts with Agg, the Tk thread only copies the result.
+        # Every change of a chart figure holds _draw_lock (reentrant, the builders nest)
+        self._draw_lock = threading.RLock()
+        self._draw_pending = set()
+        self._draw_requests: "queue.Queue[BackgroundFigureCanvas]" = queue.Queue()
+        self._draw_results: "queue.Queue[BackgroundFigureCanvas]" = queue.Queue()
+        threading.Thread(target=self._draw_worker, daemon=True).start()
+        self.root.after(DRAW_POLL_INTERVAL_MS, self._poll_draw_results)
+        
+    def _request_draw(self, canvas: BackgroundFigureCanvas) -> None:
+        """Queues a canvas for rendering, ignoring it if it is already waiting"""
+        if canvas not in self._draw_pending:
+            self._draw_pending.add(canvas)
+            self._draw_requests.put(canvas)
+
+    def _draw_worker(self) -> None:
+        """Renders the queued canvases with Agg outside the Tk main thread"""
+        while True:
+            canvas = self._draw_requests.get()
+            self._draw_pending.discard(canvas)
+            with self._draw_lock:
+                try:
+                    FigureCanvasAgg.draw(canvas)
+                except Exception:
+                    traceback.print_exc()
+                    continue
+            self._draw_results.put(canvas)
+
+    def _poll_draw_results(self) -> None:
+        """Copies the images rendered by the drawing thread to their Tk canvases"""
+        while True:
+            try:
+                canvas = self._draw_results.get_nowait()
+            except queue.Empty:
+                break
+            if canvas.get_tk_widget().winfo_exists():
+                with self._draw_lock:
+                    canvas.blit()
+        self.root.after(DRAW_POLL_INTERVAL_MS, self._poll_draw_results)
+
+    def _on_debug_toggled(self, *args) -> None:
+        """Points the debug output at print or at a no-op when the debug checkbox changes"""
+        self._dbg = print if self.debug_var.get() else _no_debug
+
     def setup_scrollable_frame(self, parent, setup_function):
         """
         Creates a scrollable frame inside the parent and executes the setup_function
@@ -179,9 +540,21 @@ class NuSui:
         # Create window in canvas to display the frame
         canvas_window = canvas.create_window((0, 0), window=inner_frame, anchor="nw")
         
-        # Function to adjust the canvas size when the frame size changes
+        # Function to adjust the canvas size when the frame size changes; the bbox of the
+        # whole canvas is computed once per idle cycle, however many children were resized
+        scroll_pending = False
+        
+        def _update_scroll_region():
+            nonlocal scroll_pending
+            scroll_pending = False
+            if canvas.winfo_exists():
+                canvas.configure(scrollregion=canvas.bbox("all"))
+        
         def configure_scroll_region(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            nonlocal scroll_pending
+            if not scroll_pending:
+                scroll_pending = True
+                canvas.after_idle(_update_scroll_region)
         
         # Function to adjust the window width when the size changes
         def configure_canvas_window(event):
@@ -195,7 +568,21 @@ class NuSui:
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Only the canvas under the pointer handles the wheel; leaving it for one of its
+        # own widgets keeps the binding
+        def _bind_mousewheel(event):
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            self._wheel_canvas = canvas
+        
+        def _unbind_mousewheel(event):
+            widget = canvas.winfo_containing(event.x_root, event.y_root)
+            if widget is None or not (widget is canvas or str(widget).startswith(str(canvas) + ".")):
+                self._release_mousewheel(canvas)
+        
+        canvas.bind("<Enter>", _bind_mousewheel)
+        canvas.bind("<Leave>", _unbind_mousewheel)
+        # A destroyed canvas must not keep receiving the wheel events
+        canvas.bind("<Destroy>", lambda event: self._release_mousewheel(canvas))
         
         # Execute the provided setup function in the scrollable frame
         if setup_function:
@@ -203,6 +590,12 @@ class NuSui:
         
         return inner_frame
         
+    def _release_mousewheel(self, canvas) -> None:
+        """Removes the global mouse wheel binding if it belongs to canvas"""
+        if self._wheel_canvas is canvas:
+            canvas.unbind_all("<MouseWheel>")
+            self._wheel_canvas = None
+
     def create_ui(self):
         # Add mode switch button at the top
         mode_frame = ttk.Frame(self.root)
@@ -219,7 +612,6 @@ class NuSui:
                        command=self.change_mode).pack(side="left", padx=PADDING)
         
         # Button to show debug
-        self.debug_var = tk.BooleanVar(value=False)
         self.debug_check = ttk.Checkbutton(mode_frame, text="Show debug",
                                       variable=self.debug_var)
         self.debug_check.pack(side="right", padx=PADDING)
@@ -266,13 +658,16 @@ class NuSui:
             # Change to technical mode
             self.notebook.tab(4, state="normal")  # Show technical tab
             # Update visualizations and recommendations if data already exists
-            if self.crankset_teeth and self.cassette_teeth:
+            if self.crankset_teeth.size and self.cassette_teeth.size:
                 self.visualize_bike()
                 # Update technical tab
                 self.update_tech_tab()
         else:
             # Change to beginner mode
             self.notebook.tab(4, state="hidden")  # Hide technical tab
+            # The hidden tab no longer receives the pointer, so it cannot keep the wheel
+            if self._wheel_canvas is not None and str(self._wheel_canvas).startswith(str(self.tech_tab) + "."):
+                self._release_mousewheel(self._wheel_canvas)
     
     def create_menu(self):
         menu_bar = tk.Menu(self.root)
@@ -375,16 +770,8 @@ class NuSui:
         # Variables for bicycle type
         self.bike_type_var = tk.StringVar(value="mtb")
         
-        # Type options with images and predefined configurations
-        bike_types = [
-            {"name": "MTB (Mountain)", "value": "mtb", "chainrings": [24, 34, 42], "sprockets": [14, 16, 18, 20, 22, 24, 34]},
-            {"name": "Road", "value": "road", "chainrings": [34, 50], "sprockets": [14, 16, 18, 20, 22, 24, 28]},
-            {"name": "Urban/Commuter", "value": "urban", "chainrings": [24, 34, 42], "sprockets": [14, 16, 18, 20, 22, 24, 28]},
-            {"name": "Custom", "value": "custom", "chainrings": [], "sprockets": []}
-        ]
-        
-        for bike in bike_types:
-            ttk.Radiobutton(left_frame, text=bike["name"], value=bike["value"], 
+        for bike in BIKE_TYPES:
+            ttk.Radiobutton(left_frame, text=bike.name, value=bike.value, 
                           variable=self.bike_type_var,
                           command=lambda b=bike: self.select_bike_type(b)).pack(anchor="w", pady=PADDING, padx=LARGE_PADDING)
         
@@ -396,19 +783,10 @@ class NuSui:
         ttk.Label(self.right_frame, text="Wheel size:").pack(anchor="w", pady=PADDING)
         self.wheel_size_var = tk.StringVar(value="26x2.1")  # Default value
         
-        # Group wheel sizes by categories for easier selection
-        wheel_categories = {
-            "MTB": ["26x1.95", "26x2.1", "26x2.35", "27.5x2.10", "27.5x2.25", "29x2.1", "29x2.25"],
-            "Road": ["700x23C", "700x25C", "700x28C", "700C"],
-            "Urban": ["700x35C", "700x38C", "700x40C", "26x1.75"],
-            "Custom": list(wheel_sizes.keys())  # Use all available wheel sizes from the dictionary
-        }
-        
-        self.wheel_combo = ttk.Combobox(self.right_frame, textvariable=self.wheel_size_var, width=30)
+        # Its values are the wheel sizes of the bike type, set by select_bike_type from _WHEEL_OPTIONS
+        self.wheel_combo = ttk.Combobox(self.right_frame, textvariable=self.wheel_size_var, width=30, state="readonly")
         self.wheel_combo.pack(anchor="w", pady=PADDING, padx=LARGE_PADDING)
-        
-        # Update wheel options based on selected bicycle type
-        self.wheel_combo['values'] = wheel_categories["MTB"]  # Default value
+        self.wheel_combo.bind("<<ComboboxSelected>>", self._on_wheel_changed)
         
         # Default cadence
         ttk.Label(self.right_frame, text="Usual cadence (pedal strokes per minute):").pack(anchor="w", pady=PADDING)
@@ -419,7 +797,7 @@ class NuSui:
         
         ttk.Scale(cadencia_frame, from_=MIN_CADENCE, to=MAX_CADENCE, orient="horizontal", 
                 variable=self.cadencia_var, length=200,
-                command=lambda s: self.cadencia_var.set(str(int(float(s))))).pack(side="left")
+                command=self._on_cadence_change).pack(side="left")
         
         ttk.Label(cadencia_frame, textvariable=self.cadencia_var).pack(side="left", padx=PADDING)
         ttk.Label(cadencia_frame, text="RPM").pack(side="left")
@@ -440,7 +818,31 @@ class NuSui:
         self.visualize_button.pack(pady=LARGE_PADDING)
         
         # Select MTB type by default
-        self.select_bike_type(bike_types[0])
+        self.select_bike_type(BIKE_TYPES[0])
+
+    def _on_wheel_changed(self, event=None) -> None:
+        """Caches the circumference of the selected wheel size"""
+        self._wheel_idx = _WHEEL_IDX[self.wheel_size_var.get()]
+        self._wheel_circ = float(_WHEEL_CIRC[self._wheel_idx])
+
+    def _on_cadence_change(self, value: str) -> None:
+        """Stores the cadence selected on the slider and schedules the speed chart update"""
+        cadence = int(float(value))
+        self.cadencia_var.set(str(cadence))
+        # The slider moves in fractions of RPM; the chart only changes with the whole cadence
+        if cadence == self._cadence:
+            return
+        self._cadence = cadence
+        
+        # Coalesce the slider events so the chart is redrawn at most once per CADENCE_DEBOUNCE_MS
+        if self._cadence_after is not None:
+            self.root.after_cancel(self._cadence_after)
+        self._cadence_after = self.root.after(CADENCE_DEBOUNCE_MS, self._do_redraw)
+
+    def _do_redraw(self) -> None:
+        """Updates the speed chart with the last cadence selected on the slider"""
+        self._cadence_after = None
+        self._blit_speed_chart(self._cadence)
 
     @handle_errors
     def setup_custom_gears(self):
@@ -464,7 +866,7 @@ class NuSui:
         ttk.Label(left_frame, text="Enter the number of teeth separated by commas:").pack(pady=PADDING)
         
         # Default values if configuration already exists
-        platos_default = ",".join(map(str, self.crankset_teeth)) if self.crankset_teeth else ""
+        platos_default = ",".join(map(str, self.crankset_teeth))
         self.platos_entry = ttk.Entry(left_frame)
         self.platos_entry.pack(padx=PADDING, pady=PADDING, fill="x")
         self.platos_entry.insert(0, platos_default)
@@ -479,7 +881,7 @@ class NuSui:
         ttk.Label(right_frame, text="Enter the number of teeth separated by commas:").pack(pady=PADDING)
         
         # Default values if configuration already exists
-        piñones_default = ",".join(map(str, self.cassette_teeth)) if self.cassette_teeth else ""
+        piñones_default = ",".join(map(str, self.cassette_teeth))
         self.piñones_entry = ttk.Entry(right_frame)
         self.piñones_entry.pack(padx=PADDING, pady=PADDING, fill="x")
         self.piñones_entry.insert(0, piñones_default)
@@ -501,27 +903,22 @@ class NuSui:
     def save_custom_gears(self, window):
         """Saves the manual gear configuration and closes the window"""
         try:
-            # Process chainrings
+            # Process chainrings, sorted from largest to smallest
             platos_text = self.platos_entry.get().strip()
-            if platos_text:
-                self.crankset_teeth = [int(x.strip()) for x in platos_text.split(',')]
-            else:
-                self.crankset_teeth = []
+            crankset_teeth = _parse_teeth(platos_text)[::-1]
                 
-            # Process sprockets
+            # Process sprockets, sorted from smallest to largest
             piñones_text = self.piñones_entry.get().strip()
-            if piñones_text:
-                self.cassette_teeth = [int(x.strip()) for x in piñones_text.split(',')]
-            else:
-                self.cassette_teeth = []
+            cassette_teeth = _parse_teeth(piñones_text)
                 
             # Validate configuration
-            if not self.crankset_teeth or not self.cassette_teeth:
+            if not crankset_teeth.size or not cassette_teeth.size:
                 raise ValueError("You must configure at least one chainring and one sprocket")
                 
-            # Sort teeth from smallest to largest (sprockets) and largest to smallest (chainrings)
-            self.cassette_teeth.sort()  # Smallest to largest for sprockets
-            self.crankset_teeth.sort(reverse=True)  # Largest to smallest for chainrings
+            # Apply it only once both entries are valid, the gear tables must match the teeth
+            self.crankset_teeth = crankset_teeth
+            self.cassette_teeth = cassette_teeth
+            self._rebuild_gear_tables()
             
             # Close window
             window.destroy()
@@ -530,50 +927,36 @@ class NuSui:
         except ValueError as e:
             messagebox.showwarning("Configuration error", str(e))
     
-    @handle_errors
-    def select_bike_type(self, bike_type: Dict[str, Union[str, List[int]]]) -> None:
+    def select_bike_type(self, bike_type: BikeType) -> None:
         """
         Update bike configuration based on selected type
         
         Args:
-            bike_type: Dictionary containing bike configuration
+            bike_type: Predefined bike configuration
         """
-        # Validate input
-        required_keys = ["value", "chainrings", "sprockets"]
-        if not all(key in bike_type for key in required_keys):
-            raise ValueError("Invalid bike type configuration")
-            
-        # Update values
-        self.crankset_teeth = bike_type["chainrings"].copy()
-        self.cassette_teeth = bike_type["sprockets"].copy()
-        
-        # Sort teeth from smallest to largest (sprockets) and largest to smallest (chainrings)
-        self.cassette_teeth.sort()  # Smallest to largest for sprockets
-        self.crankset_teeth.sort(reverse=True)  # Largest to smallest for chainrings
+        # Update values (BIKE_TYPES teeth are already sorted from smallest to largest)
+        self.crankset_teeth = bike_type.chainrings[::-1]  # Largest to smallest
+        self.cassette_teeth = bike_type.sprockets
         
         # Update wheel options based on bike type
-        wheel_options = {
-            "mtb": ("26x2.1", ["26x2.1", "26x2.35", "27.5x2.10", "27.5x2.25", "29x2.1", "29x2.25", "29x2.3"]),
-            "road": ("700x25C", ["700x23C", "700x25C", "700x28C", "700C"]),
-            "urban": ("700x35C", ["700x35C", "700x38C", "700x40C", "26x1.75"]),
-            "custom": ("700C", list(wheel_sizes.keys()))  # Add this line to include all wheel sizes for custom
-        }
-        
-        bike_value = bike_type["value"]
-        if bike_value in wheel_options:
-            default_size, sizes = wheel_options[bike_value]
-            self.wheel_combo['values'] = sizes
+        bike_value = bike_type.value
+        if bike_value in _WHEEL_OPTIONS:
+            default_size, sizes = _WHEEL_OPTIONS[bike_value]
+            if self.wheel_combo['values'] != sizes:
+                self.wheel_combo['values'] = sizes
             self.wheel_size_var.set(default_size)
+            self._on_wheel_changed()
             
         # Handle custom configuration
         if bike_value == "custom":
             self.manual_config_button.state(['!disabled'])
-            self.crankset_teeth = []
-            self.cassette_teeth = []
+            self.crankset_teeth = _teeth()
+            self.cassette_teeth = _teeth()
         else:
             self.manual_config_button.state(['disabled'])
+            
+        self._rebuild_gear_tables()
 
-    @handle_errors
     def validate_gear_configuration(self) -> bool:
         """
         Validate the current gear configuration
@@ -581,29 +964,45 @@ class NuSui:
         Returns:
             bool: True if configuration is valid, False otherwise
         """
-        if not self.crankset_teeth or not self.cassette_teeth:
+        if not self.crankset_teeth.size or not self.cassette_teeth.size:
             messagebox.showwarning(
                 "Insufficient data",
                 "Please select a bicycle type or configure manually."
             )
             return False
             
-        # Validate teeth numbers
-        try:
-            for teeth in self.crankset_teeth + self.cassette_teeth:
-                if not isinstance(teeth, int):
-                    raise ValueError(f"Invalid teeth value: {teeth}")
-                if not MIN_TEETH <= teeth <= MAX_TEETH:
-                    raise ValueError(f"Teeth value out of range: {teeth}")
-            return True
-        except ValueError as e:
+        # Validate teeth numbers (the int32 dtype already guarantees integers)
+        teeth = np.concatenate((self.crankset_teeth, self.cassette_teeth))
+        out_of_range = teeth[(teeth < MIN_TEETH) | (teeth > MAX_TEETH)]
+        if out_of_range.size:
             messagebox.showwarning(
                 "Invalid configuration",
-                str(e)
+                f"Teeth value out of range: {', '.join(map(str, out_of_range))}"
             )
             return False
+        return True
+
+    def _rebuild_gear_tables(self) -> None:
+        """Precompute the gear ratio of every chainring/sprocket combination (rows = chainrings)"""
+        chainrings = np.asarray(self.crankset_teeth, dtype=np.float64)
+        sprockets = np.asarray(self.cassette_teeth, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            self._ratio = chainrings[:, None] / sprockets[None, :]
+        self._build_crossing_mask()
+        
+        # Bar labels and colors of the ratio tab, row by row like self._ratio
+        self._combo_labels = [f"{chainring}/{sprocket}" for chainring, sprocket in
+                              itertools.product(self.crankset_teeth.tolist(), self.cassette_teeth.tolist())]
+        self._combo_colors = [_chainring_color(i) for i in range(len(self.crankset_teeth))
+                              for _ in range(len(self.cassette_teeth))]
+        # The cached legend handles show the chainrings of the previous configuration
+        self._legend_handles.clear()
+        
+        # The speed chart on screen belongs to the previous configuration, so the next
+        # visualization has to build the charts again
+        self._speed_canvas = None
+        self._visual_key = None
 
-    @handle_errors
     def calculate_gear_ratio(self, chainring: int, sprocket: int) -> float:
         """
         Calculate gear ratio between chainring and sprocket
@@ -619,101 +1018,33 @@ class NuSui:
             raise ValueError("Sprocket cannot have 0 teeth")
         return chainring / sprocket
         
-    def is_chain_crossing(self, chainring_idx: int, sprocket_idx: int) -> Tuple[bool, Optional[str]]:
+    def _build_crossing_mask(self) -> None:
         """
-        Determines if a chainring and sprocket combination causes chain crossing
+        Precomputes the chain crossing matrix for the current configuration
         
-        Args:
-            chainring_idx: Index of the chainring (0 for the largest)
-            sprocket_idx: Index of the sprocket (0 for the smallest)
-            
-        Returns:
-            bool: True if the combination causes chain crossing, False otherwise
-            str: Message describing the problem, or None if no crossing
+        Fills self._crossing_mask (True where the chainring/sprocket combination
+        crosses the chain).
         """
-        num_chainrings = len(self.crankset_teeth)
-        num_sprockets = len(self.cassette_teeth)
-        
-        # If there is only one chainring, no crossing is possible
-        if num_chainrings <= 1:
-            return False, None
-            
-        # Debug info
-        if hasattr(self, 'debug_var') and self.debug_var.get():
-            print(f"Checking chain crossing for chainring idx={chainring_idx} with sprocket idx={sprocket_idx}")
-            print(f"Chainrings={self.crankset_teeth}, Sprockets={self.cassette_teeth}")
-        
-        # Adjust chain crossing logic according to the number of chainrings and sprockets
-        if num_chainrings == 2:  # Double chainring
-            # For double chainring, consider 35% of sprockets as extremes
-            extreme_count = max(2, round(num_sprockets * 0.35))
-            
-            # Debug info
-            if hasattr(self, 'debug_var') and self.debug_var.get():
-                print(f"Double chainring: extreme_count={extreme_count}")
-            
-            # Large chainring with large sprockets
-            if chainring_idx == 0 and sprocket_idx >= num_sprockets - extreme_count:
-                return True, "Large chainring with large sprocket: increases wear and reduces efficiency"
-            
-            # Small chainring with small sprockets
-            if chainring_idx == num_chainrings - 1 and sprocket_idx < extreme_count:
-                return True, "Small chainring with small sprocket: increases wear and reduces efficiency"
-                
-        elif num_chainrings == 3:  # Triple chainring
-            # More restrictive with triples: 40% of sprockets are extremes
-            extreme_count_large = max(2, round(num_sprockets * 0.4))
-            extreme_count_small = max(2, round(num_sprockets * 0.4))
-            
-            medium_extreme_large = max(1, round(num_sprockets * 0.15))
-            medium_extreme_small = max(1, round(num_sprockets * 0.15))
-            
+        if len(self.crankset_teeth) > 1:
             # Debug info
-            if hasattr(self, 'debug_var') and self.debug_var.get():
-                print(f"Triple chainring: extreme_count_large={extreme_count_large}, "
-                     f"extreme_count_small={extreme_count_small}, "
-                     f"medium_extreme_large={medium_extreme_large}, "
-                     f"medium_extreme_small={medium_extreme_small}")
-            
-            # Large chainring with large sprockets
-            if chainring_idx == 0 and sprocket_idx >= num_sprockets - extreme_count_large:
-                return True, "Large chainring with large sprocket: increases wear and reduces efficiency"
-            
-            # Small chainring with small sprockets
-            if chainring_idx == num_chainrings - 1 and sprocket_idx < extreme_count_small:
-                return True, "Small chainring with small sprocket: increases wear and reduces efficiency"
-            
-            # For the middle chainring, there are also restrictions but less severe
-            if chainring_idx == 1 and (sprocket_idx >= num_sprockets - medium_extreme_large or 
-                                    sprocket_idx < medium_extreme_small):
-                return True, "Middle chainring with extreme sprocket: may cause wear"
-        
-        # For other cases (unusual number of chainrings), use a general rule
-        else:
-            # General rule: 30% of sprockets at each end
-            extreme_count = max(1, round(num_sprockets * 0.3))
-            
-            # Large chainring with large sprockets
-            if chainring_idx == 0 and sprocket_idx >= num_sprockets - extreme_count:
-                return True, "Large chainring with large sprocket: increases wear and reduces efficiency"
-            
-            # Small chainring with small sprockets
-            if chainring_idx == num_chainrings - 1 and sprocket_idx < extreme_count:
-                return True, "Small chainring with small sprocket: increases wear and reduces efficiency"
-            
-            # For intermediate chainrings in configurations with more than 2 chainrings
-            if len(self.crankset_teeth) > 2 and 0 < chainring_idx < len(self.crankset_teeth) - 1:
-                # Only the extremes for intermediate chainrings
-                if sprocket_idx == 0 or sprocket_idx >= num_sprockets - 1:
-                    return True, "Intermediate chainring with extreme sprocket: may cause wear"
-        
-        return False, None
-    
-    @handle_errors
+            self._dbg("Building chain crossing matrix")
+            self._dbg(f"Chainrings={self.crankset_teeth}, Sprockets={self.cassette_teeth}")
+        self._crossing_mask = _crossing_table(
+            len(self.crankset_teeth), len(self.cassette_teeth), self._dbg)
+
     def calculate_speed(self, gear_ratio: float, cadence: int) -> float:
         """Calculate speed in km/h"""
-        wheel_circum = self.wheel_sizes[self.wheel_size_var.get()]
-        return (gear_ratio * wheel_circum * cadence * 60) / 1000
+        return (gear_ratio * self._wheel_circ * cadence * 60) / 1000
+
+    def _speed_grid_for(self, cadence: int) -> np.ndarray:
+        """Speeds of the current configuration at the given cadence, memoized per configuration"""
+        return _cached_grid(np.asarray(self.crankset_teeth, dtype=np.int32).tobytes(),
+                            np.asarray(self.cassette_teeth, dtype=np.int32).tobytes(),
+                            self._wheel_idx, cadence)
+
+    def _compute_matrices(self, cadence: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the gear ratio, speed (km/h) and development (m) matrices of the current configuration"""
+        return self._ratio, self._speed_grid_for(cadence), self._ratio * self._wheel_circ
 
     def calculate_power_estimate(self, speed: float, slope: float = 0.0) -> float:
         """Calculate estimated power output"""
@@ -732,35 +1063,48 @@ class NuSui:
         if self.debug_var.get():
             self.show_chain_crossing_debug()
         
-        # Clear visualization tab
-        for widget in self.visual_tab.winfo_children():
-            widget.destroy()
+        # Nothing changed since the last visualization: just show it again
+        visual_key = (self.crankset_teeth.tobytes(), self.cassette_teeth.tobytes(), self._wheel_idx,
+                      self._cadence, self.technical_mode.get())
+        if visual_key == self._visual_key and self.visual_tab.winfo_children():
+            self.notebook.select(2)
+            return
+        self._visual_key = visual_key
         
-        # Create a scrollable frame for the visualization tab
-        scrollable_frame = self.setup_scrollable_frame(self.visual_tab, None)
+        # Create the tab structure for visualizations only once, later visualizations
+        # refill its tabs keeping the chart canvases
+        if self._visual_tabs is None or not self._visual_tabs[0].winfo_exists():
+            # Clear visualization tab
+            for widget in self.visual_tab.winfo_children():
+                widget.destroy()
+            
+            # Create a scrollable frame for the visualization tab
+            scrollable_frame = self.setup_scrollable_frame(self.visual_tab, None)
+            
+            visual_notebook = ttk.Notebook(scrollable_frame)
+            visual_notebook.pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+            visual_notebook.bind("<<NotebookTabChanged>>", self._on_visual_tab_changed)
+            self._visual_notebook = visual_notebook
+            self._visual_tabs = tuple(ttk.Frame(visual_notebook) for _ in range(3))
+            for tab, title in zip(self._visual_tabs, ("Gear table", "Speed chart", "Development")):
+                visual_notebook.add(tab, text=title)
+        else:
+            chart_widgets = {str(canvas.get_tk_widget()) for canvas in self._chart_canvases.values()}
+            for tab in self._visual_tabs:
+                for widget in tab.winfo_children():
+                    if str(widget) not in chart_widgets:
+                        widget.destroy()
+        table_tab = self._visual_tabs[0]
         
         # Get parameters
-        cadence = int(self.cadencia_var.get())
-        wheel_size = self.wheel_size_var.get()
-        
-        # Create tab structure for visualizations
-        visual_notebook = ttk.Notebook(scrollable_frame)
-        visual_notebook.pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+        cadence = self._cadence
         
         # Gear table tab
-        table_tab = ttk.Frame(visual_notebook)
-        visual_notebook.add(table_tab, text="Gear table")
         self.create_gear_table(table_tab, cadence)
         
-        # Speed chart tab
-        chart_tab = ttk.Frame(visual_notebook)
-        visual_notebook.add(chart_tab, text="Speed chart")
-        self.create_speed_chart(chart_tab, cadence)
-        
-        # Development tab
-        dev_tab = ttk.Frame(visual_notebook)
-        visual_notebook.add(dev_tab, text="Development")
-        self.create_development_chart(dev_tab)
+        # The charts are built when their tab is shown
+        self._charts_built = {"speed": False, "development": False}
+        self._on_visual_tab_changed()
         
         # Update recommendations tab - recreate with scroll
         for widget in self.recom_tab.winfo_children():
@@ -769,13 +1113,21 @@ class NuSui:
         
         # Update technical tab if we're in technical mode
         if self.technical_mode.get():
-            for widget in self.tech_tab.winfo_children():
-                widget.destroy()
-            self.setup_scrollable_frame(self.tech_tab, self.setup_tech_tab)
+            self.update_tech_tab()
         
         # Switch to visualization tab
         self.notebook.select(2)  # Index 2 = visualization tab
         
+    def _on_visual_tab_changed(self, event=None) -> None:
+        """Builds the chart of the selected visualization tab if it belongs to an older visualization"""
+        selected = self._visual_notebook.index("current")
+        if selected == 1 and not self._charts_built["speed"]:
+            self._charts_built["speed"] = True
+            self.create_speed_chart(self._visual_tabs[1], self._cadence)
+        elif selected == 2 and not self._charts_built["development"]:
+            self._charts_built["development"] = True
+            self.create_development_chart(self._visual_tabs[2])
+
     def show_chain_crossing_debug(self):
         """Shows a debug window with the chain crossing matrix"""
         debug_window = tk.Toplevel(self.root)
@@ -806,68 +1158,57 @@ class NuSui:
         info_frame = ttk.Frame(frame)
         info_frame.pack(fill="x", pady=PADDING)
         
-        ttk.Label(info_frame, text=f"Chainrings: {self.crankset_teeth}", 
-                font=("Arial", 10)).pack(anchor="w", pady=2)
-        ttk.Label(info_frame, text=f"Sprockets: {self.cassette_teeth}", 
-                font=("Arial", 10)).pack(anchor="w", pady=2)
+        ttk.Label(info_frame, text=f"Chainrings: {self.crankset_teeth.tolist()}\n"
+                                   f"Sprockets: {self.cassette_teeth.tolist()}",
+                font=("Arial", 10), justify="left").pack(anchor="w", pady=2)
+        
+        num_chainrings, num_sprockets = self._crossing_mask.shape
         
         # Show parameters used for calculation according to bicycle type
-        if len(self.crankset_teeth) == 3:
-            num_sprockets = len(self.cassette_teeth)
+        if num_chainrings == 3:
             extreme_count_large = max(2, round(num_sprockets * 0.4))
             extreme_count_small = max(2, round(num_sprockets * 0.4))
             medium_extreme_large = max(1, round(num_sprockets * 0.15))
             medium_extreme_small = max(1, round(num_sprockets * 0.15))
             
-            ttk.Label(info_frame, text=f"Triple chainring: Crossings on large chainring: {extreme_count_large} large sprockets", 
-                    font=("Arial", 9, "italic")).pack(anchor="w", pady=1)
-            ttk.Label(info_frame, text=f"Triple chainring: Crossings on small chainring: {extreme_count_small} small sprockets", 
-                    font=("Arial", 9, "italic")).pack(anchor="w", pady=1)
-            ttk.Label(info_frame, text=f"Triple chainring: Crossings on middle chainring: {medium_extreme_small} small sprockets and {medium_extreme_large} large sprockets", 
-                    font=("Arial", 9, "italic")).pack(anchor="w", pady=1)
-        elif len(self.crankset_teeth) == 2:
-            num_sprockets = len(self.cassette_teeth)
+            ttk.Label(info_frame, text=f"Triple chainring: Crossings on large chainring: {extreme_count_large} large sprockets\n"
+                                       f"Triple chainring: Crossings on small chainring: {extreme_count_small} small sprockets\n"
+                                       f"Triple chainring: Crossings on middle chainring: {medium_extreme_small} small sprockets and {medium_extreme_large} large sprockets",
+                    font=("Arial", 9, "italic"), justify="left").pack(anchor="w", pady=1)
+        elif num_chainrings == 2:
             extreme_count = max(2, round(num_sprockets * 0.35))
             
-            ttk.Label(info_frame, text=f"Double chainring: Crossings on large chainring: {extreme_count} large sprockets", 
-                    font=("Arial", 9, "italic")).pack(anchor="w", pady=1)
-            ttk.Label(info_frame, text=f"Double chainring: Crossings on small chainring: {extreme_count} small sprockets", 
-                    font=("Arial", 9, "italic")).pack(anchor="w", pady=1)
-        
-        # Create table
-        tabla_frame = ttk.Frame(frame)
-        tabla_frame.pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+            ttk.Label(info_frame, text=f"Double chainring: Crossings on large chainring: {extreme_count} large sprockets\n"
+                                       f"Double chainring: Crossings on small chainring: {extreme_count} small sprockets",
+                    font=("Arial", 9, "italic"), justify="left").pack(anchor="w", pady=1)
+        
+        # Create table, drawn on a single canvas
+        is_cross = self._crossing_mask.tolist()  # Plain lists, cheaper to index cell by cell
+        header_width, cell_width, cell_height = 100, 54, 34
+        bold_font = ("Arial", 10, "bold")
+        tabla_canvas = tk.Canvas(frame, width=header_width + num_sprockets * cell_width,
+                                 height=(num_chainrings + 1) * cell_height, highlightthickness=0)
+        tabla_canvas.pack(anchor="w", padx=PADDING, pady=PADDING)
         
         # Column headers (sprockets)
-        ttk.Label(tabla_frame, text="Chainring\\Sprocket", width=10, 
-                 font=("Arial", 10, "bold")).grid(row=0, column=0, padx=2, pady=2)
-        
+        tabla_canvas.create_text(header_width / 2, cell_height / 2, text="Chainring\\Sprocket", font=bold_font)
         for j, sprocket in enumerate(self.cassette_teeth):
-            ttk.Label(tabla_frame, text=f"{sprocket}T", width=6, 
-                     font=("Arial", 10, "bold")).grid(row=0, column=j+1, padx=2, pady=2)
+            tabla_canvas.create_text(header_width + (j + 0.5) * cell_width, cell_height / 2,
+                                     text=f"{sprocket}T", font=bold_font)
         
         # Rows (chainrings)
         for i, chainring in enumerate(self.crankset_teeth):
-            ttk.Label(tabla_frame, text=f"{chainring}T", width=10, 
-                     font=("Arial", 10, "bold")).grid(row=i+1, column=0, padx=2, pady=2)
+            y = (i + 1) * cell_height
+            tabla_canvas.create_text(header_width / 2, y + cell_height / 2, text=f"{chainring}T", font=bold_font)
             
-            for j in range(len(self.cassette_teeth)):
-                # Calculate crossing directly
-                crossing, _ = self.is_chain_crossing(i, j)
+            for j in range(num_sprockets):
+                # Read the crossing from the precomputed matrix
+                crossing = is_cross[i][j]
                 
-                text = "X" if crossing else "O"
-                
-                # Use colored Frame with Label inside
-                cell_frame = ttk.Frame(tabla_frame, width=50, height=30)
-                cell_frame.grid(row=i+1, column=j+1, padx=2, pady=2)
-                cell_frame.grid_propagate(False)  # Maintain size
-                
-                if crossing:
-                    label = ttk.Label(cell_frame, text=text, font=("Arial", 10, "bold"), foreground="red")
-                else:
-                    label = ttk.Label(cell_frame, text=text, font=("Arial", 10, "bold"), foreground="green")
-                    
-                label.place(relx=0.5, rely=0.5, anchor="center")
+                x = header_width + j * cell_width
+                tabla_canvas.create_rectangle(x + 2, y + 2, x + cell_width - 2, y + cell_height - 2, outline="gray")
+                tabla_canvas.create_text(x + cell_width / 2, y + cell_height / 2, text="X" if crossing else "O",
+                                         font=bold_font, fill="red" if crossing else "green")
         
         # Explanation panel
         explanation = """
@@ -905,43 +1246,31 @@ class NuSui:
                  font=("Arial", 12, "bold")).pack(pady=PADDING)
         
         # Create table with treeview
-        columns = ["Chainring"] + [f"{teeth}" for teeth in self.cassette_teeth]
+        sprocket_columns = [str(teeth) for teeth in self.cassette_teeth.tolist()]
+        columns = ["Chainring"] + sprocket_columns
         
         tree = ttk.Treeview(container, columns=columns, show="headings", height=len(self.crankset_teeth))
         tree.pack(fill="both", expand=True)
         
         # Configure columns
         tree.heading("Chainring", text="Chainring")
-        for teeth in self.cassette_teeth:
-            tree.heading(f"{teeth}", text=f"{teeth}")
-            tree.column(f"{teeth}", width=60, anchor="center")
+        for column in sprocket_columns:
+            tree.heading(column, text=column)
+            tree.column(column, width=60, anchor="center")
         
         # Counter for combinations with chain crossing
-        crossing_count = 0
-        total_combinations = len(self.crankset_teeth) * len(self.cassette_teeth)
+        crossing_count = int(self._crossing_mask.sum())
+        total_combinations = self._crossing_mask.size
         
-        # Fill table with speeds
-        for i, chainring in enumerate(self.crankset_teeth):
-            row_values = [f"{chainring}T"]
-            for j, sprocket in enumerate(self.cassette_teeth):
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                speed = self.calculate_speed(gear_ratio, cadence)
-                
-                # Check if this combination crosses the chain
-                crossing, _ = self.is_chain_crossing(i, j)
-                
-                if crossing:
-                    # Mark cells with chain crossing
-                    row_values.append("---")
-                    crossing_count += 1
-                else:
-                    row_values.append(f"{speed:.1f}")
-            
-            tree.insert("", "end", values=row_values)
+        # Fill table with speeds, marking the combinations with chain crossing
+        _, speeds, _ = self._compute_matrices(cadence)
+        cells = np.where(self._crossing_mask, "---", np.char.mod("%.1f", speeds))
+        for chainring, row in zip(self.crankset_teeth, cells):
+            tree.insert("", "end", values=[f"{chainring}T", *row.tolist()])
         
         # Add legend
         ttk.Label(container, text="Speeds are calculated with wheel size: " + 
-                 f"{self.wheel_size_var.get()} ({self.wheel_sizes[self.wheel_size_var.get()]}m circumference)",
+                 f"{self.wheel_size_var.get()} ({self._wheel_circ}m circumference)",
                  font=("Arial", 9, "italic")).pack(pady=(PADDING, 0))
         
         # Add warning about chain crossing
@@ -959,44 +1288,63 @@ class NuSui:
                                 wraplength=600, justify="left")
         warning_label.pack(side="left", fill="x", expand=True)
 
-    @handle_errors
-    def create_speed_chart(self, parent, cadence):
-        """Creates a line chart with speeds for each gear, indicating chain crossings"""
+    def _get_chart_figure(self, name: str):
+        """Returns the cached figure and axes of a chart, cleared and ready to be redrawn"""
+        if name not in self._figures:
+            fig = Figure(figsize=CHART_SIZE)
+            self._figures[name] = (fig, fig.add_subplot())
+        fig, ax = self._figures[name]
+        ax.cla()
+        return fig, ax
+
+    def _get_chart_canvas(self, name: str, parent) -> BackgroundFigureCanvas:
+        """Returns the cached canvas of a chart, created in parent the first time it is shown"""
+        canvas = self._chart_canvases.get(name)
+        if canvas is None or not canvas.get_tk_widget().winfo_exists():
+            canvas = BackgroundFigureCanvas(self._figures[name][0], parent, self._request_draw, self._draw_lock)
+            self._chart_canvases[name] = canvas
+        else:
+            # Unpack it so it is packed again in order with the rebuilt widgets of its tab
+            canvas.get_tk_widget().pack_forget()
+        return canvas
+
+    def _chainring_legend(self, lw: int) -> List[Line2D]:
+        """Legend handles with the color of each chainring, built once per configuration and line width"""
+        handles = self._legend_handles.get(lw)
+        if handles is None:
+            handles = [Line2D([0], [0], color=_chainring_color(i), lw=lw, label=f'Chainring {chainring}T')
+                       for i, chainring in enumerate(self.crankset_teeth)]
+            self._legend_handles[lw] = handles
+        return handles
+
+    def _plot_speed_chart(self) -> None:
+        """Plots the lines of the speed chart for the current gears and mode; _set_speed_data fills in their speeds"""
         # Create figure
-        fig, ax = plt.subplots(figsize=CHART_SIZE)
+        fig, ax = self._get_chart_figure("speed")
         
         # Prepare data
+        _, speeds, _ = self._compute_matrices(self._cadence)
+        self._speed_artists = []
         for i, chainring in enumerate(self.crankset_teeth):
-            speeds = []
-            crosses = []  # To mark points that cross the chain
-            
-            for j, sprocket in enumerate(self.cassette_teeth):
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                speed = self.calculate_speed(gear_ratio, cadence)
-                speeds.append(speed)
-                
-                # Verify if this combination crosses the chain
-                crossing, _ = self.is_chain_crossing(i, j)
-                crosses.append(crossing)
+            row, crosses = speeds[i], self._crossing_mask[i]  # To mark points that cross the chain
             
             # Plot main line (all points)
-            line, = ax.plot(self.cassette_teeth, speeds, '-', color=f'C{i}', label=f"Chainring {chainring}T")
+            line, = ax.plot(self.cassette_teeth, row, '-', color=f'C{i}', label=f"Chainring {chainring}T")
             
             # Add "safe" points (without crossing) in solid color
-            safe_x = [self.cassette_teeth[j] for j in range(len(self.cassette_teeth)) if not crosses[j]]
-            safe_y = [speeds[j] for j in range(len(speeds)) if not crosses[j]]
-            ax.plot(safe_x, safe_y, 'o', color=f'C{i}')
+            safe_points, = ax.plot(self.cassette_teeth[~crosses], row[~crosses], 'o', color=f'C{i}')
             
             # Add "dangerous" points (with crossing) in another style
-            cross_x = [self.cassette_teeth[j] for j in range(len(self.cassette_teeth)) if crosses[j]]
-            cross_y = [speeds[j] for j in range(len(speeds)) if crosses[j]]
-            if cross_x:  # Only if there are dangerous points
-                ax.plot(cross_x, cross_y, 'x', color=f'C{i}', markersize=8, alpha=0.7)
+            cross_points = None
+            if crosses.any():  # Only if there are dangerous points
+                cross_points, = ax.plot(self.cassette_teeth[crosses], row[crosses], 'x',
+                                        color=f'C{i}', markersize=8, alpha=0.7)
+            
+            self._speed_artists.append((line, safe_points, cross_points))
         
         # Configure chart
         ax.set_xlabel('Sprocket teeth')
         ax.set_ylabel('Speed (km/h)')
-        ax.set_title(f'Speeds at {cadence} RPM')
         ax.grid(True)
         ax.legend()
         
@@ -1004,22 +1352,94 @@ class NuSui:
         if not self.technical_mode.get():
             ax.set_xlabel('Sprockets (from fastest to easiest)')
             # Simplify X-axis labels
-            ax.set_xticks(range(len(self.cassette_teeth)))
-            ax.set_xticklabels([f"{i+1}" for i in range(len(self.cassette_teeth))])
+            num_sprockets = len(self.cassette_teeth)
+            ax.set_xticks(range(num_sprockets))
+            ax.set_xticklabels([f"{i+1}" for i in range(num_sprockets)])
+        self._speed_animated = [ax.title] + [artist for artists in self._speed_artists
+                                             for artist in artists if artist is not None]
+        for artist in self._speed_animated:
+            artist.set_animated(True)
+
+    @handle_errors
+    @holding_draw_lock
+    def create_speed_chart(self, parent, cadence):
+        """Creates a line chart with speeds for each gear, indicating chain crossings"""
+        # The lines are only plotted again when the gears or the mode change; otherwise the
+        # existing ones just receive the speeds of the new wheel and cadence
+        chart_key = (self.crankset_teeth.tobytes(), self.cassette_teeth.tobytes(), self.technical_mode.get())
+        if chart_key != self._speed_chart_key:
+            self._plot_speed_chart()
+            self._speed_chart_key = chart_key
+        fig, ax = self._figures["speed"]
+        
+        # Speeds for every cadence of the slider (cadence x chainring x sprocket), used to blit the
+        # lines when the cadence changes; the speed axis is fixed for the whole range
+        cadences = np.arange(MIN_CADENCE, MAX_CADENCE + 1)
+        self._speed_sweep = self._ratio * (self._wheel_circ * cadences[:, None, None] * 60 / 1000)
+        ax.set_ylim(self._speed_sweep.min() * 0.9, self._speed_sweep.max() * 1.05)
+        self._set_speed_data(cadence)
         
         # Create canvas to display the chart
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
+        canvas = self._get_chart_canvas("speed", parent)
+        self._speed_canvas = canvas
+        self._speed_background = None
+        if self._speed_draw_cid is None:
+            self._speed_draw_cid = canvas.mpl_connect("draw_event", self._on_speed_chart_draw)
+            # After a resize the saved background no longer fits the chart until it is drawn again
+            canvas.mpl_connect("resize_event", self._on_speed_chart_resize)
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill="both", expand=True)
         
         # Add legend for chain crossings
         legend_frame = ttk.Frame(parent)
         legend_frame.pack(fill="x", pady=PADDING)
         
-        ttk.Label(legend_frame, text="○ = Safe combinations", font=("Arial", 9)).pack(side="left", padx=PADDING)
-        ttk.Label(legend_frame, text="✕ = Chain crossing combinations (avoid)", font=("Arial", 9)).pack(side="left", padx=PADDING)
+        ttk.Label(legend_frame, text="○ = Safe combinations    ✕ = Chain crossing combinations (avoid)", font=("Arial", 9)).pack(side="left", padx=PADDING)
+
+    def _on_speed_chart_draw(self, event) -> None:
+        """Saves the static background of the speed chart and draws the animated lines on top"""
+        self._speed_background = event.canvas.copy_from_bbox(event.canvas.figure.bbox)
+        for artist in self._speed_animated:
+            event.canvas.figure.draw_artist(artist)
+
+    def _on_speed_chart_resize(self, event) -> None:
+        """Drops the saved background of the speed chart when its canvas changes size"""
+        self._speed_background = None
+
+    def _set_speed_data(self, cadence: int) -> None:
+        """Puts the speeds of the given cadence on the lines of the speed chart"""
+        ax = self._figures["speed"][1]
+        speeds = self._speed_sweep[min(max(cadence, MIN_CADENCE), MAX_CADENCE) - MIN_CADENCE]
+        for i, (line, safe_points, cross_points) in enumerate(self._speed_artists):
+            row, crosses = speeds[i], self._crossing_mask[i]
+            line.set_ydata(row)
+            safe_points.set_ydata(row[~crosses])
+            if cross_points is not None:
+                cross_points.set_ydata(row[crosses])
+        ax.set_title(f'Speeds at {cadence} RPM')
+
+    def _blit_speed_chart(self, cadence: int) -> None:
+        """Updates the speed chart for a new cadence redrawing only its lines (blitting)"""
+        canvas = self._speed_canvas
+        if canvas is None or not canvas.get_tk_widget().winfo_exists():
+            return
+        
+        fig, ax = self._figures["speed"]
+        # The lines are changed after the drawing thread finishes any render of the chart
+        with self._draw_lock:
+            self._set_speed_data(cadence)
+            if self._speed_background is not None:
+                canvas.restore_region(self._speed_background)
+                for artist in self._speed_animated:
+                    fig.draw_artist(artist)
+                canvas.blit(fig.bbox)
+                return
+        
+        # Without a background (chart not drawn yet) queue a full redraw instead
+        canvas.draw_idle()
 
     @handle_errors
+    @holding_draw_lock
     def create_development_chart(self, parent):
         """Creates a bar chart with the development of each gear, marking chain crossings"""
         # Frame with explanation
@@ -1030,62 +1450,44 @@ class NuSui:
                  wraplength=800).pack(pady=PADDING)
         
         # Create figure
-        fig, ax = plt.subplots(figsize=CHART_SIZE)
-        
-        # Define colors for each chainring
-        color_map = {
-            0: 'red',      # First chainring (largest)
-            1: 'blue',     # Second chainring
-            2: 'green'     # Third chainring (if it exists)
-        }
+        fig, ax = self._get_chart_figure("development")
         
         # For storing development data by chainring
         width = 0.8 / len(self.crankset_teeth)  # Bar width adjusted according to number of chainrings
         
         # For each chainring, create a set of bars
+        developments = self._ratio * self._wheel_circ
+        sprocket_positions = np.arange(len(self.cassette_teeth))
+        cross_bars = []
         for i, chainring in enumerate(self.crankset_teeth):
-            developments = []
-            safe_markers = []  # To mark safe combinations and crossings
-            
-            for j, sprocket in enumerate(self.cassette_teeth):
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                development = gear_ratio * self.wheel_sizes[self.wheel_size_var.get()]
-                developments.append(development)
-                
-                # Verify chain crossing
-                crossing, _ = self.is_chain_crossing(i, j)
-                safe_markers.append(not crossing)  # True if safe, False if crossing
-            
             # Position of bars for this chainring
-            bar_positions = [j + width*i for j in range(len(self.cassette_teeth))]
-            
-            # Create bars for safe combinations (without crossing)
-            safe_dev = [dev if safe else 0 for dev, safe in zip(developments, safe_markers)]
-            ax.bar(bar_positions, safe_dev, width=width, color=color_map.get(i, 'gray'), 
-                  label=f"Chainring {chainring}T")
+            bar_positions = sprocket_positions + width*i
             
-            # Create bars for combinations with crossing (hatched pattern)
-            cross_dev = [dev if not safe else 0 for dev, safe in zip(developments, safe_markers)]
-            if any(cross_dev):  # Only if there is any bar with crossing
-                ax.bar(bar_positions, cross_dev, width=width, color=color_map.get(i, 'gray'), 
-                      alpha=0.5, hatch='xxx')
+            # One bar per sprocket; the ones that cross the chain get the hatched pattern below
+            bars = ax.bar(bar_positions, developments[i], width=width, color=_chainring_color(i),
+                          label=f"Chainring {chainring}T")
+            cross_bars.extend(itertools.compress(bars, self._crossing_mask[i]))
         
         # Configure X axis
-        ax.set_xticks(range(len(self.cassette_teeth)))
+        ax.set_xticks(sprocket_positions)
         ax.set_xticklabels([f"{sprocket}T" for sprocket in self.cassette_teeth])
         
         # Configure labels and title
         ax.set_xlabel('Sprocket teeth')
         ax.set_ylabel('Development (meters/pedal stroke)')
         ax.set_title('Development by chainring')
+        # The legend is created before hatching the crossing bars, so it shows the solid color
         ax.legend()
+        for bar in cross_bars:
+            bar.set_alpha(0.5)
+            bar.set_hatch('xxx')
         
         # Adjust layout
         fig.tight_layout()
         
         # Create canvas to display the chart
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
+        canvas = self._get_chart_canvas("development", parent)
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill="both", expand=True)
         
         # Add legend to interpret the chart
@@ -1121,7 +1523,7 @@ class NuSui:
     def setup_recom_tab(self, parent):
         """Configures the recommendations tab"""
         # If there is no configuration, show message
-        if not self.crankset_teeth or not self.cassette_teeth:
+        if not self.crankset_teeth.size or not self.cassette_teeth.size:
             ttk.Label(parent, text="Please configure your bicycle first in the 'My Bicycle' tab",
                      font=("Arial", 12)).pack(pady=LARGE_PADDING)
             return
@@ -1141,13 +1543,14 @@ class NuSui:
         # Desired speed
         ttk.Label(form_frame, text="Desired speed (km/h):").pack(anchor="w", pady=PADDING)
         
-        self.target_speed_var = tk.StringVar(value="20")
+        self.target_speed_var = tk.IntVar(value=20)
         speed_frame = ttk.Frame(form_frame)
         speed_frame.pack(fill="x", pady=PADDING, padx=LARGE_PADDING)
         
+        # ttk.Scale writes fractional values to its variable, the command snaps them to whole numbers
         ttk.Scale(speed_frame, from_=5, to=50, orient="horizontal", 
                  variable=self.target_speed_var, length=200,
-                 command=lambda s: self.target_speed_var.set(str(int(float(s))))).pack(side="left")
+                 command=lambda s: self.target_speed_var.set(int(float(s)))).pack(side="left")
         
         ttk.Label(speed_frame, textvariable=self.target_speed_var).pack(side="left", padx=PADDING)
         ttk.Label(speed_frame, text="km/h").pack(side="left")
@@ -1155,13 +1558,13 @@ class NuSui:
         # Slope
         ttk.Label(form_frame, text="Slope (%):").pack(anchor="w", pady=PADDING)
         
-        self.slope_var = tk.StringVar(value="0")
+        self.slope_var = tk.IntVar(value=0)
         slope_frame = ttk.Frame(form_frame)
         slope_frame.pack(fill="x", pady=PADDING, padx=LARGE_PADDING)
         
         ttk.Scale(slope_frame, from_=-10, to=20, orient="horizontal", 
                  variable=self.slope_var, length=200,
-                 command=lambda s: self.slope_var.set(str(int(float(s))))).pack(side="left")
+                 command=lambda s: self.slope_var.set(int(float(s)))).pack(side="left")
         
         ttk.Label(slope_frame, textvariable=self.slope_var).pack(side="left", padx=PADDING)
         ttk.Label(slope_frame, text="%").pack(side="left")
@@ -1176,8 +1579,10 @@ class NuSui:
                   command=self.calculate_recommended_gear).pack(pady=LARGE_PADDING)
         
         # Right panel - Results
-        self.results_frame = ttk.LabelFrame(main_frame, text="Recommendation")
-        self.results_frame.pack(side="right", fill="both", expand=True, padx=PADDING, pady=PADDING)
+        results_box = ttk.LabelFrame(main_frame, text="Recommendation")
+        results_box.pack(side="right", fill="both", expand=True, padx=PADDING, pady=PADDING)
+        self.results_frame = ttk.Frame(results_box)
+        self.results_frame.pack(fill="both", expand=True)
         
         # Initial message
         ttk.Label(self.results_frame, text="Complete the form and press 'Calculate' to get\na gear recommendation.",
@@ -1186,130 +1591,91 @@ class NuSui:
     @handle_errors
     def calculate_recommended_gear(self):
         """Calculates and displays the recommended gear according to parameters, avoiding chain crossings"""
-        # Clear results panel
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
+        # Clear results panel: destroying its content frame removes all the widgets in a single Tk call
+        results_box = self.results_frame.master
+        self.results_frame.destroy()
+        self.results_frame = ttk.Frame(results_box)
+        self.results_frame.pack(fill="both", expand=True)
         
         # Get parameters
-        target_speed = float(self.target_speed_var.get())
-        slope = float(self.slope_var.get())
-        cadence = int(self.cadencia_var.get())
+        target_speed = self.target_speed_var.get()
+        slope = self.slope_var.get()
+        cadence = self._cadence
         
         # Calculate all gears and their speeds, avoiding chain crossings
-        best_chainring = None
-        best_sprocket = None
-        min_diff = float('inf')
-        
-        for i, chainring in enumerate(self.crankset_teeth):
-            for j, sprocket in enumerate(self.cassette_teeth):
-                # Verify if this combination crosses the chain
-                crossing, _ = self.is_chain_crossing(i, j)
-                if crossing:
-                    continue  # Skip this combination
-                
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                speed = self.calculate_speed(gear_ratio, cadence)
-                
-                # Adjust speed according to slope (simplification)
-                adjusted_speed = speed * (1 - slope/100 * 0.1)
-                
-                # Find the gear closest to the desired speed
-                diff = abs(adjusted_speed - target_speed)
-                if diff < min_diff:
-                    min_diff = diff
-                    best_chainring = chainring
-                    best_sprocket = sprocket
-        
-        # If we didn't find any valid gear (all cross the chain), find the smallest difference regardless of crossings
-        if best_chainring is None:
-            min_diff = float('inf')
-            for i, chainring in enumerate(self.crankset_teeth):
-                for j, sprocket in enumerate(self.cassette_teeth):
-                    gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                    speed = self.calculate_speed(gear_ratio, cadence)
-                    
-                    # Adjust speed according to slope
-                    adjusted_speed = speed * (1 - slope/100 * 0.1)
-                    
-                    diff = abs(adjusted_speed - target_speed)
-                    if diff < min_diff:
-                        min_diff = diff
-                        best_chainring = chainring
-                        best_sprocket = sprocket
-                        best_i = i
-                        best_j = j
-            
-            # Verify if the best option crosses the chain
-            crossing, crossing_message = self.is_chain_crossing(best_i, best_j)
-        else:
-            crossing = False
-            crossing_message = None
+        ratios, speeds, developments = self._compute_matrices(cadence)
+        slope_factor = 1 - slope/100 * 0.1  # Speed lost to the slope, the same for every gear
+        diff = speeds * slope_factor
+        diff -= target_speed
+        np.abs(diff, out=diff)
+        # Skip the chain crossings, unless every gear crosses the chain (then take the closest one regardless)
+        if not self._crossing_mask.all():
+            diff[self._crossing_mask] = np.inf
+        best_i, best_j = np.unravel_index(np.argmin(diff), diff.shape)
+        best_chainring = self.crankset_teeth[best_i]
+        best_sprocket = self.cassette_teeth[best_j]
+        crossing = self._crossing_mask[best_i, best_j]
         
         # Show recommendation
-        if best_chainring and best_sprocket:
-            gear_ratio = self.calculate_gear_ratio(best_chainring, best_sprocket)
-            actual_speed = self.calculate_speed(gear_ratio, cadence)
-            
-            # Title with recommendation
-            ttk.Label(self.results_frame, text=f"Recommended gear: {best_chainring}T / {best_sprocket}T", 
-                     font=("Arial", 14, "bold")).pack(pady=PADDING)
-            
-            # Visual explanation (simple)
-            chainring_idx = self.crankset_teeth.index(best_chainring) + 1
-            sprocket_idx = self.cassette_teeth.index(best_sprocket) + 1
-            
-            if len(self.crankset_teeth) == 3:  # Triple chainring
-                chainring_desc = "small" if chainring_idx == 3 else ("middle" if chainring_idx == 2 else "large")
-            elif len(self.crankset_teeth) == 2:  # Double chainring
-                chainring_desc = "small" if chainring_idx == 2 else "large"
-            else:
-                chainring_desc = f"#{chainring_idx}"
-                
-            ttk.Label(self.results_frame, text=f"Use the {chainring_desc} chainring (of {len(self.crankset_teeth)}) and sprocket #{sprocket_idx} (of {len(self.cassette_teeth)})",
-                     wraplength=400).pack(pady=PADDING)
-            
-            # Technical details
-            details_frame = ttk.Frame(self.results_frame)
-            details_frame.pack(fill="x", pady=PADDING)
-            
-            ttk.Label(details_frame, text=f"Estimated speed:").grid(row=0, column=0, sticky="w", padx=PADDING)
-            ttk.Label(details_frame, text=f"{actual_speed:.1f} km/h").grid(row=0, column=1, sticky="e")
-            
-            ttk.Label(details_frame, text=f"Gear ratio:").grid(row=1, column=0, sticky="w", padx=PADDING)
-            ttk.Label(details_frame, text=f"{gear_ratio:.2f}").grid(row=1, column=1, sticky="e")
+        gear_ratio = ratios[best_i, best_j]
+        actual_speed = speeds[best_i, best_j]
+        
+        # Title with recommendation
+        ttk.Label(self.results_frame, text=f"Recommended gear: {best_chainring}T / {best_sprocket}T", 
+                 font=("Arial", 14, "bold")).pack(pady=PADDING)
+        
+        # Visual explanation (simple)
+        chainring_idx = best_i + 1
+        sprocket_idx = best_j + 1
+        
+        if len(self.crankset_teeth) == 3:  # Triple chainring
+            chainring_desc = "small" if chainring_idx == 3 else ("middle" if chainring_idx == 2 else "large")
+        elif len(self.crankset_teeth) == 2:  # Double chainring
+            chainring_desc = "small" if chainring_idx == 2 else "large"
+        else:
+            chainring_desc = f"#{chainring_idx}"
             
-            ttk.Label(details_frame, text=f"Development:").grid(row=2, column=0, sticky="w", padx=PADDING)
-            development = gear_ratio * self.wheel_sizes[self.wheel_size_var.get()]
-            ttk.Label(details_frame, text=f"{development:.2f} meters/pedal stroke").grid(row=2, column=1, sticky="e")
+        ttk.Label(self.results_frame, text=f"Use the {chainring_desc} chainring (of {len(self.crankset_teeth)}) and sprocket #{sprocket_idx} (of {len(self.cassette_teeth)})",
+                 wraplength=400).pack(pady=PADDING)
+        
+        # Technical details
+        details_frame = ttk.Frame(self.results_frame)
+        details_frame.pack(fill="x", pady=PADDING)
+        
+        development = developments[best_i, best_j]
+        ttk.Label(details_frame, text="Estimated speed:\nGear ratio:\nDevelopment:",
+                  justify="left").grid(row=0, column=0, sticky="w", padx=PADDING)
+        ttk.Label(details_frame, text=f"{actual_speed:.1f} km/h\n{gear_ratio:.2f}\n{development:.2f} meters/pedal stroke",
+                  justify="right").grid(row=0, column=1, sticky="e")
+        
+        # Show warning if it crosses the chain
+        if crossing:
+            warning_frame = ttk.Frame(self.results_frame)
+            warning_frame.pack(fill="x", pady=PADDING)
             
-            # Show warning if it crosses the chain
-            if crossing:
-                warning_frame = ttk.Frame(self.results_frame)
-                warning_frame.pack(fill="x", pady=PADDING)
-                
-                warning_icon = ttk.Label(warning_frame, text="⚠️", font=("Arial", 12), foreground="red")
-                warning_icon.pack(side="left", padx=(0, PADDING))
-                
-                warning_text = "WARNING: This combination crosses the chain. "
-                warning_text += "No optimal combination was found that does not cross the chain for the specified speed and slope. "
-                warning_text += "It is recommended to use this gear only briefly and adjust the target speed."
-                
-                warning_label = ttk.Label(warning_frame, text=warning_text, 
-                                       wraplength=400, foreground="red", justify="left")
-                warning_label.pack(side="left")
+            warning_icon = ttk.Label(warning_frame, text="⚠️", font=("Arial", 12), foreground="red")
+            warning_icon.pack(side="left", padx=(0, PADDING))
             
-            # Tips according to slope
-            if slope > 8:
-                advice = "For steep slopes, maintain a high cadence and use lighter gears to avoid straining your knees."
-            elif slope > 0:
-                advice = "Maintain a constant cadence. If you feel you're exerting too much force, switch to a lighter gear."
-            elif slope < -5:
-                advice = "On descents, you can use harder gears or simply stop pedaling if the speed is high."
-            else:
-                advice = "On flat terrain, try to maintain a comfortable cadence (80-90 RPM) and adjust the gear according to the wind and your physical condition."
+            warning_text = "WARNING: This combination crosses the chain. "
+            warning_text += "No optimal combination was found that does not cross the chain for the specified speed and slope. "
+            warning_text += "It is recommended to use this gear only briefly and adjust the target speed."
             
-            ttk.Label(self.results_frame, text="Tip:", font=("Arial", 10, "bold")).pack(anchor="w", pady=(PADDING, 0))
-            ttk.Label(self.results_frame, text=advice, wraplength=400).pack(anchor="w", padx=PADDING)
+            warning_label = ttk.Label(warning_frame, text=warning_text, 
+                                   wraplength=400, foreground="red", justify="left")
+            warning_label.pack(side="left")
+        
+        # Tips according to slope
+        if slope > 8:
+            advice = "For steep slopes, maintain a high cadence and use lighter gears to avoid straining your knees."
+        elif slope > 0:
+            advice = "Maintain a constant cadence. If you feel you're exerting too much force, switch to a lighter gear."
+        elif slope < -5:
+            advice = "On descents, you can use harder gears or simply stop pedaling if the speed is high."
+        else:
+            advice = "On flat terrain, try to maintain a comfortable cadence (80-90 RPM) and adjust the gear according to the wind and your physical condition."
+        
+        ttk.Label(self.results_frame, text="Tip:", font=("Arial", 10, "bold")).pack(anchor="w", pady=(PADDING, 0))
+        ttk.Label(self.results_frame, text=advice, wraplength=400).pack(anchor="w", padx=PADDING)
 
     @handle_errors
     def setup_tech_tab(self, parent):
@@ -1323,7 +1689,7 @@ class NuSui:
                  wraplength=800).pack(pady=PADDING)
         
         # If there is no configuration, show message
-        if not self.crankset_teeth or not self.cassette_teeth:
+        if not self.crankset_teeth.size or not self.cassette_teeth.size:
             ttk.Label(parent, text="Please configure your bicycle first in the 'My Bicycle' tab",
                      font=("Arial", 12)).pack(pady=LARGE_PADDING)
             return
@@ -1344,12 +1710,36 @@ class NuSui:
         overlap_tab = ttk.Frame(tech_notebook)
         tech_notebook.add(overlap_tab, text="Overlap")
         
-        # Configure each technical tab
-        self.setup_ratio_tab(ratio_tab)
-        self.setup_power_tab(power_tab)
-        self.setup_overlap_tab(overlap_tab)
+        self._tech_notebook = tech_notebook
+        self._tech_tabs = (ratio_tab, power_tab, overlap_tab)
+        tech_notebook.bind("<<NotebookTabChanged>>", self._on_tech_tab_changed)
+        self._fill_tech_tabs()
+        # The tabs now match this configuration, update_tech_tab refills them only when it changes
+        self._tech_key = self._tech_config_key()
+
+    def _fill_tech_tabs(self) -> None:
+        """Marks the technical analysis tabs as outdated; each one is filled when it is shown"""
+        self._tech_tabs_built = [False] * len(self._tech_tabs)
+        self._on_tech_tab_changed()
+
+    def _on_tech_tab_changed(self, event=None) -> None:
+        """Fills the selected technical analysis tab if it belongs to an older configuration, keeping its chart canvas"""
+        selected = self._tech_notebook.index("current")
+        if self._tech_tabs_built[selected]:
+            return
+        self._tech_tabs_built[selected] = True
+        
+        tab = self._tech_tabs[selected]
+        chart_widgets = {str(canvas.get_tk_widget()) for canvas in self._chart_canvases.values()}
+        for widget in tab.winfo_children():
+            if str(widget) not in chart_widgets:
+                widget.destroy()
+        
+        # Configure the tab with its own setup
+        (self.setup_ratio_tab, self.setup_power_tab, self.setup_overlap_tab)[selected](tab)
 
     @handle_errors
+    @holding_draw_lock
     def setup_ratio_tab(self, parent):
         """Configures the technical tab for gear ratio"""
         # Create title
@@ -1357,28 +1747,13 @@ class NuSui:
                  font=("Arial", 12, "bold")).pack(pady=PADDING)
         
         # Create chart
-        fig, ax = plt.subplots(figsize=CHART_SIZE)
+        fig, ax = self._get_chart_figure("ratio")
         
         # Prepare data
-        combinations = []
-        ratios = []
-        colors = []
-        
-        color_map = {
-            0: 'red',      # First chainring (largest)
-            1: 'blue',     # Second chainring
-            2: 'green'     # Third chainring (if it exists)
-        }
-        
-        for i, chainring in enumerate(self.crankset_teeth):
-            for sprocket in self.cassette_teeth:
-                combinations.append(f"{chainring}/{sprocket}")
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                ratios.append(gear_ratio)
-                colors.append(color_map.get(i, 'gray'))
+        ratios = self._ratio.ravel()  # Row by row, in the same order as the combinations
         
         # Create bar chart
-        bars = ax.bar(combinations, ratios, color=colors)
+        bars = ax.bar(self._combo_labels, ratios, color=self._combo_colors)
         
         # Reference lines for optimal range
         ax.axhline(y=2.5, color='gray', linestyle='--', alpha=0.5)
@@ -1391,36 +1766,20 @@ class NuSui:
         ax.tick_params(axis='x', rotation=90)
         
         # Legend for colors
-        legend_elements = []
-        for i, chainring in enumerate(self.crankset_teeth):
-            legend_elements.append(plt.Line2D([0], [0], color=color_map.get(i, 'gray'), lw=4, label=f'Chainring {chainring}T'))
-        legend_elements.append(plt.Line2D([0], [0], color='gray', linestyle='--', label='Optimal range (2.5-5.0)'))
-        ax.legend(handles=legend_elements)
+        ax.legend(handles=[*self._chainring_legend(4), _OPTIMAL_RANGE_HANDLE])
         
         # Adjust layout
         fig.tight_layout()
         
         # Create canvas to display the chart
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
+        canvas = self._get_chart_canvas("ratio", parent)
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill="both", expand=True)
         
         # Technical explanation
-        explanation = """
-        The gear ratio is the number of teeth on the chainring divided by the number of teeth on the sprocket. 
-        A higher value indicates a "harder" gear (for speed), while a lower value indicates a "lighter" gear (for climbing).
-        
-        In general:
-        • Values > 5.0: Very hard gears for descents or speed
-        • Values 2.5-5.0: Optimal range for normal use
-        • Values < 2.5: Light gears for climbing
-        
-        The total range of ratios on your bicycle directly affects its versatility.
-        """
-        
         explanation_text = scrolledtext.ScrolledText(parent, wrap=tk.WORD, height=6)
         explanation_text.pack(fill="x", expand=False, padx=PADDING, pady=PADDING)
-        explanation_text.insert(tk.END, explanation)
+        explanation_text.insert(tk.END, _RATIO_EXPLANATION)
         explanation_text.config(state="disabled")
 
     @handle_errors
@@ -1436,89 +1795,55 @@ class NuSui:
         
         # Chainring/sprocket selector
         ttk.Label(control_frame, text="Chainring:").grid(row=0, column=0, padx=PADDING)
-        self.power_plato_var = tk.StringVar(value=str(self.crankset_teeth[0]))
+        self.power_plato_var = tk.IntVar(value=int(self.crankset_teeth[0]))
         plato_combo = ttk.Combobox(control_frame, textvariable=self.power_plato_var, 
-                                   values=[str(t) for t in self.crankset_teeth], width=5)
+                                   values=self.crankset_teeth.tolist(), width=5, state="readonly")
         plato_combo.grid(row=0, column=1, padx=PADDING)
         
         ttk.Label(control_frame, text="Sprocket:").grid(row=0, column=2, padx=PADDING)
-        self.power_piñon_var = tk.StringVar(value=str(self.cassette_teeth[len(self.cassette_teeth)//2]))
+        self.power_piñon_var = tk.IntVar(value=int(self.cassette_teeth[len(self.cassette_teeth)//2]))
         piñon_combo = ttk.Combobox(control_frame, textvariable=self.power_piñon_var, 
-                                   values=[str(t) for t in self.cassette_teeth], width=5)
+                                   values=self.cassette_teeth.tolist(), width=5, state="readonly")
         piñon_combo.grid(row=0, column=3, padx=PADDING)
         
         ttk.Button(control_frame, text="Update chart", 
-                  command=lambda: self.update_power_chart(chart_frame)).grid(row=0, column=4, padx=LARGE_PADDING)
-        
-        # Frame for chart
-        chart_frame = ttk.Frame(parent)
-        chart_frame.pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+                  command=self.update_power_chart).grid(row=0, column=4, padx=LARGE_PADDING)
         
-        # Create initial chart
-        self.update_power_chart(chart_frame)
+        # Create the chart the first time, later configurations only update it
+        canvas = self._chart_canvases.get("power")
+        if canvas is None or not canvas.get_tk_widget().winfo_exists():
+            self.create_power_chart(parent)
+        else:
+            # Pack it again after the rebuilt controls
+            canvas.get_tk_widget().pack_forget()
+            canvas.get_tk_widget().pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+        self.update_power_chart()
         
         # Technical explanation
-        explanation = """
-        This chart shows the relationship between cadence, speed, and estimated power for a specific chainring/sprocket combination.
-        
-        The power is an estimate based on a simplified model, considering the aerodynamic resistance that increases exponentially with speed.
-        
-        Key observations:
-        • For the same gear, increasing cadence linearly increases speed
-        • Power required increases exponentially with speed
-        • The optimal cadence is usually between 80-90 RPM for most cyclists
-        • At very low cadences (<60 RPM) you strain your joints more, while very high cadences (>100 RPM) are less energy efficient
-        """
-        
         explanation_text = scrolledtext.ScrolledText(parent, wrap=tk.WORD, height=8)
         explanation_text.pack(fill="x", expand=False, padx=PADDING, pady=PADDING)
-        explanation_text.insert(tk.END, explanation)
+        explanation_text.insert(tk.END, _POWER_EXPLANATION)
         explanation_text.config(state="disabled")
 
     @handle_errors
-    def update_power_chart(self, parent):
-        """Updates the power vs cadence chart"""
-        # Clear frame
-        for widget in parent.winfo_children():
-            widget.destroy()
-        
-        # Get selected values
-        try:
-            chainring = int(self.power_plato_var.get())
-            sprocket = int(self.power_piñon_var.get())
-        except ValueError:
-            messagebox.showwarning("Invalid value", "Please select valid numerical values")
-            return
-        
-        # Create figure with two Y axes
-        fig, ax1 = plt.subplots(figsize=CHART_SIZE)
+    def create_power_chart(self, parent):
+        """Creates the power vs cadence chart, update_power_chart shows the selected gear on it"""
+        # Create figure with two Y axes; its layout is adjusted by the drawing thread on every render
+        fig = Figure(figsize=CHART_SIZE, layout="tight")
+        ax1 = fig.add_subplot()
         ax2 = ax1.twinx()
         
         # Range of cadences to evaluate
         cadences = np.arange(60, 110, 2)
         
-        # Calculate speeds and powers for each cadence
-        gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-        speeds = []
-        powers = []
-        
-        for cadence in cadences:
-            speed = self.calculate_speed(gear_ratio, cadence)
-            speeds.append(speed)
-            powers.append(self.calculate_power_estimate(speed))
-        
         # Optimal cadence zone
-        optimal_min_idx = np.abs(cadences - OPTIMAL_CADENCE_MIN).argmin()
-        optimal_max_idx = np.abs(cadences - OPTIMAL_CADENCE_MAX).argmin()
+        optimal_min_idx, optimal_max_idx = np.searchsorted(cadences, (OPTIMAL_CADENCE_MIN, OPTIMAL_CADENCE_MAX)).tolist()
         
-        # Plot speed vs cadence
-        line1, = ax1.plot(cadences, speeds, 'b-', label='Speed')
-        ax1.fill_between(cadences[optimal_min_idx:optimal_max_idx+1], 
-                        0, max(speeds)*1.1, 
-                        color='gray', alpha=0.1, label='Optimal cadence range')
-        
-        # Plot power vs cadence
-        line2, = ax2.plot(cadences, powers, 'r-', label='Estimated power')
+        # Plot speed and power vs cadence (update_power_chart sets the data of the selected gear)
+        line1, = ax1.plot(cadences, np.zeros(len(cadences)), 'b-', label='Speed')
+        ax1.axvspan(cadences[optimal_min_idx], cadences[optimal_max_idx],
+                    color='gray', alpha=0.1, label='Optimal cadence range')
+        line2, = ax2.plot(cadences, np.zeros(len(cadences)), 'r-', label='Estimated power')
         
         # Configure axes
         ax1.set_xlabel('Cadence (RPM)')
@@ -1528,23 +1853,47 @@ class NuSui:
         ax2.set_ylabel('Estimated power (relative units)', color='r')
         ax2.tick_params(axis='y', labelcolor='r')
         
-        # Title
-        plt.title(f'Speed and power for combination {chainring}T / {sprocket}T')
-        
         # Combined legend
         lines = [line1, line2]
         labels = [line.get_label() for line in lines]
         ax1.legend(lines, labels, loc='upper left')
         
-        # Adjust layout
-        fig.tight_layout()
-        
         # Show chart
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        canvas = BackgroundFigureCanvas(fig, parent, self._request_draw, self._draw_lock)
+        canvas.get_tk_widget().pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+        self._chart_canvases["power"] = canvas
+        self._power_canvas = canvas
+        self._power_axes = (ax1, ax2)
+        self._power_lines = (line1, line2)
+
+    @handle_errors
+    def update_power_chart(self):
+        """Updates the power vs cadence chart with the selected chainring and sprocket"""
+        # Get selected values (the read-only comboboxes only hold teeth of the configuration)
+        chainring = self.power_plato_var.get()
+        sprocket = self.power_piñon_var.get()
+        
+        ax1, ax2 = self._power_axes
+        line1, line2 = self._power_lines
+        cadences = line1.get_xdata()
+        
+        # Calculate speeds and powers for each cadence (the formulas work element-wise on the array)
+        gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
+        speeds = self.calculate_speed(gear_ratio, cadences)
+        powers = self.calculate_power_estimate(speeds)
+        
+        # Update the lines, axes and title of the existing chart; the drawing thread may be rendering it
+        with self._draw_lock:
+            line1.set_ydata(speeds)
+            line2.set_ydata(powers)
+            ax1.set_ylim(0, speeds.max()*1.1)
+            ax2.relim()
+            ax2.autoscale_view()
+            ax2.set_title(f'Speed and power for combination {chainring}T / {sprocket}T')
+        self._power_canvas.draw_idle()
 
     @handle_errors
+    @holding_draw_lock
     def setup_overlap_tab(self, parent):
         """Configures the technical tab for gear overlap"""
         # Create title
@@ -1552,52 +1901,22 @@ class NuSui:
                  font=("Arial", 12, "bold")).pack(pady=PADDING)
         
         # Create chart
-        fig, ax = plt.subplots(figsize=CHART_SIZE)
+        fig, ax = self._get_chart_figure("overlap")
         
-        # Prepare data
-        all_ratios = []
-        colors = []
-        labels = []
-        
-        color_map = {
-            0: 'red',
-            1: 'blue',
-            2: 'green'
-        }
-        
-        # Markers for chain crossings
-        crosses = []
-        
-        # Calculate ratios for each chainring
+        # Plot the ratios of each chainring, read from the matrices cached for the configuration
+        sprocket_positions = np.arange(len(self.cassette_teeth))
         for i, chainring in enumerate(self.crankset_teeth):
-            ratios = []
-            cross_positions = []
-            for j, sprocket in enumerate(self.cassette_teeth):
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                ratios.append(gear_ratio)
-                
-                # Verify chain crossing
-                crossing, _ = self.is_chain_crossing(i, j)
-                cross_positions.append(crossing)
-            
-            # Add to chart
-            line, = ax.plot(range(len(self.cassette_teeth)), ratios, '-', 
-                    color=color_map.get(i, 'gray'), label=f"Chainring {chainring}T")
+            color = _chainring_color(i)
+            ratios, crosses = self._ratio[i], self._crossing_mask[i]
             
-            # Mark points without chain crossing
-            safe_x = [j for j in range(len(self.cassette_teeth)) if not cross_positions[j]]
-            safe_y = [ratios[j] for j in range(len(ratios)) if not cross_positions[j]]
-            ax.plot(safe_x, safe_y, 'o', color=color_map.get(i, 'gray'))
+            # Add to chart, with markers only on the points without chain crossing
+            ax.plot(sprocket_positions, ratios, '-o', color=color, markevery=np.flatnonzero(~crosses),
+                    label=f"Chainring {chainring}T")
             
             # Mark points with chain crossing
-            cross_x = [j for j in range(len(self.cassette_teeth)) if cross_positions[j]]
-            cross_y = [ratios[j] for j in range(len(ratios)) if cross_positions[j]]
-            if cross_x:
-                ax.plot(cross_x, cross_y, 'x', color=color_map.get(i, 'gray'), markersize=8, alpha=0.7)
-            
-            # Save for overlap analysis
-            all_ratios.append(ratios)
-            crosses.append(cross_positions)
+            if crosses.any():
+                crossing = np.flatnonzero(crosses)
+                ax.plot(crossing, ratios[crossing], 'x', color=color, markersize=8, alpha=0.7)
         
         # Configure chart
         ax.set_xlabel('Sprocket position')
@@ -1606,26 +1925,18 @@ class NuSui:
         ax.grid(True, linestyle='--', alpha=0.7)
         
         # X-axis labels
-        ax.set_xticks(range(len(self.cassette_teeth)))
-        ax.set_xticklabels([str(t) for t in self.cassette_teeth])
+        ax.set_xticks(sprocket_positions)
+        ax.set_xticklabels(self.cassette_teeth.tolist())
         
-        # Legend
-        legend_elements = []
-        for i, chainring in enumerate(self.crankset_teeth):
-            legend_elements.append(plt.Line2D([0], [0], color=color_map.get(i, 'gray'), lw=2, label=f'Chainring {chainring}T'))
-        
-        # Add legend for chain crossings
-        legend_elements.append(plt.Line2D([0], [0], marker='o', color='gray', linestyle='None', label='Safe combination'))
-        legend_elements.append(plt.Line2D([0], [0], marker='x', color='gray', linestyle='None', label='Chain crossing'))
-        
-        ax.legend(handles=legend_elements)
+        # Legend, with the entries for chain crossings
+        ax.legend(handles=[*self._chainring_legend(2), *_CROSSING_HANDLES])
         
         # Adjust layout
         fig.tight_layout()
         
         # Create canvas to display the chart
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
+        canvas = self._get_chart_canvas("overlap", parent)
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill="both", expand=True)
         
         # Panel for overlap analysis
@@ -1633,26 +1944,25 @@ class NuSui:
         overlap_frame.pack(fill="x", padx=PADDING, pady=PADDING)
         
         # Calculate and show overlap
-        overlap_text = self.calculate_overlap_analysis(all_ratios, crosses)
+        overlap_text = self.calculate_overlap_analysis(self._ratio, self._crossing_mask)
         
         overlap_info = scrolledtext.ScrolledText(overlap_frame, wrap=tk.WORD, height=8)
         overlap_info.pack(fill="x", expand=False, padx=PADDING, pady=PADDING)
         overlap_info.insert(tk.END, overlap_text)
         overlap_info.config(state="disabled")
 
-    @handle_errors
     def calculate_overlap_analysis(self, all_ratios, crosses=None):
         """
         Calculates and prepares a gear overlap analysis
         
         Args:
-            all_ratios: List of lists with the ratios of each chainring
-            crosses: List of lists with the chain crossings (optional)
+            all_ratios: Matrix with the ratios of each chainring (rows = chainrings)
+            crosses: Boolean matrix with the chain crossings (optional)
         """
         if len(all_ratios) <= 1:
             return "At least two chainrings are needed to analyze overlap."
         
-        result = "Overlap analysis between chainrings:\n\n"
+        parts = ["Overlap analysis between chainrings:\n\n"]
         
         # Analyze overlap between adjacent chainrings
         for i in range(len(all_ratios) - 1):
@@ -1663,34 +1973,34 @@ class NuSui:
             ratios2 = all_ratios[i + 1]
             
             # If we have crossing information, filter the ratios
-            if crosses:
+            if crosses is not None:
                 # Filter ratios from chainring 1 that don't cross the chain
-                filtered_ratios1 = [ratios1[j] for j in range(len(ratios1)) if not crosses[i][j]]
+                filtered_ratios1 = ratios1[~crosses[i]]
                 # Filter ratios from chainring 2 that don't cross the chain
-                filtered_ratios2 = [ratios2[j] for j in range(len(ratios2)) if not crosses[i+1][j]]
+                filtered_ratios2 = ratios2[~crosses[i + 1]]
                 
                 # If there are no valid gears after filtering, use the originals
-                if filtered_ratios1 and filtered_ratios2:
-                    min_ratio1 = min(filtered_ratios1)
-                    max_ratio1 = max(filtered_ratios1)
-                    min_ratio2 = min(filtered_ratios2)
-                    max_ratio2 = max(filtered_ratios2)
+                if filtered_ratios1.size and filtered_ratios2.size:
+                    min_ratio1 = filtered_ratios1.min()
+                    max_ratio1 = filtered_ratios1.max()
+                    min_ratio2 = filtered_ratios2.min()
+                    max_ratio2 = filtered_ratios2.max()
                     
-                    result += f"Between chainring {chainring1}T and {chainring2}T (without chain crossings):\n"
+                    parts.append(f"Between chainring {chainring1}T and {chainring2}T (without chain crossings):\n")
                 else:
-                    min_ratio1 = min(ratios1)
-                    max_ratio1 = max(ratios1)
-                    min_ratio2 = min(ratios2)
-                    max_ratio2 = max(ratios2)
+                    min_ratio1 = ratios1.min()
+                    max_ratio1 = ratios1.max()
+                    min_ratio2 = ratios2.min()
+                    max_ratio2 = ratios2.max()
                     
-                    result += f"Between chainring {chainring1}T and {chainring2}T (including chain crossings):\n"
+                    parts.append(f"Between chainring {chainring1}T and {chainring2}T (including chain crossings):\n")
             else:
-                min_ratio1 = min(ratios1)
-                max_ratio1 = max(ratios1)
-                min_ratio2 = min(ratios2)
-                max_ratio2 = max(ratios2)
+                min_ratio1 = ratios1.min()
+                max_ratio1 = ratios1.max()
+                min_ratio2 = ratios2.min()
+                max_ratio2 = ratios2.max()
                 
-                result += f"Between chainring {chainring1}T and {chainring2}T:\n"
+                parts.append(f"Between chainring {chainring1}T and {chainring2}T:\n")
             
             # Calculate overlap
             overlap_start = max(min_ratio1, min_ratio2)
@@ -1698,66 +2008,87 @@ class NuSui:
             
             if overlap_start <= overlap_end:
                 overlap_pct = (overlap_end - overlap_start) / (max_ratio1 - min_ratio1) * 100
-                result += f"- Overlap range: {overlap_start:.2f} to {overlap_end:.2f}\n"
-                result += f"- Overlap percentage: {overlap_pct:.1f}%\n"
+                parts.append(f"- Overlap range: {overlap_start:.2f} to {overlap_end:.2f}\n"
+                             f"- Overlap percentage: {overlap_pct:.1f}%\n")
                 
                 if overlap_pct < 10:
-                    result += "- Evaluation: Low overlap. There may be 'gaps' when changing chainrings.\n"
+                    parts.append("- Evaluation: Low overlap. There may be 'gaps' when changing chainrings.\n")
                 elif overlap_pct < 30:
-                    result += "- Evaluation: Moderate overlap. Balanced configuration.\n"
+                    parts.append("- Evaluation: Moderate overlap. Balanced configuration.\n")
                 else:
-                    result += "- Evaluation: High overlap. There are many redundant gears.\n"
+                    parts.append("- Evaluation: High overlap. There are many redundant gears.\n")
             else:
-                result += f"- There is no overlap between usable gears.\n"
+                parts.append(f"- There is no overlap between usable gears.\n")
                 
-            result += "\n"
+            parts.append("\n")
         
         # General range analysis
-        if crosses:
+        if crosses is not None:
             # Get ratios without chain crossings
-            all_filtered_ratios = []
-            for i, ratios in enumerate(all_ratios):
-                filtered = [ratios[j] for j in range(len(ratios)) if not crosses[i][j]]
-                if filtered:
-                    all_filtered_ratios.extend(filtered)
+            all_filtered_ratios = all_ratios[~crosses]
             
-            if all_filtered_ratios:
-                min_ratio = min(all_filtered_ratios)
-                max_ratio = max(all_filtered_ratios)
+            if all_filtered_ratios.size:
+                min_ratio = all_filtered_ratios.min()
+                max_ratio = all_filtered_ratios.max()
                 range_ratio = max_ratio / min_ratio
                 
-                result += f"Total gear range (without chain crossings): {range_ratio:.2f}x\n"
+                parts.append(f"Total gear range (without chain crossings): {range_ratio:.2f}x\n")
             else:
-                result += "Cannot calculate range without chain crossings.\n"
+                parts.append("Cannot calculate range without chain crossings.\n")
         
         # Also calculate total range including crossings
-        all_ratios_flat = [ratio for sublist in all_ratios for ratio in sublist]
-        min_ratio = min(all_ratios_flat)
-        max_ratio = max(all_ratios_flat)
+        min_ratio = all_ratios.min()
+        max_ratio = all_ratios.max()
         range_ratio = max_ratio / min_ratio
         
-        result += f"Total gear range (including chain crossings): {range_ratio:.2f}x\n"
+        parts.append(f"Total gear range (including chain crossings): {range_ratio:.2f}x\n")
         
         if range_ratio < 3:
-            result += "Evaluation: Limited range. Suitable for uniform terrain or specific use."
+            parts.append("Evaluation: Limited range. Suitable for uniform terrain or specific use.")
         elif range_ratio < 5:
-            result += "Evaluation: Moderate range. Good for general use."
+            parts.append("Evaluation: Moderate range. Good for general use.")
         else:
-            result += "Evaluation: Wide range. Excellent versatility for different terrains."
+            parts.append("Evaluation: Wide range. Excellent versatility for different terrains.")
         
-        return result
+        return "".join(parts)
+
+    def _tech_config_key(self) -> tuple:
+        """Key of the configuration the technical charts depend on: the teeth and, through the power chart, the wheel"""
+        return (self.crankset_teeth.tobytes(), self.cassette_teeth.tobytes(), self._wheel_idx)
 
     @handle_errors
     def update_tech_tab(self):
         """Updates the technical tab if there are changes in the configuration"""
-        if self.validate_gear_configuration():
+        if not self.validate_gear_configuration():
+            return
+        tech_key = self._tech_config_key()
+        if self._tech_tabs is None or not self._tech_tabs[0].winfo_exists():
+            # The tab structure is built once, later updates refill its tabs keeping the charts
             for widget in self.tech_tab.winfo_children():
                 widget.destroy()
             self.setup_scrollable_frame(self.tech_tab, self.setup_tech_tab)
+        elif tech_key != self._tech_key:
+            # Refill the tabs only if the configuration changed since the last update
+            self._fill_tech_tabs()
+        self._tech_key = tech_key
+
+    def _raise_info_window(self, name: str) -> bool:
+        """Shows again an info window that was already built; returns False if it still has to be built"""
+        window = self._info_windows.get(name)
+        if window is None or not window.winfo_exists():
+            return False
+        window.deiconify()
+        window.lift()
+        return True
 
     def show_basic_concepts(self):
         """Shows a window with basic cycling concepts"""
+        if self._raise_info_window("concepts"):
+            return
         concepts_window = tk.Toplevel(self.root)
+        # Closing only hides the window, the next call shows it again
+        concepts_window.protocol("WM_DELETE_WINDOW", concepts_window.withdraw)
+        self._info_windows["concepts"] = concepts_window
         concepts_window.title("Basic cycling concepts")
         concepts_window.geometry("600x500")
         
@@ -1769,67 +2100,20 @@ class NuSui:
         content = scrolledtext.ScrolledText(concepts_window, wrap=tk.WORD)
         content.pack(fill="both", expand=True, padx=LARGE_PADDING, pady=PADDING)
         
-        concepts_text = """
-        TRANSMISSION AND GEARS
-        
-        Chainrings (or crowns): These are the toothed discs attached to the pedals. They determine how much force is transmitted to the chain.
-        - Large chainrings (more teeth): Higher speed, require more force
-        - Small chainrings (fewer teeth): Lower speed, easier pedaling
-        
-        Sprockets (or cassette): Set of toothed discs on the rear wheel.
-        - Small sprockets (fewer teeth): Higher speed, require more force
-        - Large sprockets (more teeth): Lower speed, easier pedaling
-        
-        Gear ratio: Number of teeth on the chainring divided by the number of teeth on the sprocket. Indicates how many turns the wheel makes for each complete revolution of the pedals.
-        
-        Development: Distance traveled for each complete pedal stroke. It is calculated by multiplying the gear ratio by the wheel circumference.
-        
-        PEDALING CONCEPTS
-        
-        Cadence: The speed at which you pedal, measured in revolutions per minute (RPM).
-        - Low cadence (<70 RPM): Greater effort on each pedal stroke, more tension on joints
-        - Medium cadence (70-90 RPM): Optimal balance for most cyclists
-        - High cadence (>90 RPM): Less effort per pedal stroke, higher heart rate
-        
-        CHAIN CROSSING
-        
-        Chain crossing occurs when using extreme combinations:
-        - Large chainring (front) with large sprocket (rear)
-        - Small chainring (front) with small sprocket (rear)
-        
-        These combinations cause the chain to work at a pronounced diagonal angle, causing:
-        - Increased wear on the chain, chainrings, sprockets, and derailleur
-        - Loss of efficiency (you waste energy when pedaling)
-        - More noise during pedaling
-        - Risk of the chain coming off or getting damaged
-        
-        That's why, in this application, these combinations are marked or filtered.
-        The golden rule is: use combinations where the chain works as straight as possible.
-        
-        PROPER USE OF GEARS
-        
-        Basic principles:
-        1. Maintain a constant and comfortable cadence by adjusting gears
-        2. Anticipate terrain changes and shift before you need to
-        3. Avoid extreme combinations (chain crossing)
-        4. Shift sequentially, don't skip many gears at once
-        
-        Specific situations:
-        - Climbs: Use small chainrings and large sprockets to pedal with less effort
-        - Descents: Use large chainrings and small sprockets or stop pedaling if speed is high
-        - Flat terrain: Find a combination that allows you to maintain your ideal cadence
-        """
-        
-        content.insert(tk.END, concepts_text)
+        content.insert(tk.END, _CONCEPTS_TEXT)
         content.config(state="disabled")
         
         # Button to close
         ttk.Button(concepts_window, text="Close", 
-                  command=concepts_window.destroy).pack(pady=PADDING)
+                  command=concepts_window.withdraw).pack(pady=PADDING)
 
     def show_app_help(self):
         """Shows a window with help on using the application"""
+        if self._raise_info_window("help"):
+            return
         help_window = tk.Toplevel(self.root)
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        self._info_windows["help"] = help_window
         help_window.title("How to use the application")
         help_window.geometry("600x500")
         
@@ -1841,52 +2125,20 @@ class NuSui:
         content = scrolledtext.ScrolledText(help_window, wrap=tk.WORD)
         content.pack(fill="both", expand=True, padx=LARGE_PADDING, pady=PADDING)
         
-        help_text = """
-        QUICK USAGE GUIDE
-        
-        1. CONFIGURING YOUR BICYCLE (Tab "My Bicycle")
-           - Select the bicycle type most similar to yours
-           - Adjust the wheel size accordingly
-           - Set your usual cadence (if you're not sure, leave the default value)
-           - If you know exactly the configuration of your bicycle, use "Configure manually"
-           - Press "Visualize my bicycle" to continue
-        
-        2. VISUALIZATION (Tab "Visualization")
-           - Explore the "Gear table" to see what speed you'll reach with each combination
-           - Review the "Speed chart" to understand how each sprocket affects your speed
-           - Observe the "Development" to understand the distance traveled per pedal stroke
-        
-        3. RECOMMENDATIONS (Tab "Which Gear to Use?")
-           - Set your desired speed and the slope of the terrain
-           - Get a personalized recommendation of which gear to use
-           - Read the specific tips for your situation
-        
-        4. TECHNICAL ANALYSIS (Only in technical mode)
-           - Explore advanced analyses such as gear ratio, power, and overlap
-           - Useful for experienced cyclists who want to optimize their technique
-        
-        MODE CHANGE
-        
-        - Beginner Mode: Simplified interface with basic concepts
-        - Technical/Sport Mode: Access to advanced analyses and technical terms
-        
-        GENERAL TIPS
-        
-        - Experiment with different configurations to better understand how gears work
-        - Use the recommendations tab before going for a ride to plan which gears to use
-        - Consult the help or basic concepts if any term is unfamiliar to you
-        """
-        
-        content.insert(tk.END, help_text)
+        content.insert(tk.END, _HELP_TEXT)
         content.config(state="disabled")
         
         # Button to close
         ttk.Button(help_window, text="Close", 
-                  command=help_window.destroy).pack(pady=PADDING)
+                  command=help_window.withdraw).pack(pady=PADDING)
 
     def show_about(self):
         """Shows information about the application"""
+        if self._raise_info_window("about"):
+            return
         about_window = tk.Toplevel(self.root)
+        about_window.protocol("WM_DELETE_WINDOW", about_window.withdraw)
+        self._info_windows["about"] = about_window
         about_window.title("About")
         about_window.geometry("400x300")
         
@@ -1911,7 +2163,7 @@ class NuSui:
         
         # Button to close
         ttk.Button(about_window, text="Close", 
-                  command=about_window.destroy).pack(pady=PADDING)
+                  command=about_window.withdraw).pack(pady=PADDING)
 
 # Function to start the application
 def start_app():
@@ -1,11 +1,19 @@
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from types import MappingProxyType
+import functools
+import itertools
+import queue
+import threading
+import traceback
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import numpy as np
-import matplotlib
 
 # Application Constants
 APP_TITLE = "Ñu-sui: aprende a usar las velocidades de tu bici"
@@ -25,9 +33,13 @@ MAX_TEETH = 53
 PADDING = 10
 LARGE_PADDING = 20
 CHART_SIZE = (10, 6)
+CHART_DPI = 72
+DRAW_POLL_INTERVAL_MS = 33
+CADENCE_DEBOUNCE_MS = 50
+CHAINRING_COLORS = ("red", "blue", "green")  # Del plato más grande al tercero, el resto en gris
 
 # Configuración general para gráficos
-matplotlib.rcParams.update({'font.size': DEFAULT_FONT_SIZE})
+matplotlib.rcParams.update({'font.size': DEFAULT_FONT_SIZE, 'figure.dpi': CHART_DPI})
 
 # Diccionario para almacenar los tamaños de rueda y su circunferencia correspondiente en metros
 wheel_sizes = {
@@ -109,8 +121,223 @@ wheel_sizes = {
     "29x2.3": 2.326
 }
 
+# Nombres y circunferencias de rueda como secuencias paralelas de solo lectura
+_WHEEL_KEYS = tuple(wheel_sizes.keys())
+_WHEEL_CIRC = np.fromiter(wheel_sizes.values(), dtype=np.float64, count=len(wheel_sizes))
+_WHEEL_IDX = {name: i for i, name in enumerate(_WHEEL_KEYS)}
+wheel_sizes = MappingProxyType(wheel_sizes)
+
+# Tamaño de rueda predeterminado y valores del desplegable para cada tipo de bicicleta
+_WHEEL_OPTIONS = {
+    "mtb": ("26x2.1", ("26x2.1", "26x2.35", "27.5x2.10", "27.5x2.25", "29x2.1", "29x2.25", "29x2.3")),
+    "road": ("700x25C", ("700x23C", "700x25C", "700x28C", "700C")),
+    "urban": ("700x35C", ("700x35C", "700x38C", "700x40C", "26x1.75")),
+    "custom": ("700C", _WHEEL_KEYS)
+}
+
+@functools.lru_cache(maxsize=256)
+def _cached_grid(chain_key: bytes, spr_key: bytes, wheel_idx: int, cadence: int) -> np.ndarray:
+    """
+    Velocidades en km/h para cada combinación de plato y piñón (filas = platos)
+    
+    Los dientes llegan como los bytes de arrays np.int32 para que los argumentos sean hashables.
+    El resultado se comparte entre llamadas y por eso es de solo lectura.
+    """
+    chainrings = np.frombuffer(chain_key, dtype=np.int32).astype(np.float64)
+    sprockets = np.frombuffer(spr_key, dtype=np.int32).astype(np.float64)
+    grid = chainrings[:, None] / sprockets[None, :] * (_WHEEL_CIRC[wheel_idx] * cadence * 60 / 1000)
+    grid.flags.writeable = False
+    return grid
+
+# Entradas de leyenda que no dependen de la configuración
+_OPTIMAL_RANGE_HANDLE = Line2D([0], [0], color='gray', linestyle='--', label='Rango óptimo (2.5-5.0)')
+_CROSSING_HANDLES = (
+    Line2D([0], [0], marker='o', color='gray', linestyle='None', label='Combinación segura'),
+    Line2D([0], [0], marker='x', color='gray', linestyle='None', label='Cruce de cadena')
+)
+
+# Explicaciones estáticas de las pestañas técnicas, se insertan tal cual en sus cuadros de texto
+_RATIO_EXPLANATION = """
+        La relación de marchas (gear ratio) es el número de dientes del plato dividido entre los dientes del piñón. 
+        Un valor mayor indica una marcha más "dura" (para velocidad), mientras que un valor menor indica una marcha más "ligera" (para subidas).
+        
+        En general:
+        • Valores > 5.0: Marchas muy duras para descensos o velocidad
+        • Valores 2.5-5.0: Rango óptimo para uso normal
+        • Valores < 2.5: Marchas ligeras para subidas
+        
+        El rango total de relaciones de tu bicicleta afecta directamente su versatilidad.
+        """
+
+_POWER_EXPLANATION = """
+        Este gráfico muestra la relación entre cadencia, velocidad y potencia estimada para una combinación de plato/piñón.
+        
+        La potencia es una estimación basada en un modelo simplificado, considerando la resistencia aerodinámica que aumenta exponencialmente con la velocidad.
+        
+        Observaciones clave:
+        • Para una misma marcha, aumentar la cadencia aumenta linealmente la velocidad
+        • La potencia necesaria aumenta exponencialmente con la velocidad
+        • La cadencia óptima suele estar entre 80-90 RPM para la mayoría de ciclistas
+        • A cadencias muy bajas (<60 RPM) se fuerza más las articulaciones, mientras que cadencias muy altas (>100 RPM) son menos eficientes energéticamente
+        """
+
+# Textos de las ventanas de conceptos y de ayuda
+_CONCEPTS_TEXT = """
+        TRANSMISIÓN Y MARCHAS
+        
+        Platos (o coronas): Son los discos dentados unidos a los pedales. Determinan cuánta fuerza se transmite a la cadena.
+        - Platos grandes (más dientes): Mayor velocidad, requieren más fuerza
+        - Platos pequeños (menos dientes): Menor velocidad, pedaleo más fácil
+        
+        Piñones (o casete): Conjunto de discos dentados en la rueda trasera.
+        - Piñones pequeños (menos dientes): Mayor velocidad, requieren más fuerza
+        - Piñones grandes (más dientes): Menor velocidad, pedaleo más fácil
+        
+        Relación de marchas: Número de dientes del plato dividido por el número de dientes del piñón. Indica cuántas vueltas da la rueda por cada vuelta completa de los pedales.
+        
+        Desarrollo: Distancia recorrida por cada pedalada completa. Se calcula multiplicando la relación de marchas por la circunferencia de la rueda.
+        
+        CONCEPTOS DE PEDALEO
+        
+        Cadencia: Velocidad a la que se pedalea, medida en revoluciones por minuto (RPM).
+        - Cadencia baja (<70 RPM): Mayor esfuerzo en cada pedalada, mayor tensión en articulaciones
+        - Cadencia media (70-90 RPM): Equilibrio óptimo para la mayoría de ciclistas
+        - Cadencia alta (>90 RPM): Menor esfuerzo por pedalada, mayor frecuencia cardíaca
+        
+        CRUCE DE CADENA
+        
+        El cruce de cadena ocurre cuando se utilizan combinaciones extremas:
+        - Plato grande (delantero) con piñón grande (trasero)
+        - Plato pequeño (delantero) con piñón pequeño (trasero)
+        
+        Estas combinaciones provocan que la cadena trabaje en un ángulo diagonal pronunciado, causando:
+        - Mayor desgaste de la cadena, platos, piñones y desviador
+        - Pérdida de eficiencia (desperdicias energía al pedalear)
+        - Mayor ruido durante el pedaleo
+        - Riesgo de que la cadena se salga o se dañe
+        
+        Por eso, en esta aplicación, estas combinaciones están marcadas o filtradas.
+        La regla de oro es: usa combinaciones donde la cadena trabaje lo más recta posible.
+        
+        USO CORRECTO DE LAS MARCHAS
+        
+        Principios básicos:
+        1. Mantén una cadencia constante y cómoda ajustando las marchas
+        2. Anticipa cambios de terreno y cambia antes de necesitarlo
+        3. Evita combinaciones extremas (cruce de cadena)
+        4. Cambia secuencialmente, no saltes muchas marchas de golpe
+        
+        Situaciones específicas:
+        - Subidas: Usa platos pequeños y piñones grandes para pedalear con menos esfuerzo
+        - Bajadas: Usa platos grandes y piñones pequeños o deja de pedalear si la velocidad es alta
+        - Llano: Busca una combinación que te permita mantener tu cadencia ideal
+        """
+
+_HELP_TEXT = """
+        GUÍA DE USO RÁPIDA
+        
+        1. CONFIGURACIÓN DE TU BICICLETA (Pestaña "Mi Bicicleta")
+           - Selecciona el tipo de bicicleta más parecido a la tuya
+           - Ajusta el tamaño de rueda según corresponda
+           - Establece tu cadencia habitual (si no estás seguro, deja el valor predeterminado)
+           - Si conoces exactamente la configuración de tu bicicleta, usa "Configurar manualmente"
+           - Pulsa "Visualizar mi bicicleta" para continuar
+        
+        2. VISUALIZACIÓN (Pestaña "Visualización")
+           - Explora la "Tabla de marchas" para ver qué velocidad alcanzarás con cada combinación
+           - Revisa el "Gráfico de velocidades" para entender cómo afecta cada piñón a tu velocidad
+           - Observa el "Desarrollo" para comprender la distancia recorrida por pedalada
+        
+        3. RECOMENDACIONES (Pestaña "¿Qué marcha usar?")
+           - Establece tu velocidad deseada y la pendiente del terreno
+           - Obtén una recomendación personalizada de qué marcha usar
+           - Lee los consejos específicos para tu situación
+        
+        4. ANÁLISIS TÉCNICO (Solo en modo técnico)
+           - Explora análisis avanzados como relación de marchas, potencia y solapamiento
+           - Útil para ciclistas experimentados que deseen optimizar su técnica
+        
+        CAMBIO DE MODO
+        
+        - Modo Principiante: Interfaz simplificada con conceptos básicos
+        - Modo Deportivo/Técnico: Acceso a análisis avanzados y términos técnicos
+        
+        CONSEJOS GENERALES
+        
+        - Experimenta con diferentes configuraciones para entender mejor cómo funcionan las marchas
+        - Usa la pestaña de recomendaciones antes de salir a rodar para planificar qué marchas usar
+        - Consulta la ayuda o los conceptos básicos si algún término no te resulta familiar
+        """
+
+def _no_debug(*args, **kwargs) -> None:
+    """Destino de la salida de depuración mientras el modo debug está desactivado"""
+
+def _crossing_table(num_chainrings: int, num_sprockets: int,
+                    dbg: Callable[..., None] = _no_debug) -> np.ndarray:
+    """
+    Reglas de cruce de cadena para una transmisión con el número de platos y piñones dados
+    
+    Devuelve la máscara (True donde la combinación plato/piñón cruza la cadena). Solo depende
+    de los tamaños, no de los dientes, así que puede evaluarse para cualquier configuración
+    hipotética.
+    """
+    mask = np.zeros((num_chainrings, num_sprockets), dtype=bool)
+    
+    # Si solo hay un plato, no hay cruce posible
+    if num_chainrings <= 1:
+        return mask
+        
+    # Ajustar la lógica de cruce de cadena según el número de platos y piñones
+    if num_chainrings == 2:  # Doble plato
+        # Para doble plato, considerar 35% de los piñones como extremos
+        extreme_count = max(2, round(num_sprockets * 0.35))
+        
+        # Debug info
+        dbg(f"Doble plato: extreme_count={extreme_count}")
+        
+        # Plato grande con piñones grandes, plato pequeño con piñones pequeños
+        mask[0, max(0, num_sprockets - extreme_count):] = True
+        mask[-1, :extreme_count] = True
+            
+    elif num_chainrings == 3:  # Triple plato
+        # Más restrictivo con triples: 40% de los piñones son extremos
+        extreme_count_large = max(2, round(num_sprockets * 0.4))
+        extreme_count_small = max(2, round(num_sprockets * 0.4))
+        
+        medium_extreme_large = max(1, round(num_sprockets * 0.15))
+        medium_extreme_small = max(1, round(num_sprockets * 0.15))
+        
+        # Debug info
+        dbg(f"Triple plato: extreme_count_large={extreme_count_large}, "
+            f"extreme_count_small={extreme_count_small}, "
+            f"medium_extreme_large={medium_extreme_large}, "
+            f"medium_extreme_small={medium_extreme_small}")
+        
+        # Plato grande con piñones grandes, plato pequeño con piñones pequeños
+        mask[0, max(0, num_sprockets - extreme_count_large):] = True
+        mask[-1, :extreme_count_small] = True
+        
+        # Para el plato mediano, también hay restricciones pero menos severas
+        mask[1, max(0, num_sprockets - medium_extreme_large):] = True
+        mask[1, :medium_extreme_small] = True
+    
+    # Para otros casos (número de platos inusuales), usar una regla general
+    else:
+        # Regla general: 30% de los piñones en cada extremo
+        extreme_count = max(1, round(num_sprockets * 0.3))
+        
+        mask[0, max(0, num_sprockets - extreme_count):] = True
+        mask[-1, :extreme_count] = True
+        
+        # Solo los extremos para platos intermedios
+        mask[1:-1, 0] = True
+        mask[1:-1, num_sprockets - 1:] = True
+    
+    return mask
+
 def handle_errors(func):
     """Decorator for handling errors in GUI methods"""
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
@@ -122,13 +349,73 @@ def handle_errors(func):
             return None
     return wrapper
 
-@dataclass
+def holding_draw_lock(func):
+    """Decorador para métodos que modifican figuras que el hilo de dibujo puede estar renderizando"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self._draw_lock:
+            return func(self, *args, **kwargs)
+    return wrapper
+
+def _chainring_color(index: int) -> str:
+    """Color de los gráficos para el plato en la posición index (0 = el más grande)"""
+    return CHAINRING_COLORS[index] if index < len(CHAINRING_COLORS) else "gray"
+
+def _teeth(*teeth: int) -> np.ndarray:
+    """Array int32 de solo lectura con los dientes indicados, ordenados de menor a mayor"""
+    array = np.sort(np.array(teeth, dtype=np.int32))
+    array.flags.writeable = False
+    return array
+
+def _parse_teeth(text: str) -> np.ndarray:
+    """Convierte dientes separados por comas en un array int32 ordenado de menor a mayor"""
+    teeth = [int(field) for field in text.split(',') if field.strip()]
+    # Comprobar el rango antes de reducir a int32, los valores mayores darían la vuelta
+    out_of_range = [value for value in teeth if not MIN_TEETH <= value <= MAX_TEETH]
+    if out_of_range:
+        raise ValueError(f"Teeth value out of range: {', '.join(map(str, out_of_range))}")
+    return np.sort(np.array(teeth, dtype=np.int32))
+
+@dataclass(frozen=True, slots=True, eq=False)  # eq=False mantiene el hash por identidad, los arrays no son hashables
 class BikeType:
-    """Data class for bike type configuration"""
+    """Data class for bike type configuration (teeth sorted from smallest to largest)"""
     name: str
     value: str
-    platos: List[int]
-    pinones: List[int]
+    platos: np.ndarray
+    pinones: np.ndarray
+
+# Tipos de bicicleta predefinidos
+BIKE_TYPES = (
+    BikeType("MTB (Montaña)", "mtb", _teeth(24, 34, 42), _teeth(14, 16, 18, 20, 22, 24, 34)),
+    BikeType("Carretera", "road", _teeth(34, 50), _teeth(14, 16, 18, 20, 22, 24, 28)),
+    BikeType("Urbana/Paseo", "urban", _teeth(24, 34, 42), _teeth(14, 16, 18, 20, 22, 24, 28)),
+    BikeType("Personalizada", "custom", _teeth(), _teeth())
+)
+
+class BackgroundFigureCanvas(FigureCanvasTkAgg):
+    """Canvas de Tk cuyo renderizado Agg se delega al hilo de dibujo de la aplicación"""
+    def __init__(self, figure, master, request_draw: Callable[["BackgroundFigureCanvas"], None],
+                 draw_lock: threading.RLock) -> None:
+        self._request_draw = request_draw
+        self._draw_lock = draw_lock
+        # Los gráficos no tienen imágenes, así que se omite el paso de composición de matplotlib
+        if not any(ax.images for ax in figure.axes):
+            figure.suppressComposite = True
+        super().__init__(figure, master)
+
+    def draw(self) -> None:
+        # Encolar el renderizado; el resultado se copia al canvas de Tk cuando está listo
+        self._request_draw(self)
+
+    def resize(self, event) -> None:
+        # El hilo de dibujo puede estar renderizando la figura cuyo tamaño cambia aquí
+        with self._draw_lock:
+            super().resize(event)
+
+    def _update_device_pixel_ratio(self, event=None) -> None:
+        # Asociado a <Map>, una nueva relación de píxeles cambia el DPI de la figura mientras puede estar renderizándose
+        with self._draw_lock:
+            super()._update_device_pixel_ratio(event)
 
 class NuSui:
     def __init__(self, root: tk.Tk) -> None:
@@ -142,17 +429,91 @@ class NuSui:
         """Configure the main window"""
         self.root.title(APP_TITLE)
         self.root.geometry(DEFAULT_WINDOW_SIZE)
-        # Configure matplotlib
-        matplotlib.rcParams.update({'font.size': DEFAULT_FONT_SIZE})
         
     def initialize_variables(self) -> None:
         """Initialize class variables"""
-        self.crankset_teeth: List[int] = []
-        self.cassette_teeth: List[int] = []
-        self.wheel_sizes: Dict[str, float] = wheel_sizes
+        self.crankset_teeth: np.ndarray = _teeth()
+        self.cassette_teeth: np.ndarray = _teeth()
+        self._ratio: np.ndarray = np.empty((0, 0))
+        self._crossing_mask: np.ndarray = np.zeros((0, 0), dtype=bool)
+        self._combo_labels: List[str] = []
+        self._combo_colors: List[str] = []
+        self._wheel_idx = _WHEEL_IDX["26x2.1"]
+        self._wheel_circ = float(_WHEEL_CIRC[self._wheel_idx])
         self.modo_tecnico = tk.BooleanVar(value=False)
         self.debug_var = tk.BooleanVar(value=False)
-        
+        self._dbg = _no_debug
+        self.debug_var.trace_add("write", self._on_debug_toggled)
+        self._figures: Dict[str, tuple] = {}
+        self._chart_canvases: Dict[str, BackgroundFigureCanvas] = {}
+        self._info_windows: Dict[str, tk.Toplevel] = {}
+        self._wheel_canvas: Optional[tk.Canvas] = None
+        self._legend_handles: Dict[int, List[Line2D]] = {}
+        self._visual_tabs: Optional[tuple] = None
+        self._tech_tabs: Optional[tuple] = None
+        self._visual_notebook = None
+        self._tech_notebook = None
+        self._charts_built: Dict[str, bool] = {}
+        self._tech_tabs_built: List[bool] = []
+        self._speed_canvas = None
+        self._speed_background = None
+        self._power_canvas = None
+        self._power_axes: tuple = ()
+        self._power_lines: tuple = ()
+        self._speed_artists: List[tuple] = []
+        self._speed_animated: list = []
+        self._speed_sweep: np.ndarray = np.empty((0, 0, 0))
+        self._speed_draw_cid: Optional[int] = None
+        self._cadence_after: Optional[str] = None
+        self._cadence = DEFAULT_CADENCE
+        self._visual_key: Optional[tuple] = None
+        self._speed_chart_key: Optional[tuple] = None
+        self._tech_key: Optional[tuple] = None
+        
+        # Hilo de dibujo: renderiza los gráficos con Agg, el hilo de Tk solo copia el resultado.
+        # Todo cambio de una figura se hace con _draw_lock (reentrante, los constructores se anidan)
+        self._draw_lock = threading.RLock()
+        self._draw_pending = set()
+        self._draw_requests: "queue.Queue[BackgroundFigureCanvas]" = queue.Queue()
+        self._draw_results: "queue.Queue[BackgroundFigureCanvas]" = queue.Queue()
+        threading.Thread(target=self._draw_worker, daemon=True).start()
+        self.root.after(DRAW_POLL_INTERVAL_MS, self._poll_draw_results)
+        
+    def _request_draw(self, canvas: BackgroundFigureCanvas) -> None:
+        """Encola un canvas para renderizarlo, ignorándolo si ya está en espera"""
+        if canvas not in self._draw_pending:
+            self._draw_pending.add(canvas)
+            self._draw_requests.put(canvas)
+
+    def _draw_worker(self) -> None:
+        """Renderiza con Agg los canvas encolados fuera del hilo principal de Tk"""
+        while True:
+            canvas = self._draw_requests.get()
+            self._draw_pending.discard(canvas)
+            with self._draw_lock:
+                try:
+                    FigureCanvasAgg.draw(canvas)
+                except Exception:
+                    traceback.print_exc()
+                    continue
+            self._draw_results.put(canvas)
+
+    def _poll_draw_results(self) -> None:
+        """Copia a sus canvas de Tk las imágenes renderizadas por el hilo de dibujo"""
+        while True:
+            try:
+                canvas = self._draw_results.get_nowait()
+            except queue.Empty:
+                break
+            if canvas.get_tk_widget().winfo_exists():
+                with self._draw_lock:
+                    canvas.blit()
+        self.root.after(DRAW_POLL_INTERVAL_MS, self._poll_draw_results)
+
+    def _on_debug_toggled(self, *args) -> None:
+        """Dirige la salida de depuración a print o a una función vacía al cambiar la casilla de debug"""
+        self._dbg = print if self.debug_var.get() else _no_debug
+
     def setup_scrollable_frame(self, parent, setup_function):
         """
         Crea un marco con scroll dentro del parent y ejecuta la función setup_function
@@ -179,9 +540,21 @@ class NuSui:
         # Crear ventana en el canvas para mostrar el frame
         canvas_window = canvas.create_window((0, 0), window=inner_frame, anchor="nw")
         
-        # Función para ajustar el tamaño del canvas al cambiar el tamaño del frame
+        # Función para ajustar el tamaño del canvas al cambiar el tamaño del frame; el bbox de
+        # todo el canvas se calcula una vez por ciclo de inactividad, aunque cambien muchos hijos
+        scroll_pending = False
+        
+        def _update_scroll_region():
+            nonlocal scroll_pending
+            scroll_pending = False
+            if canvas.winfo_exists():
+                canvas.configure(scrollregion=canvas.bbox("all"))
+        
         def configure_scroll_region(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            nonlocal scroll_pending
+            if not scroll_pending:
+                scroll_pending = True
+                canvas.after_idle(_update_scroll_region)
         
         # Función para ajustar el ancho de la ventana del canvas al cambiar el tamaño
         def configure_canvas_window(event):
@@ -195,7 +568,21 @@ class NuSui:
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Solo el canvas bajo el puntero atiende la rueda; salir hacia uno de sus
+        # propios widgets mantiene el enlace
+        def _bind_mousewheel(event):
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            self._wheel_canvas = canvas
+        
+        def _unbind_mousewheel(event):
+            widget = canvas.winfo_containing(event.x_root, event.y_root)
+            if widget is None or not (widget is canvas or str(widget).startswith(str(canvas) + ".")):
+                self._release_mousewheel(canvas)
+        
+        canvas.bind("<Enter>", _bind_mousewheel)
+        canvas.bind("<Leave>", _unbind_mousewheel)
+        # Un canvas destruido no debe seguir recibiendo los eventos de la rueda
+        canvas.bind("<Destroy>", lambda event: self._release_mousewheel(canvas))
         
         # Ejecutar la función de configuración proporcionada en el frame scrollable
         if setup_function:
@@ -203,6 +590,12 @@ class NuSui:
         
         return inner_frame
         
+    def _release_mousewheel(self, canvas) -> None:
+        """Quita el enlace global de la rueda del ratón si pertenece a canvas"""
+        if self._wheel_canvas is canvas:
+            canvas.unbind_all("<MouseWheel>")
+            self._wheel_canvas = None
+
     def create_ui(self):
         # Añadir botón para cambiar de modo en la parte superior
         mode_frame = ttk.Frame(self.root)
@@ -219,7 +612,6 @@ class NuSui:
                        command=self.cambiar_modo).pack(side="left", padx=PADDING)
         
         # Botón para mostrar debug
-        self.debug_var = tk.BooleanVar(value=False)
         self.debug_check = ttk.Checkbutton(mode_frame, text="Mostrar debug",
                                       variable=self.debug_var)
         self.debug_check.pack(side="right", padx=PADDING)
@@ -266,13 +658,16 @@ class NuSui:
             # Cambiar a modo técnico
             self.notebook.tab(4, state="normal")  # Mostrar pestaña técnica
             # Actualizar visualizaciones y recomendaciones si ya existen datos
-            if self.crankset_teeth and self.cassette_teeth:
+            if self.crankset_teeth.size and self.cassette_teeth.size:
                 self.visualize_bike()
                 # Actualizar pestaña técnica
                 self.update_tech_tab()
         else:
             # Cambiar a modo principiante
             self.notebook.tab(4, state="hidden")  # Ocultar pestaña técnica
+            # La pestaña oculta ya no recibe el puntero, así que no puede conservar la rueda
+            if self._wheel_canvas is not None and str(self._wheel_canvas).startswith(str(self.tech_tab) + "."):
+                self._release_mousewheel(self._wheel_canvas)
     
     def create_menu(self):
         menu_bar = tk.Menu(self.root)
@@ -376,16 +771,8 @@ class NuSui:
         # Variables para tipo de bicicleta
         self.bike_type_var = tk.StringVar(value="mtb")
         
-        # Opciones de tipo con imágenes y configuraciones predefinidas
-        bike_types = [
-            {"name": "MTB (Montaña)", "value": "mtb", "platos": [24, 34, 42], "piñones": [14, 16, 18, 20, 22, 24, 34]},
-            {"name": "Carretera", "value": "road", "platos": [34, 50], "piñones": [14, 16, 18, 20, 22, 24, 28]},
-            {"name": "Urbana/Paseo", "value": "urban", "platos": [24, 34, 42], "piñones": [14, 16, 18, 20, 22, 24, 28]},
-            {"name": "Personalizada", "value": "custom", "platos": [], "piñones": []}
-        ]
-        
-        for bike in bike_types:
-            ttk.Radiobutton(left_frame, text=bike["name"], value=bike["value"], 
+        for bike in BIKE_TYPES:
+            ttk.Radiobutton(left_frame, text=bike.name, value=bike.value, 
                           variable=self.bike_type_var,
                           command=lambda b=bike: self.select_bike_type(b)).pack(anchor="w", pady=PADDING, padx=LARGE_PADDING)
         
@@ -397,19 +784,10 @@ class NuSui:
         ttk.Label(self.right_frame, text="Tamaño de rueda:").pack(anchor="w", pady=PADDING)
         self.wheel_size_var = tk.StringVar(value="26x2.1")  # Valor predeterminado
         
-        # Agrupar tamaños de rueda por categorías para facilitar la selección
-        wheel_categories = {
-            "MTB": ["26x1.95", "26x2.1", "26x2.35", "27.5x2.10", "27.5x2.25", "29x2.1", "29x2.25"],
-            "Carretera": ["700x23C", "700x25C", "700x28C", "700C"],
-            "Urbana": ["700x35C", "700x38C", "700x40C", "26x1.75"],
-            "Personalizada": list(wheel_sizes.keys())  # Use all available wheel sizes from the dictionary
-        }
-        
-        self.wheel_combo = ttk.Combobox(self.right_frame, textvariable=self.wheel_size_var, width=30)
+        # Sus valores son los tamaños de rueda del tipo de bicicleta, los asigna select_bike_type desde _WHEEL_OPTIONS
+        self.wheel_combo = ttk.Combobox(self.right_frame, textvariable=self.wheel_size_var, width=30, state="readonly")
         self.wheel_combo.pack(anchor="w", pady=PADDING, padx=LARGE_PADDING)
-        
-        # Actualizar las opciones de rueda según el tipo de bicicleta seleccionado
-        self.wheel_combo['values'] = wheel_categories["MTB"]  # Valor predeterminado
+        self.wheel_combo.bind("<<ComboboxSelected>>", self._on_wheel_changed)
         
         # Cadencia predeterminada
         ttk.Label(self.right_frame, text="Cadencia habitual (pedaladas por minuto):").pack(anchor="w", pady=PADDING)
@@ -420,7 +798,7 @@ class NuSui:
         
         ttk.Scale(cadencia_frame, from_=MIN_CADENCE, to=MAX_CADENCE, orient="horizontal", 
                 variable=self.cadencia_var, length=200,
-                command=lambda s: self.cadencia_var.set(str(int(float(s))))).pack(side="left")
+                command=self._on_cadence_change).pack(side="left")
         
         ttk.Label(cadencia_frame, textvariable=self.cadencia_var).pack(side="left", padx=PADDING)
         ttk.Label(cadencia_frame, text="RPM").pack(side="left")
@@ -441,7 +819,31 @@ class NuSui:
         self.visualize_button.pack(pady=LARGE_PADDING)
         
         # Seleccionar tipo MTB por defecto
-        self.select_bike_type(bike_types[0])
+        self.select_bike_type(BIKE_TYPES[0])
+
+    def _on_wheel_changed(self, event=None) -> None:
+        """Guarda la circunferencia del tamaño de rueda seleccionado"""
+        self._wheel_idx = _WHEEL_IDX[self.wheel_size_var.get()]
+        self._wheel_circ = float(_WHEEL_CIRC[self._wheel_idx])
+
+    def _on_cadence_change(self, value: str) -> None:
+        """Guarda la cadencia seleccionada en el deslizador y programa la actualización del gráfico de velocidades"""
+        cadence = int(float(value))
+        self.cadencia_var.set(str(cadence))
+        # El deslizador se mueve en fracciones de RPM; el gráfico solo cambia con la cadencia entera
+        if cadence == self._cadence:
+            return
+        self._cadence = cadence
+        
+        # Agrupar los eventos del deslizador para redibujar el gráfico como mucho una vez cada CADENCE_DEBOUNCE_MS
+        if self._cadence_after is not None:
+            self.root.after_cancel(self._cadence_after)
+        self._cadence_after = self.root.after(CADENCE_DEBOUNCE_MS, self._do_redraw)
+
+    def _do_redraw(self) -> None:
+        """Actualiza el gráfico de velocidades con la última cadencia seleccionada en el deslizador"""
+        self._cadence_after = None
+        self._blit_speed_chart(self._cadence)
 
     @handle_errors
     def setup_custom_gears(self):
@@ -465,7 +867,7 @@ class NuSui:
         ttk.Label(left_frame, text="Introduce el número de dientes separados por comas:").pack(pady=PADDING)
         
         # Valores por defecto si ya existe configuración
-        platos_default = ",".join(map(str, self.crankset_teeth)) if self.crankset_teeth else ""
+        platos_default = ",".join(map(str, self.crankset_teeth))
         self.platos_entry = ttk.Entry(left_frame)
         self.platos_entry.pack(padx=PADDING, pady=PADDING, fill="x")
         self.platos_entry.insert(0, platos_default)
@@ -480,7 +882,7 @@ class NuSui:
         ttk.Label(right_frame, text="Introduce el número de dientes separados por comas:").pack(pady=PADDING)
         
         # Valores por defecto si ya existe configuración
-        piñones_default = ",".join(map(str, self.cassette_teeth)) if self.cassette_teeth else ""
+        piñones_default = ",".join(map(str, self.cassette_teeth))
         self.piñones_entry = ttk.Entry(right_frame)
         self.piñones_entry.pack(padx=PADDING, pady=PADDING, fill="x")
         self.piñones_entry.insert(0, piñones_default)
@@ -502,27 +904,22 @@ class NuSui:
     def save_custom_gears(self, window):
         """Guarda la configuración manual de marchas y cierra la ventana"""
         try:
-            # Procesar platos
+            # Procesar platos, ordenados de mayor a menor
             platos_text = self.platos_entry.get().strip()
-            if platos_text:
-                self.crankset_teeth = [int(x.strip()) for x in platos_text.split(',')]
-            else:
-                self.crankset_teeth = []
+            crankset_teeth = _parse_teeth(platos_text)[::-1]
                 
-            # Procesar piñones
+            # Procesar piñones, ordenados de menor a mayor
             piñones_text = self.piñones_entry.get().strip()
-            if piñones_text:
-                self.cassette_teeth = [int(x.strip()) for x in piñones_text.split(',')]
-            else:
-                self.cassette_teeth = []
+            cassette_teeth = _parse_teeth(piñones_text)
                 
             # Validar configuración
-            if not self.crankset_teeth or not self.cassette_teeth:
+            if not crankset_teeth.size or not cassette_teeth.size:
                 raise ValueError("Debes configurar al menos un plato y un piñón")
                 
-            # Ordenar dientes de menor a mayor (piñones) y de mayor a menor (platos)
-            self.cassette_teeth.sort()  # Menor a mayor para piñones
-            self.crankset_teeth.sort(reverse=True)  # Mayor a menor para platos
+            # Aplicarla solo cuando ambas entradas son válidas, las tablas de marchas deben coincidir con los dientes
+            self.crankset_teeth = crankset_teeth
+            self.cassette_teeth = cassette_teeth
+            self._rebuild_gear_tables()
             
             # Cerrar ventana
             window.destroy()
@@ -531,50 +928,36 @@ class NuSui:
         except ValueError as e:
             messagebox.showwarning("Error en configuración", str(e))
     
-    @handle_errors
-    def select_bike_type(self, bike_type: Dict[str, Union[str, List[int]]]) -> None:
+    def select_bike_type(self, bike_type: BikeType) -> None:
         """
         Update bike configuration based on selected type
         
         Args:
-            bike_type: Dictionary containing bike configuration
+            bike_type: Predefined bike configuration
         """
-        # Validate input
-        required_keys = ["value", "platos", "piñones"]
-        if not all(key in bike_type for key in required_keys):
-            raise ValueError("Invalid bike type configuration")
-            
-        # Update values
-        self.crankset_teeth = bike_type["platos"].copy()
-        self.cassette_teeth = bike_type["piñones"].copy()
-        
-        # Ordenar dientes de menor a mayor (piñones) y de mayor a menor (platos)
-        self.cassette_teeth.sort()  # Menor a mayor para piñones
-        self.crankset_teeth.sort(reverse=True)  # Mayor a menor para platos
+        # Actualizar valores (los dientes de BIKE_TYPES ya están ordenados de menor a mayor)
+        self.crankset_teeth = bike_type.platos[::-1]  # De mayor a menor
+        self.cassette_teeth = bike_type.pinones
         
         # Update wheel options based on bike type
-        wheel_options = {
-            "mtb": ("26x2.1", ["26x2.1", "26x2.35", "27.5x2.10", "27.5x2.25", "29x2.1", "29x2.25", "29x2.3"]),
-            "road": ("700x25C", ["700x23C", "700x25C", "700x28C", "700C"]),
-            "urban": ("700x35C", ["700x35C", "700x38C", "700x40C", "26x1.75"]),
-            "custom": ("700C", list(wheel_sizes.keys()))  # Add this line to include all wheel sizes for custom
-        }
-        
-        bike_value = bike_type["value"]
-        if bike_value in wheel_options:
-            default_size, sizes = wheel_options[bike_value]
-            self.wheel_combo['values'] = sizes
+        bike_value = bike_type.value
+        if bike_value in _WHEEL_OPTIONS:
+            default_size, sizes = _WHEEL_OPTIONS[bike_value]
+            if self.wheel_combo['values'] != sizes:
+                self.wheel_combo['values'] = sizes
             self.wheel_size_var.set(default_size)
+            self._on_wheel_changed()
             
         # Handle custom configuration
         if bike_value == "custom":
             self.manual_config_button.state(['!disabled'])
-            self.crankset_teeth = []
-            self.cassette_teeth = []
+            self.crankset_teeth = _teeth()
+            self.cassette_teeth = _teeth()
         else:
             self.manual_config_button.state(['disabled'])
+            
+        self._rebuild_gear_tables()
 
-    @handle_errors
     def validate_gear_configuration(self) -> bool:
         """
         Validate the current gear configuration
@@ -582,29 +965,45 @@ class NuSui:
         Returns:
             bool: True if configuration is valid, False otherwise
         """
-        if not self.crankset_teeth or not self.cassette_teeth:
+        if not self.crankset_teeth.size or not self.cassette_teeth.size:
             messagebox.showwarning(
                 "Datos insuficientes",
                 "Por favor, selecciona un tipo de bicicleta o configura manualmente."
             )
             return False
             
-        # Validate teeth numbers
-        try:
-            for teeth in self.crankset_teeth + self.cassette_teeth:
-                if not isinstance(teeth, int):
-                    raise ValueError(f"Invalid teeth value: {teeth}")
-                if not MIN_TEETH <= teeth <= MAX_TEETH:
-                    raise ValueError(f"Teeth value out of range: {teeth}")
-            return True
-        except ValueError as e:
+        # Validar el número de dientes (el dtype int32 ya garantiza que son enteros)
+        teeth = np.concatenate((self.crankset_teeth, self.cassette_teeth))
+        out_of_range = teeth[(teeth < MIN_TEETH) | (teeth > MAX_TEETH)]
+        if out_of_range.size:
             messagebox.showwarning(
                 "Configuración inválida",
-                str(e)
+                f"Teeth value out of range: {', '.join(map(str, out_of_range))}"
             )
             return False
+        return True
+
+    def _rebuild_gear_tables(self) -> None:
+        """Precalcula la relación de cada combinación plato/piñón (filas = platos)"""
+        chainrings = np.asarray(self.crankset_teeth, dtype=np.float64)
+        sprockets = np.asarray(self.cassette_teeth, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            self._ratio = chainrings[:, None] / sprockets[None, :]
+        self._build_crossing_mask()
+        
+        # Etiquetas y colores de las barras de la pestaña de relación, fila a fila como self._ratio
+        self._combo_labels = [f"{chainring}/{sprocket}" for chainring, sprocket in
+                              itertools.product(self.crankset_teeth.tolist(), self.cassette_teeth.tolist())]
+        self._combo_colors = [_chainring_color(i) for i in range(len(self.crankset_teeth))
+                              for _ in range(len(self.cassette_teeth))]
+        # Las entradas de leyenda en caché muestran los platos de la configuración anterior
+        self._legend_handles.clear()
+        
+        # El gráfico de velocidades en pantalla pertenece a la configuración anterior, así que
+        # la siguiente visualización tiene que volver a crear los gráficos
+        self._speed_canvas = None
+        self._visual_key = None
 
-    @handle_errors
     def calculate_gear_ratio(self, chainring: int, sprocket: int) -> float:
         """
         Calculate gear ratio between chainring and sprocket
@@ -620,101 +1019,33 @@ class NuSui:
             raise ValueError("Sprocket cannot have 0 teeth")
         return chainring / sprocket
         
-    def is_chain_crossing(self, chainring_idx: int, sprocket_idx: int) -> Tuple[bool, Optional[str]]:
+    def _build_crossing_mask(self) -> None:
         """
-        Determina si una combinación de plato y piñón cruza la cadena
+        Precalcula la matriz de cruces de cadena para la configuración actual
         
-        Args:
-            chainring_idx: Índice del plato (0 para el más grande)
-            sprocket_idx: Índice del piñón (0 para el más pequeño)
-            
-        Returns:
-            bool: True si la combinación cruza la cadena, False en caso contrario
-            str: Mensaje describiendo el problema, o None si no hay cruce
+        Llena self._crossing_mask (True donde la combinación plato/piñón cruza
+        la cadena).
         """
-        num_chainrings = len(self.crankset_teeth)
-        num_sprockets = len(self.cassette_teeth)
-        
-        # Si solo hay un plato, no hay cruce posible
-        if num_chainrings <= 1:
-            return False, None
-            
-        # Debug info
-        if hasattr(self, 'debug_var') and self.debug_var.get():
-            print(f"Checking chain crossing for plato idx={chainring_idx} with piñón idx={sprocket_idx}")
-            print(f"Platos={self.crankset_teeth}, Piñones={self.cassette_teeth}")
-        
-        # Ajustar la lógica de cruce de cadena según el número de platos y piñones
-        if num_chainrings == 2:  # Doble plato
-            # Para doble plato, considerar 35% de los piñones como extremos
-            extreme_count = max(2, round(num_sprockets * 0.35))
-            
-            # Debug info
-            if hasattr(self, 'debug_var') and self.debug_var.get():
-                print(f"Doble plato: extreme_count={extreme_count}")
-            
-            # Plato grande con piñones grandes
-            if chainring_idx == 0 and sprocket_idx >= num_sprockets - extreme_count:
-                return True, "Plato grande con piñón grande: aumenta el desgaste y reduce la eficiencia"
-            
-            # Plato pequeño con piñones pequeños
-            if chainring_idx == num_chainrings - 1 and sprocket_idx < extreme_count:
-                return True, "Plato pequeño con piñón pequeño: aumenta el desgaste y reduce la eficiencia"
-                
-        elif num_chainrings == 3:  # Triple plato
-            # Más restrictivo con triples: 40% de los piñones son extremos
-            extreme_count_large = max(2, round(num_sprockets * 0.4))
-            extreme_count_small = max(2, round(num_sprockets * 0.4))
-            
-            medium_extreme_large = max(1, round(num_sprockets * 0.15))
-            medium_extreme_small = max(1, round(num_sprockets * 0.15))
-            
+        if len(self.crankset_teeth) > 1:
             # Debug info
-            if hasattr(self, 'debug_var') and self.debug_var.get():
-                print(f"Triple plato: extreme_count_large={extreme_count_large}, "
-                     f"extreme_count_small={extreme_count_small}, "
-                     f"medium_extreme_large={medium_extreme_large}, "
-                     f"medium_extreme_small={medium_extreme_small}")
-            
-            # Plato grande con piñones grandes
-            if chainring_idx == 0 and sprocket_idx >= num_sprockets - extreme_count_large:
-                return True, "Plato grande con piñón grande: aumenta el desgaste y reduce la eficiencia"
-            
-            # Plato pequeño con piñones pequeños
-            if chainring_idx == num_chainrings - 1 and sprocket_idx < extreme_count_small:
-                return True, "Plato pequeño con piñón pequeño: aumenta el desgaste y reduce la eficiencia"
-            
-            # Para el plato mediano, también hay restricciones pero menos severas
-            if chainring_idx == 1 and (sprocket_idx >= num_sprockets - medium_extreme_large or 
-                                    sprocket_idx < medium_extreme_small):
-                return True, "Plato mediano con piñón extremo: puede causar desgaste"
-        
-        # Para otros casos (número de platos inusuales), usar una regla general
-        else:
-            # Regla general: 30% de los piñones en cada extremo
-            extreme_count = max(1, round(num_sprockets * 0.3))
-            
-            # Plato grande con piñones grandes
-            if chainring_idx == 0 and sprocket_idx >= num_sprockets - extreme_count:
-                return True, "Plato grande con piñón grande: aumenta el desgaste y reduce la eficiencia"
-            
-            # Plato pequeño con piñones pequeños
-            if chainring_idx == num_chainrings - 1 and sprocket_idx < extreme_count:
-                return True, "Plato pequeño con piñón pequeño: aumenta el desgaste y reduce la eficiencia"
-            
-            # Para platos intermedios en configuraciones de más de 2 platos
-            if len(self.crankset_teeth) > 2 and 0 < chainring_idx < len(self.crankset_teeth) - 1:
-                # Solo los extremos para platos intermedios
-                if sprocket_idx == 0 or sprocket_idx >= num_sprockets - 1:
-                    return True, "Plato intermedio con piñón extremo: puede causar desgaste"
-        
-        return False, None
-    
-    @handle_errors
+            self._dbg("Construyendo matriz de cruce de cadena")
+            self._dbg(f"Platos={self.crankset_teeth}, Piñones={self.cassette_teeth}")
+        self._crossing_mask = _crossing_table(
+            len(self.crankset_teeth), len(self.cassette_teeth), self._dbg)
+
     def calculate_speed(self, gear_ratio: float, cadence: int) -> float:
         """Calculate speed in km/h"""
-        wheel_circum = self.wheel_sizes[self.wheel_size_var.get()]
-        return (gear_ratio * wheel_circum * cadence * 60) / 1000
+        return (gear_ratio * self._wheel_circ * cadence * 60) / 1000
+
+    def _speed_grid_for(self, cadence: int) -> np.ndarray:
+        """Velocidades de la configuración actual a la cadencia indicada, memorizadas por configuración"""
+        return _cached_grid(np.asarray(self.crankset_teeth, dtype=np.int32).tobytes(),
+                            np.asarray(self.cassette_teeth, dtype=np.int32).tobytes(),
+                            self._wheel_idx, cadence)
+
+    def _compute_matrices(self, cadence: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Devuelve las matrices de relación, velocidad (km/h) y desarrollo (m) de la configuración actual"""
+        return self._ratio, self._speed_grid_for(cadence), self._ratio * self._wheel_circ
 
     def calculate_power_estimate(self, speed: float, slope: float = 0.0) -> float:
         """Calculate estimated power output"""
@@ -733,35 +1064,48 @@ class NuSui:
         if self.debug_var.get():
             self.show_chain_crossing_debug()
         
-        # Limpiar pestaña de visualización
-        for widget in self.visual_tab.winfo_children():
-            widget.destroy()
+        # Nada cambió desde la última visualización: solo volver a mostrarla
+        visual_key = (self.crankset_teeth.tobytes(), self.cassette_teeth.tobytes(), self._wheel_idx,
+                      self._cadence, self.modo_tecnico.get())
+        if visual_key == self._visual_key and self.visual_tab.winfo_children():
+            self.notebook.select(2)
+            return
+        self._visual_key = visual_key
         
-        # Crear un frame scrollable para la pestaña de visualización
-        scrollable_frame = self.setup_scrollable_frame(self.visual_tab, None)
+        # Crear la estructura de pestañas para visualizaciones una sola vez, las siguientes
+        # visualizaciones rellenan sus pestañas conservando los lienzos de los gráficos
+        if self._visual_tabs is None or not self._visual_tabs[0].winfo_exists():
+            # Limpiar pestaña de visualización
+            for widget in self.visual_tab.winfo_children():
+                widget.destroy()
+            
+            # Crear un frame scrollable para la pestaña de visualización
+            scrollable_frame = self.setup_scrollable_frame(self.visual_tab, None)
+            
+            visual_notebook = ttk.Notebook(scrollable_frame)
+            visual_notebook.pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+            visual_notebook.bind("<<NotebookTabChanged>>", self._on_visual_tab_changed)
+            self._visual_notebook = visual_notebook
+            self._visual_tabs = tuple(ttk.Frame(visual_notebook) for _ in range(3))
+            for tab, title in zip(self._visual_tabs, ("Tabla de marchas", "Gráfico de velocidades", "Desarrollo")):
+                visual_notebook.add(tab, text=title)
+        else:
+            chart_widgets = {str(canvas.get_tk_widget()) for canvas in self._chart_canvases.values()}
+            for tab in self._visual_tabs:
+                for widget in tab.winfo_children():
+                    if str(widget) not in chart_widgets:
+                        widget.destroy()
+        table_tab = self._visual_tabs[0]
         
         # Obtener parámetros
-        cadence = int(self.cadencia_var.get())
-        wheel_size = self.wheel_size_var.get()
-        
-        # Crear estructura de pestañas para visualizaciones
-        visual_notebook = ttk.Notebook(scrollable_frame)
-        visual_notebook.pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+        cadence = self._cadence
         
         # Pestaña de tabla de marchas
-        table_tab = ttk.Frame(visual_notebook)
-        visual_notebook.add(table_tab, text="Tabla de marchas")
         self.create_gear_table(table_tab, cadence)
         
-        # Pestaña de gráfico de velocidades
-        chart_tab = ttk.Frame(visual_notebook)
-        visual_notebook.add(chart_tab, text="Gráfico de velocidades")
-        self.create_speed_chart(chart_tab, cadence)
-        
-        # Pestaña de desarrollo
-        dev_tab = ttk.Frame(visual_notebook)
-        visual_notebook.add(dev_tab, text="Desarrollo")
-        self.create_development_chart(dev_tab)
+        # Los gráficos se construyen al mostrar su pestaña
+        self._charts_built = {"speed": False, "development": False}
+        self._on_visual_tab_changed()
         
         # Actualizar pestaña de recomendaciones - recrear con scroll
         for widget in self.recom_tab.winfo_children():
@@ -770,13 +1114,21 @@ class NuSui:
         
         # Actualizar pestaña técnica si estamos en modo técnico
         if self.modo_tecnico.get():
-            for widget in self.tech_tab.winfo_children():
-                widget.destroy()
-            self.setup_scrollable_frame(self.tech_tab, self.setup_tech_tab)
+            self.update_tech_tab()
         
         # Cambiar a pestaña de visualización
         self.notebook.select(2)  # Índice 2 = pestaña de visualización
         
+    def _on_visual_tab_changed(self, event=None) -> None:
+        """Construye el gráfico de la pestaña de visualización seleccionada si pertenece a una visualización anterior"""
+        selected = self._visual_notebook.index("current")
+        if selected == 1 and not self._charts_built["speed"]:
+            self._charts_built["speed"] = True
+            self.create_speed_chart(self._visual_tabs[1], self._cadence)
+        elif selected == 2 and not self._charts_built["development"]:
+            self._charts_built["development"] = True
+            self.create_development_chart(self._visual_tabs[2])
+
     def show_chain_crossing_debug(self):
         """Muestra una ventana de debug con la matriz de cruce de cadena"""
         debug_window = tk.Toplevel(self.root)
@@ -807,68 +1159,57 @@ class NuSui:
         info_frame = ttk.Frame(frame)
         info_frame.pack(fill="x", pady=PADDING)
         
-        ttk.Label(info_frame, text=f"Platos: {self.crankset_teeth}", 
-                font=("Arial", 10)).pack(anchor="w", pady=2)
-        ttk.Label(info_frame, text=f"Piñones: {self.cassette_teeth}", 
-                font=("Arial", 10)).pack(anchor="w", pady=2)
+        ttk.Label(info_frame, text=f"Platos: {self.crankset_teeth.tolist()}\n"
+                                   f"Piñones: {self.cassette_teeth.tolist()}",
+                font=("Arial", 10), justify="left").pack(anchor="w", pady=2)
+        
+        num_chainrings, num_sprockets = self._crossing_mask.shape
         
         # Mostrar parámetros usados para el cálculo según tipo de bicicleta
-        if len(self.crankset_teeth) == 3:
-            num_sprockets = len(self.cassette_teeth)
+        if num_chainrings == 3:
             extreme_count_large = max(2, round(num_sprockets * 0.4))
             extreme_count_small = max(2, round(num_sprockets * 0.4))
             medium_extreme_large = max(1, round(num_sprockets * 0.15))
             medium_extreme_small = max(1, round(num_sprockets * 0.15))
             
-            ttk.Label(info_frame, text=f"Triple plato: Cruces en plato grande: {extreme_count_large} piñones grandes", 
-                    font=("Arial", 9, "italic")).pack(anchor="w", pady=1)
-            ttk.Label(info_frame, text=f"Triple plato: Cruces en plato pequeño: {extreme_count_small} piñones pequeños", 
-                    font=("Arial", 9, "italic")).pack(anchor="w", pady=1)
-            ttk.Label(info_frame, text=f"Triple plato: Cruces en plato mediano: {medium_extreme_small} piñones pequeños y {medium_extreme_large} piñones grandes", 
-                    font=("Arial", 9, "italic")).pack(anchor="w", pady=1)
-        elif len(self.crankset_teeth) == 2:
-            num_sprockets = len(self.cassette_teeth)
+            ttk.Label(info_frame, text=f"Triple plato: Cruces en plato grande: {extreme_count_large} piñones grandes\n"
+                                       f"Triple plato: Cruces en plato pequeño: {extreme_count_small} piñones pequeños\n"
+                                       f"Triple plato: Cruces en plato mediano: {medium_extreme_small} piñones pequeños y {medium_extreme_large} piñones grandes",
+                    font=("Arial", 9, "italic"), justify="left").pack(anchor="w", pady=1)
+        elif num_chainrings == 2:
             extreme_count = max(2, round(num_sprockets * 0.35))
             
-            ttk.Label(info_frame, text=f"Doble plato: Cruces en plato grande: {extreme_count} piñones grandes", 
-                    font=("Arial", 9, "italic")).pack(anchor="w", pady=1)
-            ttk.Label(info_frame, text=f"Doble plato: Cruces en plato pequeño: {extreme_count} piñones pequeños", 
-                    font=("Arial", 9, "italic")).pack(anchor="w", pady=1)
-        
-        # Crear tabla
-        tabla_frame = ttk.Frame(frame)
-        tabla_frame.pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+            ttk.Label(info_frame, text=f"Doble plato: Cruces en plato grande: {extreme_count} piñones grandes\n"
+                                       f"Doble plato: Cruces en plato pequeño: {extreme_count} piñones pequeños",
+                    font=("Arial", 9, "italic"), justify="left").pack(anchor="w", pady=1)
+        
+        # Crear tabla, dibujada sobre un único canvas
+        is_cross = self._crossing_mask.tolist()  # Listas simples, más baratas de indexar celda a celda
+        header_width, cell_width, cell_height = 100, 54, 34
+        bold_font = ("Arial", 10, "bold")
+        tabla_canvas = tk.Canvas(frame, width=header_width + num_sprockets * cell_width,
+                                 height=(num_chainrings + 1) * cell_height, highlightthickness=0)
+        tabla_canvas.pack(anchor="w", padx=PADDING, pady=PADDING)
         
         # Encabezados de columna (piñones)
-        ttk.Label(tabla_frame, text="Plato\\Piñón", width=10, 
-                 font=("Arial", 10, "bold")).grid(row=0, column=0, padx=2, pady=2)
-        
+        tabla_canvas.create_text(header_width / 2, cell_height / 2, text="Plato\\Piñón", font=bold_font)
         for j, piñon in enumerate(self.cassette_teeth):
-            ttk.Label(tabla_frame, text=f"{piñon}T", width=6, 
-                     font=("Arial", 10, "bold")).grid(row=0, column=j+1, padx=2, pady=2)
+            tabla_canvas.create_text(header_width + (j + 0.5) * cell_width, cell_height / 2,
+                                     text=f"{piñon}T", font=bold_font)
         
         # Filas (platos)
         for i, plato in enumerate(self.crankset_teeth):
-            ttk.Label(tabla_frame, text=f"{plato}T", width=10, 
-                     font=("Arial", 10, "bold")).grid(row=i+1, column=0, padx=2, pady=2)
+            y = (i + 1) * cell_height
+            tabla_canvas.create_text(header_width / 2, y + cell_height / 2, text=f"{plato}T", font=bold_font)
             
-            for j in range(len(self.cassette_teeth)):
-                # Calcular cruce directamente
-                crossing, _ = self.is_chain_crossing(i, j)
+            for j in range(num_sprockets):
+                # Leer el cruce de la matriz precalculada
+                crossing = is_cross[i][j]
                 
-                text = "X" if crossing else "O"
-                
-                # Usar Frame coloreado con Label dentro
-                cell_frame = ttk.Frame(tabla_frame, width=50, height=30)
-                cell_frame.grid(row=i+1, column=j+1, padx=2, pady=2)
-                cell_frame.grid_propagate(False)  # Mantener tamaño
-                
-                if crossing:
-                    label = ttk.Label(cell_frame, text=text, font=("Arial", 10, "bold"), foreground="red")
-                else:
-                    label = ttk.Label(cell_frame, text=text, font=("Arial", 10, "bold"), foreground="green")
-                    
-                label.place(relx=0.5, rely=0.5, anchor="center")
+                x = header_width + j * cell_width
+                tabla_canvas.create_rectangle(x + 2, y + 2, x + cell_width - 2, y + cell_height - 2, outline="gray")
+                tabla_canvas.create_text(x + cell_width / 2, y + cell_height / 2, text="X" if crossing else "O",
+                                         font=bold_font, fill="red" if crossing else "green")
         
         # Panel de explicación
         explanation = """
@@ -906,43 +1247,31 @@ class NuSui:
                  font=("Arial", 12, "bold")).pack(pady=PADDING)
         
         # Crear tabla con treeview
-        columns = ["Plato"] + [f"{teeth}" for teeth in self.cassette_teeth]
+        sprocket_columns = [str(teeth) for teeth in self.cassette_teeth.tolist()]
+        columns = ["Plato"] + sprocket_columns
         
         tree = ttk.Treeview(container, columns=columns, show="headings", height=len(self.crankset_teeth))
         tree.pack(fill="both", expand=True)
         
         # Configurar columnas
         tree.heading("Plato", text="Plato")
-        for teeth in self.cassette_teeth:
-            tree.heading(f"{teeth}", text=f"{teeth}")
-            tree.column(f"{teeth}", width=60, anchor="center")
+        for column in sprocket_columns:
+            tree.heading(column, text=column)
+            tree.column(column, width=60, anchor="center")
         
         # Contador de combinaciones con cruce de cadena
-        crossing_count = 0
-        total_combinations = len(self.crankset_teeth) * len(self.cassette_teeth)
+        crossing_count = int(self._crossing_mask.sum())
+        total_combinations = self._crossing_mask.size
         
-        # Llenar tabla con velocidades
-        for i, chainring in enumerate(self.crankset_teeth):
-            row_values = [f"{chainring}T"]
-            for j, sprocket in enumerate(self.cassette_teeth):
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                speed = self.calculate_speed(gear_ratio, cadence)
-                
-                # Comprobar si esta combinación cruza la cadena
-                crossing, _ = self.is_chain_crossing(i, j)
-                
-                if crossing:
-                    # Marcar celdas con cruce de cadena
-                    row_values.append("---")
-                    crossing_count += 1
-                else:
-                    row_values.append(f"{speed:.1f}")
-            
-            tree.insert("", "end", values=row_values)
+        # Llenar tabla con velocidades, marcando las combinaciones con cruce de cadena
+        _, speeds, _ = self._compute_matrices(cadence)
+        cells = np.where(self._crossing_mask, "---", np.char.mod("%.1f", speeds))
+        for chainring, row in zip(self.crankset_teeth, cells):
+            tree.insert("", "end", values=[f"{chainring}T", *row.tolist()])
         
         # Añadir leyenda
         ttk.Label(container, text="Las velocidades están calculadas con el tamaño de rueda: " + 
-                 f"{self.wheel_size_var.get()} ({self.wheel_sizes[self.wheel_size_var.get()]}m de circunferencia)",
+                 f"{self.wheel_size_var.get()} ({self._wheel_circ}m de circunferencia)",
                  font=("Arial", 9, "italic")).pack(pady=(PADDING, 0))
         
         # Añadir aviso sobre cruce de cadena
@@ -960,44 +1289,63 @@ class NuSui:
                                 wraplength=600, justify="left")
         warning_label.pack(side="left", fill="x", expand=True)
 
-    @handle_errors
-    def create_speed_chart(self, parent, cadence):
-        """Crea un gráfico de líneas con las velocidades para cada marcha, indicando cruces de cadena"""
+    def _get_chart_figure(self, name: str):
+        """Devuelve la figura y los ejes en caché de un gráfico, limpios para volver a dibujar"""
+        if name not in self._figures:
+            fig = Figure(figsize=CHART_SIZE)
+            self._figures[name] = (fig, fig.add_subplot())
+        fig, ax = self._figures[name]
+        ax.cla()
+        return fig, ax
+
+    def _get_chart_canvas(self, name: str, parent) -> BackgroundFigureCanvas:
+        """Devuelve el canvas en caché de un gráfico, creado en parent la primera vez que se muestra"""
+        canvas = self._chart_canvases.get(name)
+        if canvas is None or not canvas.get_tk_widget().winfo_exists():
+            canvas = BackgroundFigureCanvas(self._figures[name][0], parent, self._request_draw, self._draw_lock)
+            self._chart_canvases[name] = canvas
+        else:
+            # Desempaquetarlo para que se vuelva a empaquetar en orden con los widgets reconstruidos de su pestaña
+            canvas.get_tk_widget().pack_forget()
+        return canvas
+
+    def _chainring_legend(self, lw: int) -> List[Line2D]:
+        """Entradas de leyenda con el color de cada plato, creadas una vez por configuración y grosor de línea"""
+        handles = self._legend_handles.get(lw)
+        if handles is None:
+            handles = [Line2D([0], [0], color=_chainring_color(i), lw=lw, label=f'Plato {chainring}T')
+                       for i, chainring in enumerate(self.crankset_teeth)]
+            self._legend_handles[lw] = handles
+        return handles
+
+    def _plot_speed_chart(self) -> None:
+        """Dibuja las líneas del gráfico de velocidades para las marchas y el modo actuales; _set_speed_data les asigna las velocidades"""
         # Crear figura
-        fig, ax = plt.subplots(figsize=CHART_SIZE)
+        fig, ax = self._get_chart_figure("speed")
         
         # Preparar datos
+        _, speeds, _ = self._compute_matrices(self._cadence)
+        self._speed_artists = []
         for i, chainring in enumerate(self.crankset_teeth):
-            speeds = []
-            crosses = []  # Para marcar los puntos que cruzan la cadena
-            
-            for j, sprocket in enumerate(self.cassette_teeth):
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                speed = self.calculate_speed(gear_ratio, cadence)
-                speeds.append(speed)
-                
-                # Verificar si esta combinación cruza la cadena
-                crossing, _ = self.is_chain_crossing(i, j)
-                crosses.append(crossing)
+            row, crosses = speeds[i], self._crossing_mask[i]  # Para marcar los puntos que cruzan la cadena
             
             # Graficar línea principal (todos los puntos)
-            line, = ax.plot(self.cassette_teeth, speeds, '-', color=f'C{i}', label=f"Plato {chainring}T")
+            line, = ax.plot(self.cassette_teeth, row, '-', color=f'C{i}', label=f"Plato {chainring}T")
             
             # Añadir puntos "seguros" (sin cruce) en color sólido
-            safe_x = [self.cassette_teeth[j] for j in range(len(self.cassette_teeth)) if not crosses[j]]
-            safe_y = [speeds[j] for j in range(len(speeds)) if not crosses[j]]
-            ax.plot(safe_x, safe_y, 'o', color=f'C{i}')
+            safe_points, = ax.plot(self.cassette_teeth[~crosses], row[~crosses], 'o', color=f'C{i}')
             
             # Añadir puntos "peligrosos" (con cruce) en otro estilo
-            cross_x = [self.cassette_teeth[j] for j in range(len(self.cassette_teeth)) if crosses[j]]
-            cross_y = [speeds[j] for j in range(len(speeds)) if crosses[j]]
-            if cross_x:  # Solo si hay puntos peligrosos
-                ax.plot(cross_x, cross_y, 'x', color=f'C{i}', markersize=8, alpha=0.7)
+            cross_points = None
+            if crosses.any():  # Solo si hay puntos peligrosos
+                cross_points, = ax.plot(self.cassette_teeth[crosses], row[crosses], 'x',
+                                        color=f'C{i}', markersize=8, alpha=0.7)
+            
+            self._speed_artists.append((line, safe_points, cross_points))
         
         # Configurar gráfico
         ax.set_xlabel('Dientes del piñón')
         ax.set_ylabel('Velocidad (km/h)')
-        ax.set_title(f'Velocidades a {cadence} RPM')
         ax.grid(True)
         ax.legend()
         
@@ -1005,22 +1353,94 @@ class NuSui:
         if not self.modo_tecnico.get():
             ax.set_xlabel('Piñones (de más rápido a más fácil)')
             # Simplificar etiquetas del eje X
-            ax.set_xticks(range(len(self.cassette_teeth)))
-            ax.set_xticklabels([f"{i+1}" for i in range(len(self.cassette_teeth))])
+            num_sprockets = len(self.cassette_teeth)
+            ax.set_xticks(range(num_sprockets))
+            ax.set_xticklabels([f"{i+1}" for i in range(num_sprockets)])
+        self._speed_animated = [ax.title] + [artist for artists in self._speed_artists
+                                             for artist in artists if artist is not None]
+        for artist in self._speed_animated:
+            artist.set_animated(True)
+
+    @handle_errors
+    @holding_draw_lock
+    def create_speed_chart(self, parent, cadence):
+        """Crea un gráfico de líneas con las velocidades para cada marcha, indicando cruces de cadena"""
+        # Las líneas solo se vuelven a dibujar cuando cambian las marchas o el modo; si no, las
+        # existentes solo reciben las velocidades de la nueva rueda y cadencia
+        chart_key = (self.crankset_teeth.tobytes(), self.cassette_teeth.tobytes(), self.modo_tecnico.get())
+        if chart_key != self._speed_chart_key:
+            self._plot_speed_chart()
+            self._speed_chart_key = chart_key
+        fig, ax = self._figures["speed"]
+        
+        # Velocidades para cada cadencia del control (cadencia x plato x piñón), usadas para redibujar
+        # solo las líneas al cambiar la cadencia; el eje de velocidad queda fijo para todo el rango
+        cadences = np.arange(MIN_CADENCE, MAX_CADENCE + 1)
+        self._speed_sweep = self._ratio * (self._wheel_circ * cadences[:, None, None] * 60 / 1000)
+        ax.set_ylim(self._speed_sweep.min() * 0.9, self._speed_sweep.max() * 1.05)
+        self._set_speed_data(cadence)
         
         # Crear canvas para mostrar el gráfico
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
+        canvas = self._get_chart_canvas("speed", parent)
+        self._speed_canvas = canvas
+        self._speed_background = None
+        if self._speed_draw_cid is None:
+            self._speed_draw_cid = canvas.mpl_connect("draw_event", self._on_speed_chart_draw)
+            # Tras un cambio de tamaño el fondo guardado ya no encaja con el gráfico hasta que se vuelva a dibujar
+            canvas.mpl_connect("resize_event", self._on_speed_chart_resize)
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill="both", expand=True)
         
         # Añadir leyenda para cruces de cadena
         legend_frame = ttk.Frame(parent)
         legend_frame.pack(fill="x", pady=PADDING)
         
-        ttk.Label(legend_frame, text="○ = Combinaciones seguras", font=("Arial", 9)).pack(side="left", padx=PADDING)
-        ttk.Label(legend_frame, text="✕ = Combinaciones con cruce de cadena (evitar)", font=("Arial", 9)).pack(side="left", padx=PADDING)
+        ttk.Label(legend_frame, text="○ = Combinaciones seguras    ✕ = Combinaciones con cruce de cadena (evitar)", font=("Arial", 9)).pack(side="left", padx=PADDING)
+
+    def _on_speed_chart_draw(self, event) -> None:
+        """Guarda el fondo estático del gráfico de velocidades y dibuja encima las líneas animadas"""
+        self._speed_background = event.canvas.copy_from_bbox(event.canvas.figure.bbox)
+        for artist in self._speed_animated:
+            event.canvas.figure.draw_artist(artist)
+
+    def _on_speed_chart_resize(self, event) -> None:
+        """Descarta el fondo guardado del gráfico de velocidades cuando su canvas cambia de tamaño"""
+        self._speed_background = None
+
+    def _set_speed_data(self, cadence: int) -> None:
+        """Asigna a las líneas del gráfico de velocidades las velocidades de la cadencia indicada"""
+        ax = self._figures["speed"][1]
+        speeds = self._speed_sweep[min(max(cadence, MIN_CADENCE), MAX_CADENCE) - MIN_CADENCE]
+        for i, (line, safe_points, cross_points) in enumerate(self._speed_artists):
+            row, crosses = speeds[i], self._crossing_mask[i]
+            line.set_ydata(row)
+            safe_points.set_ydata(row[~crosses])
+            if cross_points is not None:
+                cross_points.set_ydata(row[crosses])
+        ax.set_title(f'Velocidades a {cadence} RPM')
+
+    def _blit_speed_chart(self, cadence: int) -> None:
+        """Actualiza el gráfico de velocidades para una nueva cadencia redibujando solo sus líneas (blitting)"""
+        canvas = self._speed_canvas
+        if canvas is None or not canvas.get_tk_widget().winfo_exists():
+            return
+        
+        fig, ax = self._figures["speed"]
+        # Las líneas se cambian cuando el hilo de dibujo termina cualquier renderizado del gráfico
+        with self._draw_lock:
+            self._set_speed_data(cadence)
+            if self._speed_background is not None:
+                canvas.restore_region(self._speed_background)
+                for artist in self._speed_animated:
+                    fig.draw_artist(artist)
+                canvas.blit(fig.bbox)
+                return
+        
+        # Sin fondo (gráfico aún no dibujado) encolar un redibujado completo
+        canvas.draw_idle()
 
     @handle_errors
+    @holding_draw_lock
     def create_development_chart(self, parent):
         """Crea un gráfico de barras con el desarrollo de cada marcha, marcando cruces de cadena"""
         # Frame con explicación
@@ -1031,62 +1451,44 @@ class NuSui:
                  wraplength=800).pack(pady=PADDING)
         
         # Crear figura
-        fig, ax = plt.subplots(figsize=CHART_SIZE)
-        
-        # Definir colores para cada plato
-        color_map = {
-            0: 'red',      # Primer plato (más grande)
-            1: 'blue',     # Segundo plato
-            2: 'green'     # Tercer plato (si existe)
-        }
+        fig, ax = self._get_chart_figure("development")
         
         # Para almacenar los datos de desarrollo por plato
         width = 0.8 / len(self.crankset_teeth)  # Ancho de barra ajustado según número de platos
         
         # Para cada plato, crear un conjunto de barras
+        developments = self._ratio * self._wheel_circ
+        sprocket_positions = np.arange(len(self.cassette_teeth))
+        cross_bars = []
         for i, chainring in enumerate(self.crankset_teeth):
-            developments = []
-            safe_markers = []  # Para marcar combinaciones seguras y cruces
-            
-            for j, sprocket in enumerate(self.cassette_teeth):
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                development = gear_ratio * self.wheel_sizes[self.wheel_size_var.get()]
-                developments.append(development)
-                
-                # Verificar cruce de cadena
-                crossing, _ = self.is_chain_crossing(i, j)
-                safe_markers.append(not crossing)  # True si es seguro, False si hay cruce
-            
             # Posición de las barras para este plato
-            bar_positions = [j + width*i for j in range(len(self.cassette_teeth))]
-            
-            # Crear barras para combinaciones seguras (sin cruce)
-            safe_dev = [dev if safe else 0 for dev, safe in zip(developments, safe_markers)]
-            ax.bar(bar_positions, safe_dev, width=width, color=color_map.get(i, 'gray'), 
-                  label=f"Plato {chainring}T")
+            bar_positions = sprocket_positions + width*i
             
-            # Crear barras para combinaciones con cruce (hatched pattern)
-            cross_dev = [dev if not safe else 0 for dev, safe in zip(developments, safe_markers)]
-            if any(cross_dev):  # Solo si hay alguna barra con cruce
-                ax.bar(bar_positions, cross_dev, width=width, color=color_map.get(i, 'gray'), 
-                      alpha=0.5, hatch='xxx')
+            # Una barra por piñón; las que cruzan la cadena reciben la trama más abajo
+            bars = ax.bar(bar_positions, developments[i], width=width, color=_chainring_color(i),
+                          label=f"Plato {chainring}T")
+            cross_bars.extend(itertools.compress(bars, self._crossing_mask[i]))
         
         # Configurar eje X
-        ax.set_xticks(range(len(self.cassette_teeth)))
+        ax.set_xticks(sprocket_positions)
         ax.set_xticklabels([f"{sprocket}T" for sprocket in self.cassette_teeth])
         
         # Configurar etiquetas y título
         ax.set_xlabel('Dientes del piñón')
         ax.set_ylabel('Desarrollo (metros/pedalada)')
         ax.set_title('Desarrollo por plato')
+        # La leyenda se crea antes de tramar las barras con cruce, así muestra el color sólido
         ax.legend()
+        for bar in cross_bars:
+            bar.set_alpha(0.5)
+            bar.set_hatch('xxx')
         
         # Ajustar layout
         fig.tight_layout()
         
         # Crear canvas para mostrar el gráfico
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
+        canvas = self._get_chart_canvas("development", parent)
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill="both", expand=True)
         
         # Añadir leyenda para interpretar el gráfico
@@ -1122,7 +1524,7 @@ class NuSui:
     def setup_recom_tab(self, parent):
         """Configura la pestaña de recomendaciones"""
         # Si no hay configuración, mostrar mensaje
-        if not self.crankset_teeth or not self.cassette_teeth:
+        if not self.crankset_teeth.size or not self.cassette_teeth.size:
             ttk.Label(parent, text="Por favor, configura tu bicicleta primero en la pestaña 'Mi Bicicleta'",
                      font=("Arial", 12)).pack(pady=LARGE_PADDING)
             return
@@ -1142,13 +1544,14 @@ class NuSui:
         # Velocidad deseada
         ttk.Label(form_frame, text="Velocidad deseada (km/h):").pack(anchor="w", pady=PADDING)
         
-        self.target_speed_var = tk.StringVar(value="20")
+        self.target_speed_var = tk.IntVar(value=20)
         speed_frame = ttk.Frame(form_frame)
         speed_frame.pack(fill="x", pady=PADDING, padx=LARGE_PADDING)
         
+        # ttk.Scale escribe valores fraccionarios en su variable, el comando los redondea a números enteros
         ttk.Scale(speed_frame, from_=5, to=50, orient="horizontal", 
                  variable=self.target_speed_var, length=200,
-                 command=lambda s: self.target_speed_var.set(str(int(float(s))))).pack(side="left")
+                 command=lambda s: self.target_speed_var.set(int(float(s)))).pack(side="left")
         
         ttk.Label(speed_frame, textvariable=self.target_speed_var).pack(side="left", padx=PADDING)
         ttk.Label(speed_frame, text="km/h").pack(side="left")
@@ -1156,13 +1559,13 @@ class NuSui:
         # Pendiente
         ttk.Label(form_frame, text="Pendiente (%):").pack(anchor="w", pady=PADDING)
         
-        self.slope_var = tk.StringVar(value="0")
+        self.slope_var = tk.IntVar(value=0)
         slope_frame = ttk.Frame(form_frame)
         slope_frame.pack(fill="x", pady=PADDING, padx=LARGE_PADDING)
         
         ttk.Scale(slope_frame, from_=-10, to=20, orient="horizontal", 
                  variable=self.slope_var, length=200,
-                 command=lambda s: self.slope_var.set(str(int(float(s))))).pack(side="left")
+                 command=lambda s: self.slope_var.set(int(float(s)))).pack(side="left")
         
         ttk.Label(slope_frame, textvariable=self.slope_var).pack(side="left", padx=PADDING)
         ttk.Label(slope_frame, text="%").pack(side="left")
@@ -1177,8 +1580,10 @@ class NuSui:
                   command=self.calculate_recommended_gear).pack(pady=LARGE_PADDING)
         
         # Panel derecho - Resultados
-        self.results_frame = ttk.LabelFrame(main_frame, text="Recomendación")
-        self.results_frame.pack(side="right", fill="both", expand=True, padx=PADDING, pady=PADDING)
+        results_box = ttk.LabelFrame(main_frame, text="Recomendación")
+        results_box.pack(side="right", fill="both", expand=True, padx=PADDING, pady=PADDING)
+        self.results_frame = ttk.Frame(results_box)
+        self.results_frame.pack(fill="both", expand=True)
         
         # Mensaje inicial
         ttk.Label(self.results_frame, text="Completa el formulario y pulsa 'Calcular' para obtener\nuna recomendación de marcha.",
@@ -1187,130 +1592,91 @@ class NuSui:
     @handle_errors
     def calculate_recommended_gear(self):
         """Calcula y muestra la marcha recomendada según los parámetros, evitando cruces de cadena"""
-        # Limpiar panel de resultados
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
+        # Limpiar panel de resultados: destruir su frame de contenido elimina todos los widgets en una sola llamada a Tk
+        results_box = self.results_frame.master
+        self.results_frame.destroy()
+        self.results_frame = ttk.Frame(results_box)
+        self.results_frame.pack(fill="both", expand=True)
         
         # Obtener parámetros
-        target_speed = float(self.target_speed_var.get())
-        slope = float(self.slope_var.get())
-        cadence = int(self.cadencia_var.get())
+        target_speed = self.target_speed_var.get()
+        slope = self.slope_var.get()
+        cadence = self._cadence
         
         # Calcular todas las marchas y sus velocidades, evitando cruces de cadena
-        best_chainring = None
-        best_sprocket = None
-        min_diff = float('inf')
-        
-        for i, chainring in enumerate(self.crankset_teeth):
-            for j, sprocket in enumerate(self.cassette_teeth):
-                # Verificar si esta combinación cruza la cadena
-                crossing, _ = self.is_chain_crossing(i, j)
-                if crossing:
-                    continue  # Saltar esta combinación
-                
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                speed = self.calculate_speed(gear_ratio, cadence)
-                
-                # Ajustar velocidad según pendiente (simplificación)
-                adjusted_speed = speed * (1 - slope/100 * 0.1)
-                
-                # Encontrar la marcha más cercana a la velocidad deseada
-                diff = abs(adjusted_speed - target_speed)
-                if diff < min_diff:
-                    min_diff = diff
-                    best_chainring = chainring
-                    best_sprocket = sprocket
-        
-        # Si no encontramos ninguna marcha válida (todas cruzan la cadena), buscar la menor diferencia sin importar cruces
-        if best_chainring is None:
-            min_diff = float('inf')
-            for i, chainring in enumerate(self.crankset_teeth):
-                for j, sprocket in enumerate(self.cassette_teeth):
-                    gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                    speed = self.calculate_speed(gear_ratio, cadence)
-                    
-                    # Ajustar velocidad según pendiente
-                    adjusted_speed = speed * (1 - slope/100 * 0.1)
-                    
-                    diff = abs(adjusted_speed - target_speed)
-                    if diff < min_diff:
-                        min_diff = diff
-                        best_chainring = chainring
-                        best_sprocket = sprocket
-                        best_i = i
-                        best_j = j
-            
-            # Verificar si la mejor opción cruza la cadena
-            crossing, crossing_message = self.is_chain_crossing(best_i, best_j)
-        else:
-            crossing = False
-            crossing_message = None
+        ratios, speeds, developments = self._compute_matrices(cadence)
+        slope_factor = 1 - slope/100 * 0.1  # Velocidad perdida por la pendiente, la misma para todas las marchas
+        diff = speeds * slope_factor
+        diff -= target_speed
+        np.abs(diff, out=diff)
+        # Descartar los cruces de cadena, salvo si todas las marchas cruzan (entonces tomar la más cercana sin importar cruces)
+        if not self._crossing_mask.all():
+            diff[self._crossing_mask] = np.inf
+        best_i, best_j = np.unravel_index(np.argmin(diff), diff.shape)
+        best_chainring = self.crankset_teeth[best_i]
+        best_sprocket = self.cassette_teeth[best_j]
+        crossing = self._crossing_mask[best_i, best_j]
         
         # Mostrar recomendación
-        if best_chainring and best_sprocket:
-            gear_ratio = self.calculate_gear_ratio(best_chainring, best_sprocket)
-            actual_speed = self.calculate_speed(gear_ratio, cadence)
-            
-            # Título con recomendación
-            ttk.Label(self.results_frame, text=f"Marcha recomendada: {best_chainring}T / {best_sprocket}T", 
-                     font=("Arial", 14, "bold")).pack(pady=PADDING)
-            
-            # Explicación visual (simple)
-            plato_idx = self.crankset_teeth.index(best_chainring) + 1
-            piñon_idx = self.cassette_teeth.index(best_sprocket) + 1
-            
-            if len(self.crankset_teeth) == 3:  # Triple plato
-                plato_desc = "pequeño" if plato_idx == 3 else ("mediano" if plato_idx == 2 else "grande")
-            elif len(self.crankset_teeth) == 2:  # Doble plato
-                plato_desc = "pequeño" if plato_idx == 2 else "grande"
-            else:
-                plato_desc = f"#{plato_idx}"
-                
-            ttk.Label(self.results_frame, text=f"Usa el plato {plato_desc} (de {len(self.crankset_teeth)}) y el piñón #{piñon_idx} (de {len(self.cassette_teeth)})",
-                     wraplength=400).pack(pady=PADDING)
-            
-            # Detalles técnicos
-            details_frame = ttk.Frame(self.results_frame)
-            details_frame.pack(fill="x", pady=PADDING)
-            
-            ttk.Label(details_frame, text=f"Velocidad estimada:").grid(row=0, column=0, sticky="w", padx=PADDING)
-            ttk.Label(details_frame, text=f"{actual_speed:.1f} km/h").grid(row=0, column=1, sticky="e")
-            
-            ttk.Label(details_frame, text=f"Relación de marchas:").grid(row=1, column=0, sticky="w", padx=PADDING)
-            ttk.Label(details_frame, text=f"{gear_ratio:.2f}").grid(row=1, column=1, sticky="e")
+        gear_ratio = ratios[best_i, best_j]
+        actual_speed = speeds[best_i, best_j]
+        
+        # Título con recomendación
+        ttk.Label(self.results_frame, text=f"Marcha recomendada: {best_chainring}T / {best_sprocket}T", 
+                 font=("Arial", 14, "bold")).pack(pady=PADDING)
+        
+        # Explicación visual (simple)
+        plato_idx = best_i + 1
+        piñon_idx = best_j + 1
+        
+        if len(self.crankset_teeth) == 3:  # Triple plato
+            plato_desc = "pequeño" if plato_idx == 3 else ("mediano" if plato_idx == 2 else "grande")
+        elif len(self.crankset_teeth) == 2:  # Doble plato
+            plato_desc = "pequeño" if plato_idx == 2 else "grande"
+        else:
+            plato_desc = f"#{plato_idx}"
             
-            ttk.Label(details_frame, text=f"Desarrollo:").grid(row=2, column=0, sticky="w", padx=PADDING)
-            development = gear_ratio * self.wheel_sizes[self.wheel_size_var.get()]
-            ttk.Label(details_frame, text=f"{development:.2f} metros/pedalada").grid(row=2, column=1, sticky="e")
+        ttk.Label(self.results_frame, text=f"Usa el plato {plato_desc} (de {len(self.crankset_teeth)}) y el piñón #{piñon_idx} (de {len(self.cassette_teeth)})",
+                 wraplength=400).pack(pady=PADDING)
+        
+        # Detalles técnicos
+        details_frame = ttk.Frame(self.results_frame)
+        details_frame.pack(fill="x", pady=PADDING)
+        
+        development = developments[best_i, best_j]
+        ttk.Label(details_frame, text="Velocidad estimada:\nRelación de marchas:\nDesarrollo:",
+                  justify="left").grid(row=0, column=0, sticky="w", padx=PADDING)
+        ttk.Label(details_frame, text=f"{actual_speed:.1f} km/h\n{gear_ratio:.2f}\n{development:.2f} metros/pedalada",
+                  justify="right").grid(row=0, column=1, sticky="e")
+        
+        # Mostrar advertencia si cruza la cadena
+        if crossing:
+            warning_frame = ttk.Frame(self.results_frame)
+            warning_frame.pack(fill="x", pady=PADDING)
             
-            # Mostrar advertencia si cruza la cadena
-            if crossing:
-                warning_frame = ttk.Frame(self.results_frame)
-                warning_frame.pack(fill="x", pady=PADDING)
-                
-                warning_icon = ttk.Label(warning_frame, text="⚠️", font=("Arial", 12), foreground="red")
-                warning_icon.pack(side="left", padx=(0, PADDING))
-                
-                warning_text = "ADVERTENCIA: Esta combinación cruza la cadena. "
-                warning_text += "No se encontró ninguna combinación óptima que no cruce la cadena para la velocidad y pendiente indicadas. "
-                warning_text += "Se recomienda usar esta marcha solo brevemente y ajustar la velocidad objetivo."
-                
-                warning_label = ttk.Label(warning_frame, text=warning_text, 
-                                       wraplength=400, foreground="red", justify="left")
-                warning_label.pack(side="left")
+            warning_icon = ttk.Label(warning_frame, text="⚠️", font=("Arial", 12), foreground="red")
+            warning_icon.pack(side="left", padx=(0, PADDING))
             
-            # Consejos según pendiente
-            if slope > 8:
-                advice = "Para pendientes pronunciadas, mantén una cadencia alta y usa marchas más ligeras para no forzar las rodillas."
-            elif slope > 0:
-                advice = "Mantén una cadencia constante. Si sientes que haces demasiada fuerza, cambia a una marcha más ligera."
-            elif slope < -5:
-                advice = "En descensos, puedes usar marchas más duras o directamente dejar de pedalear si la velocidad es elevada."
-            else:
-                advice = "En llano, busca mantener una cadencia cómoda (80-90 RPM) y ajusta la marcha según el viento y tu estado físico."
+            warning_text = "ADVERTENCIA: Esta combinación cruza la cadena. "
+            warning_text += "No se encontró ninguna combinación óptima que no cruce la cadena para la velocidad y pendiente indicadas. "
+            warning_text += "Se recomienda usar esta marcha solo brevemente y ajustar la velocidad objetivo."
             
-            ttk.Label(self.results_frame, text="Consejo:", font=("Arial", 10, "bold")).pack(anchor="w", pady=(PADDING, 0))
-            ttk.Label(self.results_frame, text=advice, wraplength=400).pack(anchor="w", padx=PADDING)
+            warning_label = ttk.Label(warning_frame, text=warning_text, 
+                                   wraplength=400, foreground="red", justify="left")
+            warning_label.pack(side="left")
+        
+        # Consejos según pendiente
+        if slope > 8:
+            advice = "Para pendientes pronunciadas, mantén una cadencia alta y usa marchas más ligeras para no forzar las rodillas."
+        elif slope > 0:
+            advice = "Mantén una cadencia constante. Si sientes que haces demasiada fuerza, cambia a una marcha más ligera."
+        elif slope < -5:
+            advice = "En descensos, puedes usar marchas más duras o directamente dejar de pedalear si la velocidad es elevada."
+        else:
+            advice = "En llano, busca mantener una cadencia cómoda (80-90 RPM) y ajusta la marcha según el viento y tu estado físico."
+        
+        ttk.Label(self.results_frame, text="Consejo:", font=("Arial", 10, "bold")).pack(anchor="w", pady=(PADDING, 0))
+        ttk.Label(self.results_frame, text=advice, wraplength=400).pack(anchor="w", padx=PADDING)
 
     @handle_errors
     def setup_tech_tab(self, parent):
@@ -1324,7 +1690,7 @@ class NuSui:
                  wraplength=800).pack(pady=PADDING)
         
         # Si no hay configuración, mostrar mensaje
-        if not self.crankset_teeth or not self.cassette_teeth:
+        if not self.crankset_teeth.size or not self.cassette_teeth.size:
             ttk.Label(parent, text="Por favor, configura tu bicicleta primero en la pestaña 'Mi Bicicleta'",
                      font=("Arial", 12)).pack(pady=LARGE_PADDING)
             return
@@ -1345,12 +1711,36 @@ class NuSui:
         overlap_tab = ttk.Frame(tech_notebook)
         tech_notebook.add(overlap_tab, text="Solapamiento")
         
-        # Configurar cada pestaña técnica
-        self.setup_ratio_tab(ratio_tab)
-        self.setup_power_tab(power_tab)
-        self.setup_overlap_tab(overlap_tab)
+        self._tech_notebook = tech_notebook
+        self._tech_tabs = (ratio_tab, power_tab, overlap_tab)
+        tech_notebook.bind("<<NotebookTabChanged>>", self._on_tech_tab_changed)
+        self._fill_tech_tabs()
+        # Las pestañas ya corresponden a esta configuración, update_tech_tab solo las rellena cuando cambia
+        self._tech_key = self._tech_config_key()
+
+    def _fill_tech_tabs(self) -> None:
+        """Marca las pestañas de análisis técnico como desactualizadas; cada una se rellena al mostrarse"""
+        self._tech_tabs_built = [False] * len(self._tech_tabs)
+        self._on_tech_tab_changed()
+
+    def _on_tech_tab_changed(self, event=None) -> None:
+        """Rellena la pestaña de análisis técnico seleccionada si pertenece a una configuración anterior, conservando el canvas de su gráfico"""
+        selected = self._tech_notebook.index("current")
+        if self._tech_tabs_built[selected]:
+            return
+        self._tech_tabs_built[selected] = True
+        
+        tab = self._tech_tabs[selected]
+        chart_widgets = {str(canvas.get_tk_widget()) for canvas in self._chart_canvases.values()}
+        for widget in tab.winfo_children():
+            if str(widget) not in chart_widgets:
+                widget.destroy()
+        
+        # Configurar la pestaña con su propia función
+        (self.setup_ratio_tab, self.setup_power_tab, self.setup_overlap_tab)[selected](tab)
 
     @handle_errors
+    @holding_draw_lock
     def setup_ratio_tab(self, parent):
         """Configura la pestaña técnica de relación de marchas"""
         # Crear título
@@ -1358,28 +1748,13 @@ class NuSui:
                  font=("Arial", 12, "bold")).pack(pady=PADDING)
         
         # Crear gráfico
-        fig, ax = plt.subplots(figsize=CHART_SIZE)
+        fig, ax = self._get_chart_figure("ratio")
         
         # Preparar datos
-        combinations = []
-        ratios = []
-        colors = []
-        
-        color_map = {
-            0: 'red',      # Primer plato (más grande)
-            1: 'blue',     # Segundo plato
-            2: 'green'     # Tercer plato (si existe)
-        }
-        
-        for i, chainring in enumerate(self.crankset_teeth):
-            for sprocket in self.cassette_teeth:
-                combinations.append(f"{chainring}/{sprocket}")
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                ratios.append(gear_ratio)
-                colors.append(color_map.get(i, 'gray'))
+        ratios = self._ratio.ravel()  # Fila a fila, en el mismo orden que las combinaciones
         
         # Crear gráfico de barras
-        bars = ax.bar(combinations, ratios, color=colors)
+        bars = ax.bar(self._combo_labels, ratios, color=self._combo_colors)
         
         # Líneas de referencia de rango óptimo
         ax.axhline(y=2.5, color='gray', linestyle='--', alpha=0.5)
@@ -1392,36 +1767,20 @@ class NuSui:
         ax.tick_params(axis='x', rotation=90)
         
         # Leyenda para colores
-        legend_elements = []
-        for i, chainring in enumerate(self.crankset_teeth):
-            legend_elements.append(plt.Line2D([0], [0], color=color_map.get(i, 'gray'), lw=4, label=f'Plato {chainring}T'))
-        legend_elements.append(plt.Line2D([0], [0], color='gray', linestyle='--', label='Rango óptimo (2.5-5.0)'))
-        ax.legend(handles=legend_elements)
+        ax.legend(handles=[*self._chainring_legend(4), _OPTIMAL_RANGE_HANDLE])
         
         # Ajustar layout
         fig.tight_layout()
         
         # Crear canvas para mostrar el gráfico
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
+        canvas = self._get_chart_canvas("ratio", parent)
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill="both", expand=True)
         
         # Explicación técnica
-        explanation = """
-        La relación de marchas (gear ratio) es el número de dientes del plato dividido entre los dientes del piñón. 
-        Un valor mayor indica una marcha más "dura" (para velocidad), mientras que un valor menor indica una marcha más "ligera" (para subidas).
-        
-        En general:
-        • Valores > 5.0: Marchas muy duras para descensos o velocidad
-        • Valores 2.5-5.0: Rango óptimo para uso normal
-        • Valores < 2.5: Marchas ligeras para subidas
-        
-        El rango total de relaciones de tu bicicleta afecta directamente su versatilidad.
-        """
-        
         explanation_text = scrolledtext.ScrolledText(parent, wrap=tk.WORD, height=6)
         explanation_text.pack(fill="x", expand=False, padx=PADDING, pady=PADDING)
-        explanation_text.insert(tk.END, explanation)
+        explanation_text.insert(tk.END, _RATIO_EXPLANATION)
         explanation_text.config(state="disabled")
 
     @handle_errors
@@ -1437,89 +1796,55 @@ class NuSui:
         
         # Selector de plato/piñón
         ttk.Label(control_frame, text="Plato:").grid(row=0, column=0, padx=PADDING)
-        self.power_plato_var = tk.StringVar(value=str(self.crankset_teeth[0]))
+        self.power_plato_var = tk.IntVar(value=int(self.crankset_teeth[0]))
         plato_combo = ttk.Combobox(control_frame, textvariable=self.power_plato_var, 
-                                   values=[str(t) for t in self.crankset_teeth], width=5)
+                                   values=self.crankset_teeth.tolist(), width=5, state="readonly")
         plato_combo.grid(row=0, column=1, padx=PADDING)
         
         ttk.Label(control_frame, text="Piñón:").grid(row=0, column=2, padx=PADDING)
-        self.power_piñon_var = tk.StringVar(value=str(self.cassette_teeth[len(self.cassette_teeth)//2]))
+        self.power_piñon_var = tk.IntVar(value=int(self.cassette_teeth[len(self.cassette_teeth)//2]))
         piñon_combo = ttk.Combobox(control_frame, textvariable=self.power_piñon_var, 
-                                   values=[str(t) for t in self.cassette_teeth], width=5)
+                                   values=self.cassette_teeth.tolist(), width=5, state="readonly")
         piñon_combo.grid(row=0, column=3, padx=PADDING)
         
         ttk.Button(control_frame, text="Actualizar gráfico", 
-                  command=lambda: self.update_power_chart(chart_frame)).grid(row=0, column=4, padx=LARGE_PADDING)
-        
-        # Frame para gráfico
-        chart_frame = ttk.Frame(parent)
-        chart_frame.pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+                  command=self.update_power_chart).grid(row=0, column=4, padx=LARGE_PADDING)
         
-        # Crear gráfico inicial
-        self.update_power_chart(chart_frame)
+        # Crear el gráfico la primera vez, las configuraciones siguientes solo lo actualizan
+        canvas = self._chart_canvases.get("power")
+        if canvas is None or not canvas.get_tk_widget().winfo_exists():
+            self.create_power_chart(parent)
+        else:
+            # Volver a empaquetarlo después de los controles reconstruidos
+            canvas.get_tk_widget().pack_forget()
+            canvas.get_tk_widget().pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+        self.update_power_chart()
         
         # Explicación técnica
-        explanation = """
-        Este gráfico muestra la relación entre cadencia, velocidad y potencia estimada para una combinación de plato/piñón.
-        
-        La potencia es una estimación basada en un modelo simplificado, considerando la resistencia aerodinámica que aumenta exponencialmente con la velocidad.
-        
-        Observaciones clave:
-        • Para una misma marcha, aumentar la cadencia aumenta linealmente la velocidad
-        • La potencia necesaria aumenta exponencialmente con la velocidad
-        • La cadencia óptima suele estar entre 80-90 RPM para la mayoría de ciclistas
-        • A cadencias muy bajas (<60 RPM) se fuerza más las articulaciones, mientras que cadencias muy altas (>100 RPM) son menos eficientes energéticamente
-        """
-        
         explanation_text = scrolledtext.ScrolledText(parent, wrap=tk.WORD, height=8)
         explanation_text.pack(fill="x", expand=False, padx=PADDING, pady=PADDING)
-        explanation_text.insert(tk.END, explanation)
+        explanation_text.insert(tk.END, _POWER_EXPLANATION)
         explanation_text.config(state="disabled")
 
     @handle_errors
-    def update_power_chart(self, parent):
-        """Actualiza el gráfico de potencia vs cadencia"""
-        # Limpiar frame
-        for widget in parent.winfo_children():
-            widget.destroy()
-        
-        # Obtener valores seleccionados
-        try:
-            chainring = int(self.power_plato_var.get())
-            sprocket = int(self.power_piñon_var.get())
-        except ValueError:
-            messagebox.showwarning("Valor inválido", "Por favor, selecciona valores numéricos válidos")
-            return
-        
-        # Crear figura con dos ejes Y
-        fig, ax1 = plt.subplots(figsize=CHART_SIZE)
+    def create_power_chart(self, parent):
+        """Crea el gráfico de potencia vs cadencia, update_power_chart muestra en él la marcha seleccionada"""
+        # Crear figura con dos ejes Y; el hilo de dibujo ajusta su layout en cada renderizado
+        fig = Figure(figsize=CHART_SIZE, layout="tight")
+        ax1 = fig.add_subplot()
         ax2 = ax1.twinx()
         
         # Rango de cadencias a evaluar
         cadences = np.arange(60, 110, 2)
         
-        # Calcular velocidades y potencias para cada cadencia
-        gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-        speeds = []
-        powers = []
-        
-        for cadence in cadences:
-            speed = self.calculate_speed(gear_ratio, cadence)
-            speeds.append(speed)
-            powers.append(self.calculate_power_estimate(speed))
-        
         # Zona óptima de cadencia
-        optimal_min_idx = np.abs(cadences - OPTIMAL_CADENCE_MIN).argmin()
-        optimal_max_idx = np.abs(cadences - OPTIMAL_CADENCE_MAX).argmin()
+        optimal_min_idx, optimal_max_idx = np.searchsorted(cadences, (OPTIMAL_CADENCE_MIN, OPTIMAL_CADENCE_MAX)).tolist()
         
-        # Graficar velocidad vs cadencia
-        line1, = ax1.plot(cadences, speeds, 'b-', label='Velocidad')
-        ax1.fill_between(cadences[optimal_min_idx:optimal_max_idx+1], 
-                        0, max(speeds)*1.1, 
-                        color='gray', alpha=0.1, label='Rango óptimo de cadencia')
-        
-        # Graficar potencia vs cadencia
-        line2, = ax2.plot(cadences, powers, 'r-', label='Potencia estimada')
+        # Graficar velocidad y potencia vs cadencia (update_power_chart asigna los datos de la marcha seleccionada)
+        line1, = ax1.plot(cadences, np.zeros(len(cadences)), 'b-', label='Velocidad')
+        ax1.axvspan(cadences[optimal_min_idx], cadences[optimal_max_idx],
+                    color='gray', alpha=0.1, label='Rango óptimo de cadencia')
+        line2, = ax2.plot(cadences, np.zeros(len(cadences)), 'r-', label='Potencia estimada')
         
         # Configurar ejes
         ax1.set_xlabel('Cadencia (RPM)')
@@ -1529,23 +1854,47 @@ class NuSui:
         ax2.set_ylabel('Potencia estimada (unidades relativas)', color='r')
         ax2.tick_params(axis='y', labelcolor='r')
         
-        # Título
-        plt.title(f'Velocidad y potencia para combinación {chainring}T / {sprocket}T')
-        
         # Leyenda combinada
         lines = [line1, line2]
         labels = [line.get_label() for line in lines]
         ax1.legend(lines, labels, loc='upper left')
         
-        # Ajustar layout
-        fig.tight_layout()
-        
         # Mostrar gráfico
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        canvas = BackgroundFigureCanvas(fig, parent, self._request_draw, self._draw_lock)
+        canvas.get_tk_widget().pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+        self._chart_canvases["power"] = canvas
+        self._power_canvas = canvas
+        self._power_axes = (ax1, ax2)
+        self._power_lines = (line1, line2)
+
+    @handle_errors
+    def update_power_chart(self):
+        """Actualiza el gráfico de potencia vs cadencia con el plato y el piñón seleccionados"""
+        # Obtener valores seleccionados (los combobox de solo lectura solo contienen dientes de la configuración)
+        chainring = self.power_plato_var.get()
+        sprocket = self.power_piñon_var.get()
+        
+        ax1, ax2 = self._power_axes
+        line1, line2 = self._power_lines
+        cadences = line1.get_xdata()
+        
+        # Calcular velocidades y potencias para cada cadencia (las fórmulas operan elemento a elemento sobre el array)
+        gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
+        speeds = self.calculate_speed(gear_ratio, cadences)
+        powers = self.calculate_power_estimate(speeds)
+        
+        # Actualizar las líneas, los ejes y el título del gráfico existente; el hilo de dibujo puede estar renderizándolo
+        with self._draw_lock:
+            line1.set_ydata(speeds)
+            line2.set_ydata(powers)
+            ax1.set_ylim(0, speeds.max()*1.1)
+            ax2.relim()
+            ax2.autoscale_view()
+            ax2.set_title(f'Velocidad y potencia para combinación {chainring}T / {sprocket}T')
+        self._power_canvas.draw_idle()
 
     @handle_errors
+    @holding_draw_lock
     def setup_overlap_tab(self, parent):
         """Configura la pestaña técnica de solapamiento de marchas"""
         # Crear título
@@ -1553,52 +1902,22 @@ class NuSui:
                  font=("Arial", 12, "bold")).pack(pady=PADDING)
         
         # Crear gráfico
-        fig, ax = plt.subplots(figsize=CHART_SIZE)
+        fig, ax = self._get_chart_figure("overlap")
         
-        # Preparar datos
-        all_ratios = []
-        colors = []
-        labels = []
-        
-        color_map = {
-            0: 'red',
-            1: 'blue',
-            2: 'green'
-        }
-        
-        # Marcadores para cruces de cadena
-        crosses = []
-        
-        # Calcular relaciones para cada plato
+        # Graficar las relaciones de cada plato, leídas de las matrices en caché para la configuración
+        sprocket_positions = np.arange(len(self.cassette_teeth))
         for i, chainring in enumerate(self.crankset_teeth):
-            ratios = []
-            cross_positions = []
-            for j, sprocket in enumerate(self.cassette_teeth):
-                gear_ratio = self.calculate_gear_ratio(chainring, sprocket)
-                ratios.append(gear_ratio)
-                
-                # Verificar cruce de cadena
-                crossing, _ = self.is_chain_crossing(i, j)
-                cross_positions.append(crossing)
-            
-            # Añadir al gráfico
-            line, = ax.plot(range(len(self.cassette_teeth)), ratios, '-', 
-                    color=color_map.get(i, 'gray'), label=f"Plato {chainring}T")
+            color = _chainring_color(i)
+            ratios, crosses = self._ratio[i], self._crossing_mask[i]
             
-            # Marcar puntos sin cruce de cadena
-            safe_x = [j for j in range(len(self.cassette_teeth)) if not cross_positions[j]]
-            safe_y = [ratios[j] for j in range(len(ratios)) if not cross_positions[j]]
-            ax.plot(safe_x, safe_y, 'o', color=color_map.get(i, 'gray'))
+            # Añadir al gráfico, con marcadores solo en los puntos sin cruce de cadena
+            ax.plot(sprocket_positions, ratios, '-o', color=color, markevery=np.flatnonzero(~crosses),
+                    label=f"Plato {chainring}T")
             
             # Marcar puntos con cruce de cadena
-            cross_x = [j for j in range(len(self.cassette_teeth)) if cross_positions[j]]
-            cross_y = [ratios[j] for j in range(len(ratios)) if cross_positions[j]]
-            if cross_x:
-                ax.plot(cross_x, cross_y, 'x', color=color_map.get(i, 'gray'), markersize=8, alpha=0.7)
-            
-            # Guardar para análisis de solapamiento
-            all_ratios.append(ratios)
-            crosses.append(cross_positions)
+            if crosses.any():
+                crossing = np.flatnonzero(crosses)
+                ax.plot(crossing, ratios[crossing], 'x', color=color, markersize=8, alpha=0.7)
         
         # Configurar gráfico
         ax.set_xlabel('Posición del piñón')
@@ -1607,26 +1926,18 @@ class NuSui:
         ax.grid(True, linestyle='--', alpha=0.7)
         
         # Etiquetas del eje X
-        ax.set_xticks(range(len(self.cassette_teeth)))
-        ax.set_xticklabels([str(t) for t in self.cassette_teeth])
+        ax.set_xticks(sprocket_positions)
+        ax.set_xticklabels(self.cassette_teeth.tolist())
         
-        # Leyenda
-        legend_elements = []
-        for i, chainring in enumerate(self.crankset_teeth):
-            legend_elements.append(plt.Line2D([0], [0], color=color_map.get(i, 'gray'), lw=2, label=f'Plato {chainring}T'))
-        
-        # Añadir leyenda para cruces de cadena
-        legend_elements.append(plt.Line2D([0], [0], marker='o', color='gray', linestyle='None', label='Combinación segura'))
-        legend_elements.append(plt.Line2D([0], [0], marker='x', color='gray', linestyle='None', label='Cruce de cadena'))
-        
-        ax.legend(handles=legend_elements)
+        # Leyenda, con las entradas para cruces de cadena
+        ax.legend(handles=[*self._chainring_legend(2), *_CROSSING_HANDLES])
         
         # Ajustar layout
         fig.tight_layout()
         
         # Crear canvas para mostrar el gráfico
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
+        canvas = self._get_chart_canvas("overlap", parent)
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill="both", expand=True)
         
         # Panel para análisis de solapamiento
@@ -1634,26 +1945,25 @@ class NuSui:
         overlap_frame.pack(fill="x", padx=PADDING, pady=PADDING)
         
         # Calcular y mostrar solapamiento
-        overlap_text = self.calculate_overlap_analysis(all_ratios, crosses)
+        overlap_text = self.calculate_overlap_analysis(self._ratio, self._crossing_mask)
         
         overlap_info = scrolledtext.ScrolledText(overlap_frame, wrap=tk.WORD, height=8)
         overlap_info.pack(fill="x", expand=False, padx=PADDING, pady=PADDING)
         overlap_info.insert(tk.END, overlap_text)
         overlap_info.config(state="disabled")
 
-    @handle_errors
     def calculate_overlap_analysis(self, all_ratios, crosses=None):
         """
         Calcula y prepara un análisis de solapamiento de marchas
         
         Args:
-            all_ratios: Lista de listas con las relaciones de cada plato
-            crosses: Lista de listas con los cruces de cadena (opcional)
+            all_ratios: Matriz con las relaciones de cada plato (filas = platos)
+            crosses: Matriz booleana con los cruces de cadena (opcional)
         """
         if len(all_ratios) <= 1:
             return "Se necesitan al menos dos platos para analizar el solapamiento."
         
-        result = "Análisis de solapamiento entre platos:\n\n"
+        parts = ["Análisis de solapamiento entre platos:\n\n"]
         
         # Analizar solapamiento entre platos adyacentes
         for i in range(len(all_ratios) - 1):
@@ -1664,34 +1974,34 @@ class NuSui:
             ratios2 = all_ratios[i + 1]
             
             # Si tenemos información de cruces, filtrar las relaciones
-            if crosses:
+            if crosses is not None:
                 # Filtrar relaciones del plato 1 que no cruzan la cadena
-                filtered_ratios1 = [ratios1[j] for j in range(len(ratios1)) if not crosses[i][j]]
+                filtered_ratios1 = ratios1[~crosses[i]]
                 # Filtrar relaciones del plato 2 que no cruzan la cadena
-                filtered_ratios2 = [ratios2[j] for j in range(len(ratios2)) if not crosses[i+1][j]]
+                filtered_ratios2 = ratios2[~crosses[i + 1]]
                 
                 # Si no hay marchas válidas después de filtrar, usar las originales
-                if filtered_ratios1 and filtered_ratios2:
-                    min_ratio1 = min(filtered_ratios1)
-                    max_ratio1 = max(filtered_ratios1)
-                    min_ratio2 = min(filtered_ratios2)
-                    max_ratio2 = max(filtered_ratios2)
+                if filtered_ratios1.size and filtered_ratios2.size:
+                    min_ratio1 = filtered_ratios1.min()
+                    max_ratio1 = filtered_ratios1.max()
+                    min_ratio2 = filtered_ratios2.min()
+                    max_ratio2 = filtered_ratios2.max()
                     
-                    result += f"Entre plato {plato1}T y {plato2}T (sin cruces de cadena):\n"
+                    parts.append(f"Entre plato {plato1}T y {plato2}T (sin cruces de cadena):\n")
                 else:
-                    min_ratio1 = min(ratios1)
-                    max_ratio1 = max(ratios1)
-                    min_ratio2 = min(ratios2)
-                    max_ratio2 = max(ratios2)
+                    min_ratio1 = ratios1.min()
+                    max_ratio1 = ratios1.max()
+                    min_ratio2 = ratios2.min()
+                    max_ratio2 = ratios2.max()
                     
-                    result += f"Entre plato {plato1}T y {plato2}T (incluyendo cruces de cadena):\n"
+                    parts.append(f"Entre plato {plato1}T y {plato2}T (incluyendo cruces de cadena):\n")
             else:
-                min_ratio1 = min(ratios1)
-                max_ratio1 = max(ratios1)
-                min_ratio2 = min(ratios2)
-                max_ratio2 = max(ratios2)
+                min_ratio1 = ratios1.min()
+                max_ratio1 = ratios1.max()
+                min_ratio2 = ratios2.min()
+                max_ratio2 = ratios2.max()
                 
-                result += f"Entre plato {plato1}T y {plato2}T:\n"
+                parts.append(f"Entre plato {plato1}T y {plato2}T:\n")
             
             # Calcular solapamiento
             overlap_start = max(min_ratio1, min_ratio2)
@@ -1699,66 +2009,87 @@ class NuSui:
             
             if overlap_start <= overlap_end:
                 overlap_pct = (overlap_end - overlap_start) / (max_ratio1 - min_ratio1) * 100
-                result += f"- Rango de solapamiento: {overlap_start:.2f} a {overlap_end:.2f}\n"
-                result += f"- Porcentaje de solapamiento: {overlap_pct:.1f}%\n"
+                parts.append(f"- Rango de solapamiento: {overlap_start:.2f} a {overlap_end:.2f}\n"
+                             f"- Porcentaje de solapamiento: {overlap_pct:.1f}%\n")
                 
                 if overlap_pct < 10:
-                    result += "- Evaluación: Solapamiento bajo. Puede haber 'saltos' grandes al cambiar de plato.\n"
+                    parts.append("- Evaluación: Solapamiento bajo. Puede haber 'saltos' grandes al cambiar de plato.\n")
                 elif overlap_pct < 30:
-                    result += "- Evaluación: Solapamiento moderado. Configuración equilibrada.\n"
+                    parts.append("- Evaluación: Solapamiento moderado. Configuración equilibrada.\n")
                 else:
-                    result += "- Evaluación: Solapamiento alto. Hay muchas marchas redundantes.\n"
+                    parts.append("- Evaluación: Solapamiento alto. Hay muchas marchas redundantes.\n")
             else:
-                result += f"- No hay solapamiento entre marchas utilizables.\n"
+                parts.append(f"- No hay solapamiento entre marchas utilizables.\n")
                 
-            result += "\n"
+            parts.append("\n")
         
         # Análisis general del rango
-        if crosses:
+        if crosses is not None:
             # Obtener relaciones sin cruces de cadena
-            all_filtered_ratios = []
-            for i, ratios in enumerate(all_ratios):
-                filtered = [ratios[j] for j in range(len(ratios)) if not crosses[i][j]]
-                if filtered:
-                    all_filtered_ratios.extend(filtered)
+            all_filtered_ratios = all_ratios[~crosses]
             
-            if all_filtered_ratios:
-                min_ratio = min(all_filtered_ratios)
-                max_ratio = max(all_filtered_ratios)
+            if all_filtered_ratios.size:
+                min_ratio = all_filtered_ratios.min()
+                max_ratio = all_filtered_ratios.max()
                 range_ratio = max_ratio / min_ratio
                 
-                result += f"Rango total de marchas (sin cruces de cadena): {range_ratio:.2f}x\n"
+                parts.append(f"Rango total de marchas (sin cruces de cadena): {range_ratio:.2f}x\n")
             else:
-                result += "No se puede calcular el rango sin cruces de cadena.\n"
+                parts.append("No se puede calcular el rango sin cruces de cadena.\n")
         
         # También calculamos el rango total incluyendo cruces
-        all_ratios_flat = [ratio for sublist in all_ratios for ratio in sublist]
-        min_ratio = min(all_ratios_flat)
-        max_ratio = max(all_ratios_flat)
+        min_ratio = all_ratios.min()
+        max_ratio = all_ratios.max()
         range_ratio = max_ratio / min_ratio
         
-        result += f"Rango total de marchas (incluyendo cruces de cadena): {range_ratio:.2f}x\n"
+        parts.append(f"Rango total de marchas (incluyendo cruces de cadena): {range_ratio:.2f}x\n")
         
         if range_ratio < 3:
-            result += "Evaluación: Rango limitado. Adecuado para terreno uniforme o uso específico."
+            parts.append("Evaluación: Rango limitado. Adecuado para terreno uniforme o uso específico.")
         elif range_ratio < 5:
-            result += "Evaluación: Rango moderado. Bueno para uso general."
+            parts.append("Evaluación: Rango moderado. Bueno para uso general.")
         else:
-            result += "Evaluación: Rango amplio. Excelente versatilidad para diferentes terrenos."
+            parts.append("Evaluación: Rango amplio. Excelente versatilidad para diferentes terrenos.")
         
-        return result
+        return "".join(parts)
+
+    def _tech_config_key(self) -> tuple:
+        """Clave de la configuración de la que dependen los gráficos técnicos: los dientes y, por el gráfico de potencia, la rueda"""
+        return (self.crankset_teeth.tobytes(), self.cassette_teeth.tobytes(), self._wheel_idx)
 
     @handle_errors
     def update_tech_tab(self):
         """Actualiza la pestaña técnica si hay cambios en la configuración"""
-        if self.validate_gear_configuration():
+        if not self.validate_gear_configuration():
+            return
+        tech_key = self._tech_config_key()
+        if self._tech_tabs is None or not self._tech_tabs[0].winfo_exists():
+            # La estructura de la pestaña se crea una vez, las actualizaciones rellenan sus pestañas conservando los gráficos
             for widget in self.tech_tab.winfo_children():
                 widget.destroy()
             self.setup_scrollable_frame(self.tech_tab, self.setup_tech_tab)
+        elif tech_key != self._tech_key:
+            # Rellenar las pestañas solo si la configuración cambió desde la última actualización
+            self._fill_tech_tabs()
+        self._tech_key = tech_key
+
+    def _raise_info_window(self, name: str) -> bool:
+        """Vuelve a mostrar una ventana informativa ya construida; devuelve False si aún hay que construirla"""
+        window = self._info_windows.get(name)
+        if window is None or not window.winfo_exists():
+            return False
+        window.deiconify()
+        window.lift()
+        return True
 
     def show_basic_concepts(self):
         """Muestra una ventana con conceptos básicos de ciclismo"""
+        if self._raise_info_window("concepts"):
+            return
         concepts_window = tk.Toplevel(self.root)
+        # Cerrar solo oculta la ventana, la siguiente llamada la vuelve a mostrar
+        concepts_window.protocol("WM_DELETE_WINDOW", concepts_window.withdraw)
+        self._info_windows["concepts"] = concepts_window
         concepts_window.title("Conceptos básicos de ciclismo")
         concepts_window.geometry("600x500")
         
@@ -1770,67 +2101,20 @@ class NuSui:
         content = scrolledtext.ScrolledText(concepts_window, wrap=tk.WORD)
         content.pack(fill="both", expand=True, padx=LARGE_PADDING, pady=PADDING)
         
-        concepts_text = """
-        TRANSMISIÓN Y MARCHAS
-        
-        Platos (o coronas): Son los discos dentados unidos a los pedales. Determinan cuánta fuerza se transmite a la cadena.
-        - Platos grandes (más dientes): Mayor velocidad, requieren más fuerza
-        - Platos pequeños (menos dientes): Menor velocidad, pedaleo más fácil
-        
-        Piñones (o casete): Conjunto de discos dentados en la rueda trasera.
-        - Piñones pequeños (menos dientes): Mayor velocidad, requieren más fuerza
-        - Piñones grandes (más dientes): Menor velocidad, pedaleo más fácil
-        
-        Relación de marchas: Número de dientes del plato dividido por el número de dientes del piñón. Indica cuántas vueltas da la rueda por cada vuelta completa de los pedales.
-        
-        Desarrollo: Distancia recorrida por cada pedalada completa. Se calcula multiplicando la relación de marchas por la circunferencia de la rueda.
-        
-        CONCEPTOS DE PEDALEO
-        
-        Cadencia: Velocidad a la que se pedalea, medida en revoluciones por minuto (RPM).
-        - Cadencia baja (<70 RPM): Mayor esfuerzo en cada pedalada, mayor tensión en articulaciones
-        - Cadencia media (70-90 RPM): Equilibrio óptimo para la mayoría de ciclistas
-        - Cadencia alta (>90 RPM): Menor esfuerzo por pedalada, mayor frecuencia cardíaca
-        
-        CRUCE DE CADENA
-        
-        El cruce de cadena ocurre cuando se utilizan combinaciones extremas:
-        - Plato grande (delantero) con piñón grande (trasero)
-        - Plato pequeño (delantero) con piñón pequeño (trasero)
-        
-        Estas combinaciones provocan que la cadena trabaje en un ángulo diagonal pronunciado, causando:
-        - Mayor desgaste de la cadena, platos, piñones y desviador
-        - Pérdida de eficiencia (desperdicias energía al pedalear)
-        - Mayor ruido durante el pedaleo
-        - Riesgo de que la cadena se salga o se dañe
-        
-        Por eso, en esta aplicación, estas combinaciones están marcadas o filtradas.
-        La regla de oro es: usa combinaciones donde la cadena trabaje lo más recta posible.
-        
-        USO CORRECTO DE LAS MARCHAS
-        
-        Principios básicos:
-        1. Mantén una cadencia constante y cómoda ajustando las marchas
-        2. Anticipa cambios de terreno y cambia antes de necesitarlo
-        3. Evita combinaciones extremas (cruce de cadena)
-        4. Cambia secuencialmente, no saltes muchas marchas de golpe
-        
-        Situaciones específicas:
-        - Subidas: Usa platos pequeños y piñones grandes para pedalear con menos esfuerzo
-        - Bajadas: Usa platos grandes y piñones pequeños o deja de pedalear si la velocidad es alta
-        - Llano: Busca una combinación que te permita mantener tu cadencia ideal
-        """
-        
-        content.insert(tk.END, concepts_text)
+        content.insert(tk.END, _CONCEPTS_TEXT)
         content.config(state="disabled")
         
         # Botón para cerrar
         ttk.Button(concepts_window, text="Cerrar", 
-                  command=concepts_window.destroy).pack(pady=PADDING)
+                  command=concepts_window.withdraw).pack(pady=PADDING)
 
     def show_app_help(self):
         """Muestra una ventana con ayuda sobre el uso de la aplicación"""
+        if self._raise_info_window("help"):
+            return
         help_window = tk.Toplevel(self.root)
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        self._info_windows["help"] = help_window
         help_window.title("Cómo usar la aplicación")
         help_window.geometry("600x500")
         
@@ -1842,52 +2126,20 @@ class NuSui:
         content = scrolledtext.ScrolledText(help_window, wrap=tk.WORD)
         content.pack(fill="both", expand=True, padx=LARGE_PADDING, pady=PADDING)
         
-        help_text = """
-        GUÍA DE USO RÁPIDA
-        
-        1. CONFIGURACIÓN DE TU BICICLETA (Pestaña "Mi Bicicleta")
-           - Selecciona el tipo de bicicleta más parecido a la tuya
-           - Ajusta el tamaño de rueda según corresponda
-           - Establece tu cadencia habitual (si no estás seguro, deja el valor predeterminado)
-           - Si conoces exactamente la configuración de tu bicicleta, usa "Configurar manualmente"
-           - Pulsa "Visualizar mi bicicleta" para continuar
-        
-        2. VISUALIZACIÓN (Pestaña "Visualización")
-           - Explora la "Tabla de marchas" para ver qué velocidad alcanzarás con cada combinación
-           - Revisa el "Gráfico de velocidades" para entender cómo afecta cada piñón a tu velocidad
-           - Observa el "Desarrollo" para comprender la distancia recorrida por pedalada
-        
-        3. RECOMENDACIONES (Pestaña "¿Qué marcha usar?")
-           - Establece tu velocidad deseada y la pendiente del terreno
-           - Obtén una recomendación personalizada de qué marcha usar
-           - Lee los consejos específicos para tu situación
-        
-        4. ANÁLISIS TÉCNICO (Solo en modo técnico)
-           - Explora análisis avanzados como relación de marchas, potencia y solapamiento
-           - Útil para ciclistas experimentados que deseen optimizar su técnica
-        
-        CAMBIO DE MODO
-        
-        - Modo Principiante: Interfaz simplificada con conceptos básicos
-        - Modo Deportivo/Técnico: Acceso a análisis avanzados y términos técnicos
-        
-        CONSEJOS GENERALES
-        
-        - Experimenta con diferentes configuraciones para entender mejor cómo funcionan las marchas
-        - Usa la pestaña de recomendaciones antes de salir a rodar para planificar qué marchas usar
-        - Consulta la ayuda o los conceptos básicos si algún término no te resulta familiar
-        """
-        
-        content.insert(tk.END, help_text)
+        content.insert(tk.END, _HELP_TEXT)
         content.config(state="disabled")
         
         # Botón para cerrar
         ttk.Button(help_window, text="Cerrar", 
-                  command=help_window.destroy).pack(pady=PADDING)
+                  command=help_window.withdraw).pack(pady=PADDING)
 
     def show_about(self):
         """Muestra información sobre la aplicación"""
+        if self._raise_info_window("about"):
+            return
         about_window = tk.Toplevel(self.root)
+        about_window.protocol("WM_DELETE_WINDOW", about_window.withdraw)
+        self._info_windows["about"] = about_window
         about_window.title("Acerca de")
         about_window.geometry("400x300")
         
@@ -1911,7 +2163,7 @@ class NuSui:
         
         # Botón para cerrar
         ttk.Button(about_window, text="Cerrar", 
-                  command=about_window.destroy).pack(pady=PADDING)
+                  command=about_window.withdraw).pack(pady=PADDING)
 
 # Función para iniciar la aplicación
 def iniciar_app():